@@ -1,8 +1,7 @@
-import asyncio
 import http
 import json
 from collections.abc import Collection
-from typing import Literal, overload
+from typing import Final, Literal, overload
 
 import aiohttp
 import yarl
@@ -11,7 +10,13 @@ from aiohttp.client import ClientTimeout
 from config import MOBYGAMES_API_KEY
 from fastapi import HTTPException, status
 from logger.logger import log
+from utils.cache import cached_api_response
 from utils.context import ctx_aiohttp_session
+from utils.rate_limiter import ProviderRateLimiter, parse_retry_after
+
+RATE_LIMITER: Final = ProviderRateLimiter(
+    "mobygames", requests_per_second=1, max_concurrency=1
+)
 
 
 async def auth_middleware(
@@ -34,6 +39,7 @@ class MobyGamesService:
     ) -> None:
         self.url = yarl.URL(base_url or "https://api.mobygames.com/v1")
 
+    @cached_api_response("mobygames", ttl=30 * 24 * 60 * 60)
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
         aiohttp_session = ctx_aiohttp_session.get()
         log.debug(
@@ -43,11 +49,12 @@ class MobyGamesService:
         )
 
         try:
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             return await res.json()
         except aiohttp.ServerTimeoutError:
@@ -65,8 +72,8 @@ class MobyGamesService:
                 log.error(exc)
                 return {}
             elif exc.status == http.HTTPStatus.TOO_MANY_REQUESTS:
-                # Retry after 2 seconds if rate limit hit
-                await asyncio.sleep(2)
+                # Wait for the provider to accept requests again before retrying
+                await RATE_LIMITER.throttle(parse_retry_after(exc.headers))
             else:
                 # Log the error and return an empty dict if the request fails with a different code
                 log.error(exc)
@@ -82,11 +89,12 @@ class MobyGamesService:
                 url,
                 request_timeout,
             )
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             return await res.json()
         except (aiohttp.ClientResponseError, aiohttp.ServerTimeoutError) as exc:
@@ -1,5 +1,9 @@
 import asyncio
+import hashlib
+import os
 import re
+from collections.abc import Buffer
+from typing import Final
 
 from handler.metadata.base_hander import UniversalPlatformSlug as UPS
 from logger.formatter import LIGHTMAGENTA
@@ -70,6 +74,124 @@ PLATFORM_SLUG_TO_RETROACHIEVEMENTS_ID: dict[UPS, int] = {
 }
 
 
+# Platforms whose RetroAchievements hash is the MD5 of the rom file
+RA_PLAIN_FILE_PLATFORM_IDS: Final = frozenset(
+    PLATFORM_SLUG_TO_RETROACHIEVEMENTS_ID[slug]
+    for slug in (
+        UPS.ARCADIA_2001,
+        UPS.ATARI2600,
+        UPS.COLECOVISION,
+        UPS.ELEKTOR,
+        UPS.FAIRCHILD_CHANNEL_F,
+        UPS.GAMEGEAR,
+        UPS.GB,
+        UPS.GBA,
+        UPS.GBC,
+        UPS.GENESIS,
+        UPS.INTELLIVISION,
+        UPS.INTERTON_VC_4000,
+        UPS.JAGUAR,
+        UPS.MEGA_DUCK_SLASH_COUGAR_BOY,
+        UPS.NEO_GEO_POCKET,
+        UPS.ODYSSEY_2,
+        UPS.POKEMON_MINI,
+        UPS.SEGA32,
+        UPS.SG1000,
+        UPS.SMS,
+        UPS.SUPERVISION,
+        UPS.UZEBOX,
+        UPS.VECTREX,
+        UPS.VIRTUALBOY,
+        UPS.WASM_4,
+        UPS.WONDERSWAN,
+    )
+)
+
+# Platforms whose RetroAchievements hash is the MD5 of the rom file without its
+# header, for the dumps that include one
+RA_HEADERED_FILE_PLATFORM_IDS: Final = frozenset(
+    PLATFORM_SLUG_TO_RETROACHIEVEMENTS_ID[slug]
+    for slug in (UPS.ATARI7800, UPS.LYNX, UPS.NES, UPS.SNES)
+)
+
+RA_NATIVE_PLATFORM_IDS: Final = (
+    RA_PLAIN_FILE_PLATFORM_IDS | RA_HEADERED_FILE_PLATFORM_IDS
+)
+
+# RetroAchievements only hashes the beginning of files bigger than this
+RA_MAX_FILE_HASH_SIZE: Final = 64 * 1024 * 1024
+
+RA_READ_CHUNK_SIZE: Final = 1024 * 1024
+
+
+def get_ra_header_size(platform_id: int, header: bytes, file_size: int) -> int:
+    """Size of the header skipped by RetroAchievements when hashing a rom file
+
+    Args:
+        platform_id: RetroAchievements platform ID
+        header: first bytes of the rom file
+        file_size: size of the rom file
+    """
+    match platform_id:
+        # NES, iNES and fwNES headers
+        case 7 if header[:4] in (b"NES\x1a", b"FDS\x1a"):
+            return 16
+        # SNES, copier header
+        case 3 if file_size % 0x2000 == 512:
+            return 512
+        # Lynx
+        case 13 if header[:5] == b"LYNX\x00":
+            return 64
+        # Atari 7800
+        case 51 if header[1:10] == b"ATARI7800":
+            return 128
+        case _:
+            return 0
+
+
+class RAFileHasher:
+    """Calculate the RetroAchievements hash of a rom file from its data chunks
+
+    Only for platforms in RA_NATIVE_PLATFORM_IDS, the hash of other platforms needs RAHasher.
+    """
+
+    def __init__(self, platform_id: int, file_size: int):
+        self.platform_id = platform_id
+        self.file_size = file_size
+        self._md5_h = hashlib.md5(usedforsecurity=False)
+        self._offset = 0
+        self._header_size: int | None = None
+
+    def update(self, chunk: Buffer) -> None:
+        with memoryview(chunk) as data:
+            if self._header_size is None:
+                self._header_size = get_ra_header_size(
+                    self.platform_id, bytes(data[:16]), self.file_size
+                )
+
+            start = max(self._header_size - self._offset, 0)
+            end = min(RA_MAX_FILE_HASH_SIZE - self._offset, len(data))
+            if start < end:
+                self._md5_h.update(data[start:end])
+
+            self._offset += len(data)
+
+    def hexdigest(self) -> str:
+        # Nothing to hash for empty files, RAHasher doesn't hash them either
+        return self._md5_h.hexdigest() if self._offset else ""
+
+
+def calculate_ra_file_hash(platform_id: int, file_path: str) -> str:
+    ra_h = RAFileHasher(platform_id, os.path.getsize(file_path))
+    with open(file_path, "rb") as f:
+        buffer = memoryview(bytearray(RA_READ_CHUNK_SIZE))
+        while size := f.readinto(buffer):
+            with buffer[:size] as chunk:
+                ra_h.update(chunk)
+
+    return ra_h.hexdigest()
+
+
 class RAHasherError(Exception): ...
 
 
@@ -79,6 +201,16 @@ class RAHasherService:
     async def calculate_hash(self, platform_id: int, file_path: str) -> str:
         from handler.metadata.ra_handler import RA_ID_TO_SLUG
 
+        # Simple rom files are hashed in process, without spawning RAHasher
+        if platform_id in RA_NATIVE_PLATFORM_IDS and os.path.isfile(file_path):
+            try:
+                return await asyncio.to_thread(
+                    calculate_ra_file_hash, platform_id, file_path
+                )
+            except OSError as e:
+                log.error(f"Failed to calculate RetroAchievements hash: {e}")
+                return ""
+
         log.debug(
             f"Executing {hl('RAHasher', color=LIGHTMAGENTA)} for platform: {hl(RA_ID_TO_SLUG[platform_id])} - file: {hl(file_path.split('/')[-1])}"
         )
@@ -1,8 +1,7 @@
-import asyncio
 import http
 import json
 from collections.abc import AsyncIterator
-from typing import cast
+from typing import Final, cast
 
 import aiohttp
 import yarl
@@ -17,7 +16,13 @@ from aiohttp.client import ClientTimeout
 from config import RETROACHIEVEMENTS_API_KEY
 from fastapi import HTTPException, status
 from logger.logger import log
+from utils.cache import cached_api_response, scan_memoized
 from utils.context import ctx_aiohttp_session
+from utils.rate_limiter import ProviderRateLimiter, parse_retry_after
+
+RATE_LIMITER: Final = ProviderRateLimiter(
+    "retroachievements", requests_per_second=5, max_concurrency=4
+)
 
 
 async def auth_middleware(
@@ -51,11 +56,12 @@ class RetroAchievementsService:
             request_timeout,
         )
         try:
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             return await res.json()
         except aiohttp.ServerTimeoutError:
@@ -71,8 +77,8 @@ class RetroAchievementsService:
             ) from exc
         except aiohttp.ClientResponseError as err:
             if err.status == http.HTTPStatus.TOO_MANY_REQUESTS:
-                # Retry after 2 seconds if rate limit hit
-                await asyncio.sleep(2)
+                # Wait for the provider to accept requests again before retrying
+                await RATE_LIMITER.throttle(parse_retry_after(err.headers))
             else:
                 # Log the error and return an empty dict if the request fails with a different code
                 log.error(err)
@@ -87,11 +93,12 @@ class RetroAchievementsService:
                 url,
                 request_timeout,
             )
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             return await res.json()
         except (aiohttp.ClientResponseError, aiohttp.ServerTimeoutError) as err:
@@ -107,6 +114,8 @@ class RetroAchievementsService:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
             return {}
 
+    @scan_memoized("retroachievements")
+    @cached_api_response("retroachievements", ttl=24 * 60 * 60)
     async def get_game_extended_details(self, game_id: int) -> RAGameExtendedDetails:
         """Retrieve extended metadata about a game, targeted via its unique ID.
 
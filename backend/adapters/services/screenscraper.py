@@ -1,4 +1,3 @@
-import asyncio
 import base64
 import http
 import json
@@ -11,11 +10,16 @@ from aiohttp.client import ClientTimeout
 from config import SCREENSCRAPER_PASSWORD, SCREENSCRAPER_USER
 from fastapi import HTTPException, status
 from logger.logger import log
+from utils.cache import cached_api_response
 from utils.context import ctx_aiohttp_session
+from utils.rate_limiter import ProviderRateLimiter, parse_retry_after
 
 SS_DEV_ID: Final = base64.b64decode("enVyZGkxNQ==").decode()
 SS_DEV_PASSWORD: Final = base64.b64decode("eFRKd29PRmpPUUc=").decode()
 LOGIN_ERROR_CHECK: Final = "Erreur de login"
+RATE_LIMITER: Final = ProviderRateLimiter(
+    "screenscraper", requests_per_second=2, max_concurrency=4
+)
 
 
 async def auth_middleware(
@@ -47,6 +51,7 @@ class ScreenScraperService:
     ) -> None:
         self.url = yarl.URL(base_url or "https://api.screenscraper.fr/api2")
 
+    @cached_api_response("screenscraper", ttl=7 * 24 * 60 * 60)
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
         aiohttp_session = ctx_aiohttp_session.get()
         log.debug(
@@ -55,11 +60,12 @@ class ScreenScraperService:
             request_timeout,
         )
         try:
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             res_text = await res.text()
             if LOGIN_ERROR_CHECK in res_text:
@@ -82,8 +88,12 @@ class ScreenScraperService:
             ) from exc
         except aiohttp.ClientResponseError as err:
             if err.status == http.HTTPStatus.TOO_MANY_REQUESTS:
-                # Retry after 2 seconds if rate limit hit
-                await asyncio.sleep(2)
+                # Wait for the provider to accept requests again before retrying
+                await RATE_LIMITER.throttle(parse_retry_after(err.headers))
+            elif err.status == http.HTTPStatus.NOT_FOUND:
+                # Games not found, e.g. by hash, are expected
+                log.debug("Game not found in ScreenScraper API")
+                return {}
             else:
                 # Log the error and return an empty dict if the request fails with a different code
                 log.error(err)
@@ -98,11 +108,12 @@ class ScreenScraperService:
                 url,
                 request_timeout,
             )
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             res_text = await res.text()
             if LOGIN_ERROR_CHECK in res_text:
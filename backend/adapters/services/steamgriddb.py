@@ -2,7 +2,7 @@ import http
 import itertools
 import json
 from collections.abc import AsyncIterator, Collection
-from typing import Literal, cast
+from typing import Final, Literal, cast
 
 import aiohttp
 import aiohttp.client_exceptions
@@ -21,7 +21,13 @@ from aiohttp.client import ClientTimeout
 from config import STEAMGRIDDB_API_KEY
 from exceptions.endpoint_exceptions import SGDBInvalidAPIKeyException
 from logger.logger import log
+from utils.cache import cached_api_response
 from utils.context import ctx_aiohttp_session
+from utils.rate_limiter import ProviderRateLimiter, parse_retry_after
+
+RATE_LIMITER: Final = ProviderRateLimiter(
+    "steamgriddb", requests_per_second=5, max_concurrency=4
+)
 
 
 async def auth_middleware(
@@ -44,6 +50,7 @@ class SteamGridDBService:
     ) -> None:
         self.url = yarl.URL(base_url or "https://steamgriddb.com/api/v2")
 
+    @cached_api_response("steamgriddb", ttl=3 * 24 * 60 * 60)
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
         aiohttp_session = ctx_aiohttp_session.get()
         log.debug(
@@ -52,11 +59,12 @@ class SteamGridDBService:
             request_timeout,
         )
         try:
-            res = await aiohttp_session.get(
-                url,
-                middlewares=(auth_middleware,),
-                timeout=ClientTimeout(total=request_timeout),
-            )
+            async with RATE_LIMITER.acquire():
+                res = await aiohttp_session.get(
+                    url,
+                    middlewares=(auth_middleware,),
+                    timeout=ClientTimeout(total=request_timeout),
+                )
             res.raise_for_status()
             return await res.json()
         except aiohttp.client_exceptions.ClientResponseError as exc:
@@ -64,6 +72,9 @@ class SteamGridDBService:
             if exc.status == http.HTTPStatus.UNAUTHORIZED:
                 print("Invalid API key or unauthorized access.")
                 raise SGDBInvalidAPIKeyException from exc
+            if exc.status == http.HTTPStatus.TOO_MANY_REQUESTS:
+                # Pause the following requests until the provider accepts them again
+                await RATE_LIMITER.throttle(parse_retry_after(exc.headers))
             # Log the error and return an empty dict if the request fails with a different code
             log.error(exc)
             return {}
@@ -0,0 +1,38 @@
+"""empty message
+
+Revision ID: 0050_rom_files_last_modified_double
+Revises: 0049_add_fs_size_bytes
+Create Date: 2025-08-27 18:42:11.538129
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0050_rom_files_last_modified_double"
+down_revision = "0049_add_fs_size_bytes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Single precision floats can't hold a modification timestamp exactly, which is
+    # required to detect unchanged files during rescans
+    with op.batch_alter_table("rom_files", schema=None) as batch_op:
+        batch_op.alter_column(
+            "last_modified",
+            existing_type=sa.Float(),
+            type_=sa.Double(),
+            existing_nullable=True,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("rom_files", schema=None) as batch_op:
+        batch_op.alter_column(
+            "last_modified",
+            existing_type=sa.Double(),
+            type_=sa.Float(),
+            existing_nullable=True,
+        )
@@ -61,6 +61,9 @@ IGDB_CLIENT_ID: Final = os.environ.get(
 IGDB_CLIENT_SECRET: Final = os.environ.get(
     "IGDB_CLIENT_SECRET", os.environ.get("CLIENT_SECRET", "")
 ).strip()
+ENABLE_IGDB_SPECULATIVE_SEARCH: Final = str_to_bool(
+    os.environ.get("ENABLE_IGDB_SPECULATIVE_SEARCH", "false")
+)
 
 # MOBYGAMES
 MOBYGAMES_API_KEY: Final = os.environ.get("MOBYGAMES_API_KEY", "").strip()
@@ -121,6 +124,23 @@ OIDC_TLS_CACERTFILE: Final = os.environ.get("OIDC_TLS_CACERTFILE", None)
 
 # SCANS
 SCAN_TIMEOUT: Final = int(os.environ.get("SCAN_TIMEOUT", 60 * 60 * 4))  # 4 hours
+SCAN_WORKERS: Final = max(1, int(os.environ.get("SCAN_WORKERS", 1)))
+SCAN_HASHING_PROCESSES: Final = int(os.environ.get("SCAN_HASHING_PROCESSES", 0))
+SCAN_HASHING_BLOCK_SIZE: Final = max(
+    1024 * 8, int(os.environ.get("SCAN_HASHING_BLOCK_SIZE", 1024 * 1024))  # 1 MiB
+)
+ENABLE_SCAN_SHARDING: Final = str_to_bool(
+    os.environ.get("ENABLE_SCAN_SHARDING", "false")
+)
+ENABLE_SCAN_LISTING_CACHE: Final = str_to_bool(
+    os.environ.get("ENABLE_SCAN_LISTING_CACHE", "false")
+)
+ENABLE_METADATA_API_CACHE: Final = str_to_bool(
+    os.environ.get("ENABLE_METADATA_API_CACHE", "false")
+)
+METADATA_API_CACHE_MAX_ENTRIES: Final = max(
+    1, int(os.environ.get("METADATA_API_CACHE_MAX_ENTRIES", 50000))
+)
 
 # TASKS
 ENABLE_RESCAN_ON_FILESYSTEM_CHANGE: Final = str_to_bool(
@@ -136,6 +156,9 @@ SCHEDULED_RESCAN_CRON: Final = os.environ.get(
     "SCHEDULED_RESCAN_CRON",
     "0 3 * * *",  # At 3:00 AM every day
 )
+ENABLE_SCHEDULED_RESCAN_RESUME: Final = str_to_bool(
+    os.environ.get("ENABLE_SCHEDULED_RESCAN_RESUME", "false")
+)
 ENABLE_SCHEDULED_UPDATE_SWITCH_TITLEDB: Final = str_to_bool(
     os.environ.get("ENABLE_SCHEDULED_UPDATE_SWITCH_TITLEDB", "false")
 )
@@ -1,5 +1,7 @@
 import json
+import os
 import sys
+import threading
 from typing import Final
 
 import pydash
@@ -66,6 +68,9 @@ class ConfigManager:
     # Tests require custom config path
     def __init__(self, config_file: str = ROMM_USER_CONFIG_FILE):
         self.config_file = config_file
+        self._config_lock = threading.Lock()
+        # Path, mtime and size of the config file the current config was loaded from
+        self._config_file_signature: tuple[str, int, int] | None = None
 
         try:
             self.get_config()
@@ -231,12 +236,31 @@ class ConfigManager:
             )
             sys.exit(3)
 
+    def _get_config_file_signature(self) -> tuple[str, int, int]:
+        config_file_stat = os.stat(self.config_file)
+        return (
+            self.config_file,
+            config_file_stat.st_mtime_ns,
+            config_file_stat.st_size,
+        )
+
     def get_config(self) -> Config:
-        with open(self.config_file) as config_file:
-            self._raw_config = yaml.load(config_file, Loader=SafeLoader) or {}
+        """Get the parsed config, only reading the config.yml again when it changes"""
+        config_file_signature = self._get_config_file_signature()
+        if config_file_signature == self._config_file_signature:
+            return self.config
+
+        with self._config_lock:
+            # Another thread may have reloaded it while waiting for the lock
+            if config_file_signature == self._config_file_signature:
+                return self.config
 
-        self._parse_config()
-        self._validate_config()
+            with open(self.config_file) as config_file:
+                self._raw_config = yaml.load(config_file, Loader=SafeLoader) or {}
+
+            self._parse_config()
+            self._validate_config()
+            self._config_file_signature = config_file_signature
 
         return self.config
 
@@ -269,12 +293,18 @@ class ConfigManager:
         }
 
         try:
-            with open(self.config_file, "w") as config_file:
-                yaml.dump(self._raw_config, config_file)
+            with self._config_lock:
+                with open(self.config_file, "w") as config_file:
+                    yaml.dump(self._raw_config, config_file)
+
+                # The config in memory is the one just written, no need to read it again
+                self._config_file_signature = self._get_config_file_signature()
         except FileNotFoundError:
             self._raw_config = {}
+            self._config_file_signature = None
         except PermissionError as exc:
             self._raw_config = {}
+            self._config_file_signature = None
             raise ConfigNotWritableException from exc
 
     def add_platform_binding(self, fs_slug: str, slug: str) -> None:
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
 from itertools import batched
 from typing import Any, Final
+from uuid import uuid4
 
 import socketio  # type: ignore
-from config import DEV_MODE, REDIS_URL, SCAN_TIMEOUT
+from config import (
+    DEV_MODE,
+    ENABLE_SCAN_SHARDING,
+    REDIS_URL,
+    SCAN_TIMEOUT,
+    SCAN_WORKERS,
+)
 from endpoints.responses.platform import PlatformSchema
 from endpoints.responses.rom import SimpleRomSchema
 from exceptions.fs_exceptions import (
@@ -22,7 +35,7 @@ from handler.filesystem import (
     fs_rom_handler,
 )
 from handler.filesystem.roms_handler import FSRom
-from handler.redis_handler import high_prio_queue, redis_client
+from handler.redis_handler import async_cache, high_prio_queue, redis_client
 from handler.scan_handler import (
     ScanType,
     scan_firmware,
@@ -34,13 +47,33 @@ from logger.formatter import BLUE, LIGHTYELLOW
 from logger.formatter import highlight as hl
 from logger.logger import log
 from models.platform import Platform
-from models.rom import Rom, RomFile
-from rq import Worker
+from models.rom import Rom
+from rq import Callback, Worker
 from rq.job import Job
 from utils import emoji
-from utils.context import initialize_context
+from utils.context import (
+    ctx_refresh_api_cache,
+    ctx_scan_lookups,
+    initialize_context,
+    set_context_var,
+)
 
 STOP_SCAN_FLAG: Final = "scan:stop"
+STOP_SCAN_CHANNEL: Final = "scan:stop_requested"
+SCAN_SHARDS_KEY_PREFIX: Final = "scan:shards"
+# Field of the aggregated shard stats counting the shards that failed
+SCAN_SHARDS_FAILED_FIELD: Final = "failed_shards"
+SCAN_CHECKPOINT_KEY_PREFIX: Final = "scan:checkpoint"
+SCAN_CHECKPOINT_TTL: Final = 7 * 24 * 60 * 60  # 7 days
+FS_CHANGES_KEY_PREFIX: Final = "scan:fs_changes"
+
+SCAN_PLATFORMS_FUNC_NAME: Final = "endpoints.sockets.scan.scan_platforms"
+SCAN_PLATFORM_SHARD_FUNC_NAME: Final = "endpoints.sockets.scan.scan_platform_shard"
+SCAN_FS_CHANGES_FUNC_NAME: Final = "endpoints.sockets.scan.scan_fs_changes"
+
+# Scanned roms are sent to the client in batches, when either limit is reached
+SCAN_PROGRESS_BATCH_SIZE: Final = 50
+SCAN_PROGRESS_INTERVAL: Final = 0.25  # seconds
 
 
 @dataclass
@@ -72,6 +105,202 @@ class ScanStats:
         )
 
 
+@dataclass
+class ScanCheckpoint:
+    """Progress of a library scan, so a stopped or timed out scan can be resumed
+
+    Checkpoints are stored by scan scope (see get_key), so a scan only resumes the
+    progress of an earlier scan with the same platforms and options.
+    """
+
+    key: str
+    platform_list: list[str]
+    scan_type: ScanType
+    roms_ids: list[int]
+    metadata_sources: list[str]
+    # Platforms scanned in full, and their stats
+    completed_platforms: list[str] = field(default_factory=list)
+    scan_stats: ScanStats = field(default_factory=ScanStats)
+    # Platform being scanned, with the last rom of its last finished batch
+    platform_slug: str | None = None
+    last_fs_name: str | None = None
+    platform_roms_stats: ScanStats = field(default_factory=ScanStats)
+
+    @staticmethod
+    def get_key(
+        platform_ids: list[int],
+        scan_type: ScanType,
+        roms_ids: list[int],
+        metadata_sources: list[str],
+    ) -> str:
+        scope = json.dumps(
+            [
+                sorted(platform_ids),
+                scan_type.value,
+                sorted(roms_ids),
+                sorted(metadata_sources),
+            ]
+        )
+        return (
+            f"{SCAN_CHECKPOINT_KEY_PREFIX}:{hashlib.sha256(scope.encode()).hexdigest()}"
+        )
+
+    @classmethod
+    def load(cls, key: str) -> ScanCheckpoint | None:
+        data = redis_client.get(key)
+        if not data:
+            return None
+
+        try:
+            checkpoint = json.loads(data)
+            return cls(
+                key=key,
+                platform_list=checkpoint["platform_list"],
+                scan_type=ScanType(checkpoint["scan_type"]),
+                roms_ids=checkpoint["roms_ids"],
+                metadata_sources=checkpoint["metadata_sources"],
+                completed_platforms=checkpoint["completed_platforms"],
+                scan_stats=ScanStats(**checkpoint["scan_stats"]),
+                platform_slug=checkpoint["platform_slug"],
+                last_fs_name=checkpoint["last_fs_name"],
+                platform_roms_stats=ScanStats(**checkpoint["platform_roms_stats"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            log.warning(f"Ignoring invalid scan checkpoint: {e}")
+            return None
+
+    @staticmethod
+    def clear(key: str) -> None:
+        redis_client.delete(key)
+
+    def save(self) -> None:
+        redis_client.set(self.key, json.dumps(asdict(self)), ex=SCAN_CHECKPOINT_TTL)
+
+    def save_roms_batch(
+        self, platform_slug: str, last_fs_name: str, scan_stats: ScanStats
+    ) -> None:
+        if self.platform_slug != platform_slug:
+            self.platform_roms_stats = ScanStats()
+
+        self.platform_slug = platform_slug
+        self.last_fs_name = last_fs_name
+        self.platform_roms_stats += scan_stats
+        self.save()
+
+    def save_platform(self, platform_slug: str, scan_stats: ScanStats) -> None:
+        self.completed_platforms.append(platform_slug)
+        self.scan_stats += scan_stats
+        self.platform_slug = None
+        self.last_fs_name = None
+        self.platform_roms_stats = ScanStats()
+        self.save()
+
+
+class ScanProgress:
+    """Coalesce the roms scanned in a platform into batched progress events"""
+
+    def __init__(
+        self,
+        platform: Platform,
+        socket_manager: socketio.AsyncRedisManager,
+        batch_size: int = SCAN_PROGRESS_BATCH_SIZE,
+        interval: float = SCAN_PROGRESS_INTERVAL,
+    ) -> None:
+        self.platform = platform
+        self.socket_manager = socket_manager
+        self.batch_size = batch_size
+        self.interval = interval
+        self.scan_stats = ScanStats()
+        self._roms: list[dict[str, Any]] = []
+        self._started_at = self._last_flush_at = time.monotonic()
+
+    async def add_rom(self, rom: Rom, scan_stats: ScanStats) -> None:
+        self.scan_stats += scan_stats
+        self._roms.append(
+            SimpleRomSchema.from_orm_with_factory(rom).model_dump(
+                exclude={"created_at", "updated_at", "rom_user"}
+            )
+        )
+
+        if (
+            len(self._roms) >= self.batch_size
+            or time.monotonic() - self._last_flush_at >= self.interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._roms:
+            return
+
+        roms, self._roms = self._roms, []
+        self._last_flush_at = time.monotonic()
+        elapsed = self._last_flush_at - self._started_at
+
+        await self.socket_manager.emit(
+            "scan:scanning_roms",
+            {
+                "platform_id": self.platform.id,
+                "platform_name": self.platform.name,
+                "platform_slug": self.platform.slug,
+                "platform_fs_slug": self.platform.fs_slug,
+                "roms": roms,
+                "scanned_roms": self.scan_stats.scanned_roms,
+                "added_roms": self.scan_stats.added_roms,
+                "metadata_roms": self.scan_stats.metadata_roms,
+                "roms_per_second": (
+                    round(self.scan_stats.scanned_roms / elapsed, 2) if elapsed else 0
+                ),
+            },
+        )
+        await self.socket_manager.emit("", None)
+
+
+class ScanCancellation:
+    """Track stop requests for a running scan, without a Redis round-trip per item
+
+    Stopping a scan sets the STOP_SCAN_FLAG key, seen by scans and platform shards
+    starting afterwards, and is published to STOP_SCAN_CHANNEL for the running ones.
+    """
+
+    def __init__(self) -> None:
+        self._cancelled = False
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    async def __aenter__(self) -> ScanCancellation:
+        pubsub = async_cache.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(STOP_SCAN_CHANNEL)
+
+        # Check the flag after subscribing, so no stop request falls in between
+        self._cancelled = bool(await async_cache.get(STOP_SCAN_FLAG))
+        self._listener = asyncio.create_task(self._listen(pubsub))
+        return self
+
+    async def __aexit__(self, *_args: Any) -> None:
+        if self._listener:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+
+    async def _listen(self, pubsub: Any) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._cancelled = True
+                    return
+        finally:
+            await pubsub.unsubscribe(STOP_SCAN_CHANNEL)
+            await pubsub.aclose()
+
+
+def _request_scan_stop() -> None:
+    redis_client.set(STOP_SCAN_FLAG, 1)
+    redis_client.publish(STOP_SCAN_CHANNEL, 1)
+
+
 def _get_socket_manager() -> socketio.AsyncRedisManager:
     """Connect to external socketio server"""
     return socketio.AsyncRedisManager(str(REDIS_URL), write_only=True)
@@ -80,11 +309,12 @@ def _get_socket_manager() -> socketio.AsyncRedisManager:
 async def _identify_firmware(
     platform: Platform,
     fs_fw: str,
+    cancellation: ScanCancellation,
 ) -> ScanStats:
     scan_stats = ScanStats()
 
-    # Break early if the flag is set
-    if redis_client.get(STOP_SCAN_FLAG):
+    # Break early if the scan was stopped
+    if cancellation.is_cancelled:
         return scan_stats
 
     firmware = db_firmware_handler.get_firmware_by_filename(platform.id, fs_fw)
@@ -141,12 +371,13 @@ async def _identify_rom(
     scan_type: ScanType,
     roms_ids: list[int],
     metadata_sources: list[str],
-    socket_manager: socketio.AsyncRedisManager,
+    scan_progress: ScanProgress,
+    cancellation: ScanCancellation,
 ) -> ScanStats:
     scan_stats = ScanStats()
 
-    # Break early if the flag is set
-    if redis_client.get(STOP_SCAN_FLAG):
+    # Break early if the scan was stopped
+    if cancellation.is_cancelled:
         return scan_stats
 
     if not _should_scan_rom(scan_type=scan_type, rom=rom, roms_ids=roms_ids):
@@ -162,9 +393,7 @@ async def _identify_rom(
         return scan_stats
 
     # Update properties that don't require metadata
-    fs_regions, fs_revisions, fs_languages, fs_other_tags = fs_rom_handler.parse_tags(
-        fs_rom["fs_name"]
-    )
+    parsed_fs_name = fs_rom_handler.parse_fs_name(fs_rom["fs_name"])
     roms_path = fs_rom_handler.get_roms_fs_structure(platform.fs_slug)
 
     # Create the entry early so we have the ID
@@ -174,17 +403,13 @@ async def _identify_rom(
             Rom(
                 fs_name=fs_rom["fs_name"],
                 fs_path=roms_path,
-                fs_name_no_tags=fs_rom_handler.get_file_name_with_no_tags(
-                    fs_rom["fs_name"]
-                ),
-                fs_name_no_ext=fs_rom_handler.get_file_name_with_no_extension(
-                    fs_rom["fs_name"]
-                ),
-                fs_extension=fs_rom_handler.parse_file_extension(fs_rom["fs_name"]),
-                regions=fs_regions,
-                revision=fs_revisions,
-                languages=fs_languages,
-                tags=fs_other_tags,
+                fs_name_no_tags=parsed_fs_name["fs_name_no_tags"],
+                fs_name_no_ext=parsed_fs_name["fs_name_no_ext"],
+                fs_extension=parsed_fs_name["fs_extension"],
+                regions=parsed_fs_name["regions"],
+                revision=parsed_fs_name["revision"],
+                languages=parsed_fs_name["languages"],
+                tags=parsed_fs_name["tags"],
                 platform_id=platform.id,
                 name=fs_rom["fs_name"],
                 multi=fs_rom["multi"],
@@ -198,9 +423,15 @@ async def _identify_rom(
     if not rom:
         return scan_stats
 
-    # Build rom files object before scanning
+    # Build rom files object before scanning, reusing the stored hashes of the
+    # files that didn't change since the last scan unless hashes are recalculated
     rom_files, rom_crc_c, rom_md5_h, rom_sha1_h, rom_ra_h = (
-        await fs_rom_handler.get_rom_files(rom)
+        await fs_rom_handler.get_rom_files(
+            rom,
+            known_files=(
+                rom.files if not newly_added and scan_type != ScanType.HASHES else []
+            ),
+        )
     )
     fs_rom.update(
         {
@@ -227,27 +458,8 @@ async def _identify_rom(
 
     _added_rom = db_rom_handler.add_rom(scanned_rom)
 
-    # Delete the existing rom files in the DB
-    db_rom_handler.purge_rom_files(_added_rom.id)
-
-    # Create each file entry for the rom
-    new_rom_files = [
-        RomFile(
-            rom_id=_added_rom.id,
-            file_name=file.file_name,
-            file_path=file.file_path,
-            file_size_bytes=file.file_size_bytes,
-            last_modified=file.last_modified,
-            category=file.category,
-            crc_hash=file.crc_hash,
-            md5_hash=file.md5_hash,
-            sha1_hash=file.sha1_hash,
-            ra_hash=file.ra_hash,
-        )
-        for file in rom_files
-    ]
-    for new_rom_file in new_rom_files:
-        db_rom_handler.add_rom_file(new_rom_file)
+    # Update the rom files in the DB, keeping the IDs of the files that didn't move
+    db_rom_handler.sync_rom_files(_added_rom.id, rom_files)
 
     if _added_rom.ra_metadata:
         await fs_resource_handler.create_ra_resources_path(platform.id, _added_rom.id)
@@ -299,22 +511,101 @@ async def _identify_rom(
         },
     )
 
-    await socket_manager.emit(
-        "scan:scanning_rom",
-        {
-            "platform_name": platform.name,
-            "platform_slug": platform.slug,
-            "platform_fs_slug": platform.fs_slug,
-            **SimpleRomSchema.from_orm_with_factory(_added_rom).model_dump(
-                exclude={"created_at", "updated_at", "rom_user"}
-            ),
-        },
-    )
-    await socket_manager.emit("", None)
+    await scan_progress.add_rom(_added_rom, scan_stats)
 
     return scan_stats
 
 
+async def _identify_roms(
+    platform: Platform,
+    fs_roms: tuple[FSRom, ...],
+    rom_by_filename_map: dict[str, Rom],
+    scan_type: ScanType,
+    roms_ids: list[int],
+    metadata_sources: list[str],
+    scan_progress: ScanProgress,
+    cancellation: ScanCancellation,
+    scan_workers: int,
+) -> ScanStats:
+    """Identify a batch of roms, running up to `scan_workers` of them concurrently
+
+    Hashing, metadata lookups and asset downloads of different roms overlap, while
+    the stop flag is still checked by each rom before it starts being scanned.
+    """
+    semaphore = asyncio.Semaphore(max(1, scan_workers))
+
+    async def identify_rom(fs_rom: FSRom) -> ScanStats:
+        async with semaphore:
+            return await _identify_rom(
+                platform=platform,
+                fs_rom=fs_rom,
+                rom=rom_by_filename_map.get(fs_rom["fs_name"]),
+                scan_type=scan_type,
+                roms_ids=roms_ids,
+                metadata_sources=metadata_sources,
+                scan_progress=scan_progress,
+                cancellation=cancellation,
+            )
+
+    tasks = [asyncio.create_task(identify_rom(fs_rom)) for fs_rom in fs_roms]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # Don't leave sibling roms running in the background if one of them fails
+        for task in tasks:
+            task.cancel()
+        raise
+
+    scan_stats = ScanStats()
+    for rom_scan_stats in results:
+        scan_stats += rom_scan_stats
+
+    return scan_stats
+
+
+async def _identify_selected_roms(
+    platform: Platform,
+    fs_names: Iterable[str],
+    rom_by_filename_map: dict[str, Rom],
+    scan_type: ScanType,
+    roms_ids: list[int],
+    metadata_sources: list[str],
+    socket_manager: socketio.AsyncRedisManager,
+    cancellation: ScanCancellation,
+    scan_workers: int,
+) -> ScanStats:
+    """Rescan the given roms of a platform, looking up their files directly
+
+    The platform folder isn't listed, so only the given roms are added, or marked
+    as missing if they are in the database but not in the file system.
+    """
+    fs_roms = await fs_rom_handler.get_roms_by_fs_name(platform, fs_names)
+
+    found_fs_names = {fs_rom["fs_name"] for fs_rom in fs_roms}
+    for fs_name, rom in rom_by_filename_map.items():
+        if fs_name not in found_fs_names:
+            log.warning(f"{hl('Missing')} rom from filesystem: {fs_name}")
+            db_rom_handler.update_rom(rom.id, {"missing_from_fs": True})
+
+    log.info(f"{hl(str(len(fs_roms)))} roms found in the file system")
+
+    scan_progress = ScanProgress(platform, socket_manager)
+    try:
+        return await _identify_roms(
+            platform=platform,
+            fs_roms=tuple(fs_roms),
+            rom_by_filename_map=rom_by_filename_map,
+            scan_type=scan_type,
+            roms_ids=roms_ids,
+            metadata_sources=metadata_sources,
+            scan_progress=scan_progress,
+            cancellation=cancellation,
+            scan_workers=scan_workers,
+        )
+    finally:
+        await scan_progress.flush()
+
+
 async def _identify_platform(
     platform_slug: str,
     scan_type: ScanType,
@@ -322,9 +613,12 @@ async def _identify_platform(
     roms_ids: list[int],
     metadata_sources: list[str],
     socket_manager: socketio.AsyncRedisManager,
+    cancellation: ScanCancellation,
+    scan_workers: int = SCAN_WORKERS,
+    checkpoint: ScanCheckpoint | None = None,
 ) -> ScanStats:
-    # Stop the scan if the flag is set
-    if redis_client.get(STOP_SCAN_FLAG):
+    # Stop the scan if it was stopped
+    if cancellation.is_cancelled:
         raise ScanStoppedException()
 
     scan_stats = ScanStats()
@@ -357,6 +651,25 @@ async def _identify_platform(
     )
     await socket_manager.emit("", None)
 
+    # Selected roms are rescanned on their own, without walking the whole platform
+    if roms_ids:
+        rom_by_filename_map = db_rom_handler.get_roms_by_ids(
+            platform_id=platform.id, ids=roms_ids
+        )
+        # The user asked for these roms to be refreshed, so skip cached responses
+        async with set_context_var(ctx_refresh_api_cache, True):
+            return scan_stats + await _identify_selected_roms(
+                platform=platform,
+                fs_names=rom_by_filename_map.keys(),
+                rom_by_filename_map=rom_by_filename_map,
+                scan_type=scan_type,
+                roms_ids=roms_ids,
+                metadata_sources=metadata_sources,
+                socket_manager=socket_manager,
+                cancellation=cancellation,
+                scan_workers=scan_workers,
+            )
+
     # Scanning firmware
     try:
         fs_firmware = await fs_firmware_handler.get_firmware(platform.fs_slug)
@@ -374,6 +687,7 @@ async def _identify_platform(
         scan_stats += await _identify_firmware(
             platform=platform,
             fs_fw=fs_fw,
+            cancellation=cancellation,
         )
 
     # Scanning roms
@@ -390,22 +704,46 @@ async def _identify_platform(
     else:
         log.info(f"{hl(str(len(fs_roms)))} roms found in the file system")
 
-    for fs_roms_batch in batched(fs_roms, 200, strict=False):
-        rom_by_filename_map = db_rom_handler.get_roms_by_fs_name(
-            platform_id=platform.id,
-            fs_names={fs_rom["fs_name"] for fs_rom in fs_roms_batch},
-        )
+    pending_fs_roms = fs_roms
+    if checkpoint and checkpoint.platform_slug == platform_slug:
+        # Skip the roms already scanned by the interrupted scan, roms are sorted by name
+        last_fs_name = checkpoint.last_fs_name or ""
+        pending_fs_roms = [rom for rom in fs_roms if rom["fs_name"] > last_fs_name]
+        scan_stats += checkpoint.platform_roms_stats
+        log.info(f"Resuming scan after {hl(last_fs_name)}")
 
-        for fs_rom in fs_roms_batch:
-            scan_stats += await _identify_rom(
+    scan_progress = ScanProgress(platform, socket_manager)
+    try:
+        for fs_roms_batch in batched(pending_fs_roms, 200, strict=False):
+            rom_by_filename_map = db_rom_handler.get_roms_by_fs_name(
+                platform_id=platform.id,
+                fs_names={fs_rom["fs_name"] for fs_rom in fs_roms_batch},
+            )
+
+            batch_scan_stats = await _identify_roms(
                 platform=platform,
-                fs_rom=fs_rom,
-                rom=rom_by_filename_map.get(fs_rom["fs_name"]),
+                fs_roms=fs_roms_batch,
+                rom_by_filename_map=rom_by_filename_map,
                 scan_type=scan_type,
                 roms_ids=roms_ids,
                 metadata_sources=metadata_sources,
-                socket_manager=socket_manager,
+                scan_progress=scan_progress,
+                cancellation=cancellation,
+                scan_workers=scan_workers,
             )
+            scan_stats += batch_scan_stats
+
+            # Roms of the batch are skipped once the scan is stopped
+            if cancellation.is_cancelled:
+                break
+
+            if checkpoint:
+                checkpoint.save_roms_batch(
+                    platform_slug, fs_roms_batch[-1]["fs_name"], batch_scan_stats
+                )
+    finally:
+        # Send the roms still waiting for a batch, even if the scan was stopped
+        await scan_progress.flush()
 
     missing_roms = db_rom_handler.mark_missing_roms(
         platform.id, [rom["fs_name"] for rom in fs_roms]
@@ -426,12 +764,212 @@ async def _identify_platform(
     return scan_stats
 
 
+async def _finish_scan(
+    fs_platforms: list[str],
+    scan_stats: ScanStats,
+    socket_manager: socketio.AsyncRedisManager,
+) -> None:
+    missed_platforms = db_platform_handler.mark_missing_platforms(fs_platforms)
+    if len(missed_platforms) > 0:
+        log.warning(f"{hl('Missing')} platforms from filesystem:")
+        for p in missed_platforms:
+            log.warning(f" - {p.slug}")
+
+    log.info(f"{emoji.EMOJI_CHECK_MARK} Scan completed")
+    await socket_manager.emit("scan:done", scan_stats.__dict__)
+
+
+def _get_shard_keys(scan_id: str) -> tuple[str, str, str]:
+    """Redis keys holding the pending shards counter, the aggregated stats and the
+    platforms of the shards that already reported back"""
+    return (
+        f"{SCAN_SHARDS_KEY_PREFIX}:{scan_id}:pending",
+        f"{SCAN_SHARDS_KEY_PREFIX}:{scan_id}:stats",
+        f"{SCAN_SHARDS_KEY_PREFIX}:{scan_id}:completed",
+    )
+
+
+def _enqueue_platform_shards(
+    platform_list: list[str],
+    fs_platforms: list[str],
+    scan_type: ScanType,
+    roms_ids: list[int],
+    metadata_sources: list[str],
+    scan_workers: int,
+) -> str:
+    """Fan out a library scan into one job per platform
+
+    Returns:
+        The id of the scan, shared by all its platform shards
+    """
+    scan_id = uuid4().hex
+    pending_key, _, _ = _get_shard_keys(scan_id)
+    redis_client.set(pending_key, len(platform_list), ex=SCAN_TIMEOUT)
+
+    for platform_slug in platform_list:
+        high_prio_queue.enqueue(
+            scan_platform_shard,
+            scan_id,
+            platform_slug,
+            fs_platforms,
+            scan_type,
+            roms_ids,
+            metadata_sources,
+            scan_workers,
+            job_timeout=SCAN_TIMEOUT,
+            on_failure=Callback(_on_platform_shard_failure),
+        )
+
+    return scan_id
+
+
+def _on_platform_shard_failure(job: Job, _connection: Any, *_exc_info: Any) -> None:
+    """Report a failed shard, when its job failed without running its own report
+
+    Called by RQ when the job timed out or its worker died.
+    """
+    scan_id, platform_slug, fs_platforms, *_ = job.args
+    asyncio.run(
+        _complete_platform_shard(
+            scan_id,
+            platform_slug,
+            fs_platforms,
+            ScanStats(),
+            _get_socket_manager(),
+            failed=True,
+        )
+    )
+
+
+async def _complete_platform_shard(
+    scan_id: str,
+    platform_slug: str,
+    fs_platforms: list[str],
+    scan_stats: ScanStats,
+    socket_manager: socketio.AsyncRedisManager,
+    failed: bool = False,
+) -> None:
+    """Add the shard stats to the scan total, and finish the scan if it was the last one"""
+    pending_key, stats_key, completed_key = _get_shard_keys(scan_id)
+
+    # A failed job is also reported by RQ, after the shard may have reported itself
+    if not redis_client.sadd(completed_key, platform_slug):
+        return
+
+    with redis_client.pipeline() as pipe:
+        pipe.expire(completed_key, SCAN_TIMEOUT)
+        for field, value in scan_stats.__dict__.items():
+            pipe.hincrby(stats_key, field, value)
+        if failed:
+            pipe.hincrby(stats_key, SCAN_SHARDS_FAILED_FIELD, 1)
+        pipe.expire(stats_key, SCAN_TIMEOUT)
+        pipe.decr(pending_key)
+        pipe.expire(pending_key, SCAN_TIMEOUT)
+        pending_shards = pipe.execute()[-2]
+
+    if pending_shards > 0:
+        return
+
+    if pending_shards < 0:
+        # The counter expired before all the shards reported back, so the total
+        # stats are incomplete; only the first shard to notice reports it
+        log.error(f"Lost track of the platform shards of scan {scan_id}")
+        if pending_shards == -1:
+            redis_client.delete(stats_key)
+            await socket_manager.emit(
+                "scan:done_ko", "Scan timed out before all platforms were scanned"
+            )
+        return
+
+    shards_stats = {
+        field.decode(): int(value)
+        for field, value in redis_client.hgetall(stats_key).items()
+    }
+    failed_shards = shards_stats.pop(SCAN_SHARDS_FAILED_FIELD, 0)
+    total_stats = ScanStats(**shards_stats)
+    # The completed platforms expire on their own, RQ may still report failed jobs
+    redis_client.delete(pending_key, stats_key)
+
+    if redis_client.get(STOP_SCAN_FLAG):
+        log.info(f"{emoji.EMOJI_STOP_SIGN} Scan stopped manually")
+        await socket_manager.emit("scan:done", total_stats.__dict__)
+        redis_client.delete(STOP_SCAN_FLAG)
+        return
+
+    if failed_shards > 0:
+        log.error(f"Scan failed for {failed_shards} platform(s)")
+        await socket_manager.emit(
+            "scan:done_ko", f"Scan failed for {failed_shards} platform(s)"
+        )
+        return
+
+    await _finish_scan(fs_platforms, total_stats, socket_manager)
+
+
+@initialize_context()
+async def scan_platform_shard(
+    scan_id: str,
+    platform_slug: str,
+    fs_platforms: list[str],
+    scan_type: ScanType,
+    roms_ids: list[int],
+    metadata_sources: list[str],
+    scan_workers: int,
+):
+    """Scan a single platform as part of a sharded library scan
+
+    Args:
+        scan_id (str): Id of the sharded scan this platform belongs to
+        platform_slug (str): Filesystem slug of the platform to be scanned
+        fs_platforms (list[str]): All the platforms found in the file system
+        scan_type (str): Type of scan to be performed
+        roms_ids (list[int]): List of selected roms to be scanned
+        metadata_sources (list[str]): List of metadata sources to be used
+        scan_workers (int): Number of roms identified concurrently
+    """
+
+    sm = _get_socket_manager()
+    scan_stats = ScanStats()
+    failed = False
+
+    try:
+        async with (
+            ScanCancellation() as cancellation,
+            set_context_var(ctx_scan_lookups, {}),
+        ):
+            scan_stats = await _identify_platform(
+                platform_slug=platform_slug,
+                scan_type=scan_type,
+                fs_platforms=fs_platforms,
+                roms_ids=roms_ids,
+                metadata_sources=metadata_sources,
+                socket_manager=sm,
+                cancellation=cancellation,
+                scan_workers=scan_workers,
+            )
+    except ScanStoppedException:
+        log.info(f"{emoji.EMOJI_STOP_SIGN} Skipping {hl(platform_slug)}, scan stopped")
+    except Exception as e:
+        # Other shards keep running, so the error is not reported to the client here
+        log.error(f"Error in scan_platform_shard: {e}")
+        failed = True
+        raise e
+    finally:
+        # Always report back, so the last shard can close the scan
+        await _complete_platform_shard(
+            scan_id, platform_slug, fs_platforms, scan_stats, sm, failed
+        )
+
+
 @initialize_context()
 async def scan_platforms(
     platform_ids: list[int],
     scan_type: ScanType = ScanType.QUICK,
     roms_ids: list[int] | None = None,
     metadata_sources: list[str] | None = None,
+    scan_workers: int | None = None,
+    sharded: bool | None = None,
+    resume: bool = False,
 ):
     """Scan all the listed platforms and fetch metadata from different sources
 
@@ -440,11 +978,32 @@ async def scan_platforms(
         scan_type (str): Type of scan to be performed. Defaults to "quick".
         roms_ids (list[int], optional): List of selected roms to be scanned. Defaults to [].
         metadata_sources (list[str], optional): List of metadata sources to be used. Defaults to all sources.
+        scan_workers (int, optional): Number of roms identified concurrently. Defaults to SCAN_WORKERS.
+        sharded (bool, optional): Scan each platform in its own job. Defaults to ENABLE_SCAN_SHARDING.
+        resume (bool, optional): Resume the last interrupted scan with the same platforms and options. Defaults to False.
     """
 
     if not roms_ids:
         roms_ids = []
 
+    # Selected roms are rescanned quickly, there is no progress worth keeping
+    checkpoint_key = (
+        ScanCheckpoint.get_key(
+            platform_ids, scan_type, roms_ids, metadata_sources or []
+        )
+        if not roms_ids
+        else None
+    )
+    checkpoint = (
+        ScanCheckpoint.load(checkpoint_key) if checkpoint_key and resume else None
+    )
+
+    if not scan_workers:
+        scan_workers = SCAN_WORKERS
+
+    if sharded is None:
+        sharded = ENABLE_SCAN_SHARDING
+
     sm = _get_socket_manager()
 
     if not metadata_sources:
@@ -459,7 +1018,7 @@ async def scan_platforms(
         await sm.emit("scan:done_ko", e.message)
         return None
 
-    scan_stats = ScanStats()
+    scan_stats = checkpoint.scan_stats if checkpoint else ScanStats()
 
     async def stop_scan():
         log.info(f"{emoji.EMOJI_STOP_SIGN} Scan stopped manually")
@@ -467,12 +1026,18 @@ async def scan_platforms(
         redis_client.delete(STOP_SCAN_FLAG)
 
     try:
-        platform_list = [
-            platform.fs_slug
-            for s in platform_ids
-            if (platform := db_platform_handler.get_platform(s)) is not None
-        ] or fs_platforms
-        platform_list = sorted(platform_list)
+        if checkpoint:
+            platform_list = checkpoint.platform_list
+            log.info(
+                f"Resuming scan, {hl(str(len(checkpoint.completed_platforms)))} platforms already scanned"
+            )
+        else:
+            platform_list = [
+                platform.fs_slug
+                for s in platform_ids
+                if (platform := db_platform_handler.get_platform(s)) is not None
+            ] or fs_platforms
+            platform_list = sorted(platform_list)
 
         if len(platform_list) == 0:
             log.warning(
@@ -484,24 +1049,65 @@ async def scan_platforms(
                 f"Found {hl(str(len(platform_list)))} platforms in the file system"
             )
 
-        for platform_slug in platform_list:
-            scan_stats += await _identify_platform(
-                platform_slug=platform_slug,
-                scan_type=scan_type,
+        # Platform shards run in the workers, which aren't available in dev mode.
+        # Shards are bounded by platform already, so resumed scans run in a single job
+        if sharded and not checkpoint and not DEV_MODE and len(platform_list) > 0:
+            scan_id = _enqueue_platform_shards(
+                platform_list=platform_list,
                 fs_platforms=fs_platforms,
+                scan_type=scan_type,
+                roms_ids=roms_ids,
+                metadata_sources=metadata_sources,
+                scan_workers=scan_workers,
+            )
+            log.info(
+                f"Scan {hl(scan_id)} split into {hl(str(len(platform_list)))} platform jobs"
+            )
+            return None
+
+        if checkpoint_key and not checkpoint:
+            checkpoint = ScanCheckpoint(
+                key=checkpoint_key,
+                platform_list=platform_list,
+                scan_type=scan_type,
                 roms_ids=roms_ids,
                 metadata_sources=metadata_sources,
-                socket_manager=sm,
             )
+            checkpoint.save()
 
-        missed_platforms = db_platform_handler.mark_missing_platforms(fs_platforms)
-        if len(missed_platforms) > 0:
-            log.warning(f"{hl('Missing')} platforms from filesystem:")
-            for p in missed_platforms:
-                log.warning(f" - {p.slug}")
+        async with (
+            ScanCancellation() as cancellation,
+            set_context_var(ctx_scan_lookups, {}),
+        ):
+            for platform_slug in platform_list:
+                if checkpoint and platform_slug in checkpoint.completed_platforms:
+                    continue
+
+                platform_scan_stats = await _identify_platform(
+                    platform_slug=platform_slug,
+                    scan_type=scan_type,
+                    fs_platforms=fs_platforms,
+                    roms_ids=roms_ids,
+                    metadata_sources=metadata_sources,
+                    socket_manager=sm,
+                    cancellation=cancellation,
+                    scan_workers=scan_workers,
+                    checkpoint=checkpoint,
+                )
+                scan_stats += platform_scan_stats
 
-        log.info(f"{emoji.EMOJI_CHECK_MARK} Scan completed")
-        await sm.emit("scan:done", scan_stats.__dict__)
+                if cancellation.is_cancelled:
+                    break
+                if checkpoint:
+                    checkpoint.save_platform(platform_slug, platform_scan_stats)
+
+        # A stopped scan is not finished, its checkpoint is kept to resume it later
+        if cancellation.is_cancelled:
+            raise ScanStoppedException()
+
+        await _finish_scan(fs_platforms, scan_stats, sm)
+        if checkpoint_key:
+            ScanCheckpoint.clear(checkpoint_key)
     except ScanStoppedException:
         await stop_scan()
     except Exception as e:
@@ -512,6 +1118,81 @@ async def scan_platforms(
         raise e
 
 
+def _get_fs_changes_key(platform_id: int) -> str:
+    """Redis key holding the names of the roms of a platform changed in the file system"""
+    return f"{FS_CHANGES_KEY_PREFIX}:{platform_id}"
+
+
+def add_fs_changes(platform_id: int, fs_names: Iterable[str]) -> None:
+    """Queue roms changed in the file system, for the next scan_fs_changes of the platform"""
+    key = _get_fs_changes_key(platform_id)
+    with redis_client.pipeline() as pipe:
+        pipe.sadd(key, *fs_names)
+        pipe.expire(key, SCAN_TIMEOUT)
+        pipe.execute()
+
+
+def _pop_fs_changes(platform_id: int) -> list[str]:
+    key = _get_fs_changes_key(platform_id)
+    with redis_client.pipeline() as pipe:
+        pipe.smembers(key)
+        pipe.delete(key)
+        fs_names, _ = pipe.execute()
+
+    return sorted(fs_name.decode() for fs_name in fs_names)
+
+
+@initialize_context()
+async def scan_fs_changes(platform_id: int, metadata_sources: list[str]):
+    """Scan the roms of a platform added or deleted in the file system
+
+    The roms are queued with add_fs_changes, so the changes reported while the job
+    is waiting to run are all scanned at once.
+
+    Args:
+        platform_id (int): Id of the platform the roms belong to
+        metadata_sources (list[str]): List of metadata sources to be used
+    """
+
+    fs_names = _pop_fs_changes(platform_id)
+    platform = db_platform_handler.get_platform(platform_id)
+    if not fs_names or not platform:
+        return None
+
+    log.info(
+        f"{emoji.EMOJI_MAGNIFYING_GLASS_TILTED_RIGHT} Scanning {hl(str(len(fs_names)))} changed roms in {hl(platform.fs_slug)}"
+    )
+
+    sm = _get_socket_manager()
+    rom_by_filename_map = db_rom_handler.get_roms_by_fs_name(
+        platform_id=platform.id, fs_names=fs_names
+    )
+
+    try:
+        async with (
+            ScanCancellation() as cancellation,
+            set_context_var(ctx_scan_lookups, {}),
+        ):
+            scan_stats = await _identify_selected_roms(
+                platform=platform,
+                fs_names=fs_names,
+                rom_by_filename_map=rom_by_filename_map,
+                scan_type=ScanType.QUICK,
+                roms_ids=[rom.id for rom in rom_by_filename_map.values()],
+                metadata_sources=metadata_sources,
+                socket_manager=sm,
+                cancellation=cancellation,
+                scan_workers=SCAN_WORKERS,
+            )
+    except Exception as e:
+        log.error(f"Error in scan_fs_changes: {e}")
+        await sm.emit("scan:done_ko", str(e))
+        raise e
+
+    log.info(f"{emoji.EMOJI_CHECK_MARK} Scan completed")
+    await sm.emit("scan:done", scan_stats.__dict__)
+
+
 @socket_handler.socket_server.on("scan")  # type: ignore
 async def scan_handler(_sid: str, options: dict[str, Any]):
     """Scan socket endpoint
@@ -526,6 +1207,9 @@ async def scan_handler(_sid: str, options: dict[str, Any]):
     scan_type = ScanType[options.get("type", "quick").upper()]
     roms_ids = options.get("roms_ids", [])
     metadata_sources = options.get("apis", [])
+    scan_workers = max(1, int(options.get("workers") or SCAN_WORKERS))
+    sharded = bool(options.get("sharded", ENABLE_SCAN_SHARDING))
+    resume = bool(options.get("resume", False))
 
     if DEV_MODE:
         return await scan_platforms(
@@ -533,6 +1217,9 @@ async def scan_handler(_sid: str, options: dict[str, Any]):
             scan_type=scan_type,
             roms_ids=roms_ids,
             metadata_sources=metadata_sources,
+            scan_workers=scan_workers,
+            sharded=sharded,
+            resume=resume,
         )
 
     return high_prio_queue.enqueue(
@@ -541,6 +1228,9 @@ async def scan_handler(_sid: str, options: dict[str, Any]):
         scan_type,
         roms_ids,
         metadata_sources,
+        scan_workers,
+        sharded,
+        resume,
         job_timeout=SCAN_TIMEOUT,  # Timeout (default of 4 hours)
     )
 
@@ -553,22 +1243,29 @@ async def stop_scan_handler(_sid: str):
 
     async def cancel_job(job: Job):
         job.cancel()
-        redis_client.set(STOP_SCAN_FLAG, 1)
+        _request_scan_stop()
         log.info(f"{emoji.EMOJI_STOP_BUTTON} Job found, stopping scan...")
 
+    def stop_shards():
+        # Pending shards are drained through the stop flag, so they still report back
+        _request_scan_stop()
+        log.info(f"{emoji.EMOJI_STOP_BUTTON} Platform jobs found, stopping scan...")
+
     existing_jobs = high_prio_queue.get_jobs()
     for job in existing_jobs:
         if job.func_name == "scan_platform" and job.is_started:
             return await cancel_job(job)
+        if job.func_name == SCAN_PLATFORM_SHARD_FUNC_NAME:
+            return stop_shards()
 
     workers = Worker.all(connection=redis_client)
     for worker in workers:
         current_job = worker.get_current_job()
-        if (
-            current_job
-            and current_job.func_name == "endpoints.sockets.scan.scan_platforms"
-            and current_job.is_started
-        ):
+        if not current_job or not current_job.is_started:
+            continue
+        if current_job.func_name == SCAN_PLATFORMS_FUNC_NAME:
             return await cancel_job(current_job)
+        if current_job.func_name == SCAN_PLATFORM_SHARD_FUNC_NAME:
+            return stop_shards()
 
     log.info(f"{emoji.EMOJI_STOP_BUTTON} No running scan to stop")
@@ -56,3 +56,12 @@ class FirmwareNotFoundException(Exception):
 
     def __repr__(self):
         return self.message
+
+
+class ArchiveExtractionException(Exception):
+    def __init__(self, file_name: str, archive_path: str):
+        self.message = f"Error extracting {hl(file_name)} from {archive_path}"
+        super().__init__(self.message)
+
+    def __repr__(self):
+        return self.message
@@ -1,5 +1,5 @@
 import functools
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
 from decorators.database import begin_session
 from models.platform import Platform
@@ -66,6 +66,15 @@ class DBPlatformsHandler(DBBaseHandler):
     ) -> Platform | None:
         return session.scalar(query.filter_by(fs_slug=fs_slug).limit(1))
 
+    @begin_session
+    @with_firmware
+    def get_platforms_by_fs_slugs(
+        self, fs_slugs: Iterable[str], query: Query = None, session: Session = None
+    ) -> Sequence[Platform]:
+        return (
+            session.scalars(query.filter(Platform.fs_slug.in_(fs_slugs))).unique().all()
+        )
+
     @begin_session
     def delete_platform(self, id: int, session: Session = None) -> None:
         # Remove all roms from that platforms first
@@ -17,6 +17,7 @@ from sqlalchemy import (
     delete,
     false,
     func,
+    insert,
     literal,
     not_,
     or_,
@@ -28,6 +29,18 @@ from sqlalchemy.orm import Query, Session, selectinload
 
 from .base_handler import DBBaseHandler
 
+# Rom file columns refreshed on every scan, files are matched by path and name
+ROM_FILE_SCAN_COLUMNS = (
+    "file_size_bytes",
+    "last_modified",
+    "category",
+    "crc_hash",
+    "md5_hash",
+    "sha1_hash",
+    "ra_hash",
+    "missing_from_fs",
+)
+
 EJS_SUPPORTED_PLATFORMS = [
     UPS._3DO,
     UPS.AMIGA,
@@ -737,6 +750,25 @@ class DBRomsHandler(DBBaseHandler):
         )
         return {rom.fs_name: rom for rom in roms}
 
+    @begin_session
+    @with_details
+    def get_roms_by_ids(
+        self,
+        platform_id: int,
+        ids: Iterable[int],
+        query: Query = None,
+        session: Session = None,
+    ) -> dict[str, Rom]:
+        """Retrieve a dictionary of roms by their filesystem names, from their IDs."""
+        roms = (
+            session.scalars(
+                query.filter(Rom.id.in_(ids)).filter_by(platform_id=platform_id)
+            )
+            .unique()
+            .all()
+        )
+        return {rom.fs_name: rom for rom in roms}
+
     @begin_session
     def update_rom(self, id: int, data: dict, session: Session = None) -> Rom:
         session.execute(
@@ -838,10 +870,6 @@ class DBRomsHandler(DBBaseHandler):
 
         return session.query(RomUser).filter_by(id=id).one()
 
-    @begin_session
-    def add_rom_file(self, rom_file: RomFile, session: Session = None) -> RomFile:
-        return session.merge(rom_file)
-
     @begin_session
     def get_rom_file_by_id(self, id: int, session: Session = None) -> RomFile | None:
         return session.scalar(select(RomFile).filter_by(id=id).limit(1))
@@ -858,15 +886,59 @@ class DBRomsHandler(DBBaseHandler):
         return session.query(RomFile).filter_by(id=id).one()
 
     @begin_session
-    def purge_rom_files(
-        self, rom_id: int, session: Session = None
-    ) -> Sequence[RomFile]:
-        purged_rom_files = (
-            session.scalars(select(RomFile).filter_by(rom_id=rom_id)).unique().all()
-        )
-        session.execute(
-            delete(RomFile)
-            .where(RomFile.rom_id == rom_id)
-            .execution_options(synchronize_session="evaluate")
-        )
-        return purged_rom_files
+    def sync_rom_files(
+        self, rom_id: int, rom_files: Sequence[RomFile], session: Session = None
+    ) -> None:
+        """Make the stored files of a rom match the scanned ones
+
+        Files still on the same path keep their IDs and are only updated if they changed,
+        new files are inserted and the rest are deleted, in a single transaction.
+        """
+        stored_files = {
+            (row.file_path, row.file_name): row
+            for row in session.execute(
+                select(
+                    RomFile.id,
+                    RomFile.file_path,
+                    RomFile.file_name,
+                    *(getattr(RomFile, column) for column in ROM_FILE_SCAN_COLUMNS),
+                ).filter_by(rom_id=rom_id)
+            )
+        }
+
+        new_files: list[dict[str, Any]] = []
+        changed_files: list[dict[str, Any]] = []
+        for rom_file in rom_files:
+            values = {
+                column: getattr(rom_file, column) for column in ROM_FILE_SCAN_COLUMNS
+            }
+            values["missing_from_fs"] = False
+
+            stored_file = stored_files.pop(
+                (rom_file.file_path, rom_file.file_name), None
+            )
+            if not stored_file:
+                new_files.append(
+                    {
+                        "rom_id": rom_id,
+                        "file_path": rom_file.file_path,
+                        "file_name": rom_file.file_name,
+                        **values,
+                    }
+                )
+            elif any(
+                getattr(stored_file, column) != value
+                for column, value in values.items()
+            ):
+                changed_files.append({"id": stored_file.id, **values})
+
+        if stored_files:
+            session.execute(
+                delete(RomFile)
+                .where(RomFile.id.in_(row.id for row in stored_files.values()))
+                .execution_options(synchronize_session=False)
+            )
+        if changed_files:
+            session.execute(update(RomFile), changed_files)
+        if new_files:
+            session.execute(insert(RomFile), new_files)
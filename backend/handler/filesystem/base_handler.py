@@ -1,8 +1,10 @@
 import asyncio
 import fnmatch
+import functools
 import os
 import re
 import shutil
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 from enum import Enum
 from io import BytesIO
@@ -77,6 +79,56 @@ LANGUAGES_BY_SHORTCODE = {lang[0].lower(): lang[1] for lang in LANGUAGES}
 LANGUAGES_NAME_KEYS = frozenset(lang[1].lower() for lang in LANGUAGES)
 
 
+class ExclusionMatcher:
+    """Match file names against excluded names and extensions, compiled once
+
+    Exact names and extensions are set lookups, and all the unix filename patterns
+    are compiled into a single regex.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        extensions: Iterable[str] = (),
+        patterns: bool = True,
+    ):
+        names = tuple(names)
+        self._names = frozenset(names)
+        self._extensions = frozenset(ext.lower() for ext in extensions)
+
+        wildcards = [
+            fnmatch.translate(name)
+            for name in names
+            if patterns and any(char in name for char in "*?[")
+        ]
+        self._wildcards_regex = re.compile("|".join(wildcards)) if wildcards else None
+
+    def is_excluded(self, file_name: str) -> bool:
+        if file_name in self._names:
+            return True
+
+        if self._extensions:
+            match = EXTENSION_REGEX.search(file_name)
+            if match and match.group(1).lower() in self._extensions:
+                return True
+
+        return bool(self._wildcards_regex and self._wildcards_regex.match(file_name))
+
+    def filter(self, file_names: Iterable[str]) -> list[str]:
+        """Return the file names that are not excluded, keeping their order"""
+        return [name for name in file_names if not self.is_excluded(name)]
+
+
+@functools.lru_cache(maxsize=16)
+def get_exclusion_matcher(
+    names: tuple[str, ...] = (),
+    extensions: tuple[str, ...] = (),
+    patterns: bool = True,
+) -> ExclusionMatcher:
+    """Get the matcher of an exclusion config, compiled once for each config"""
+    return ExclusionMatcher(names, extensions, patterns)
+
+
 class CoverSize(Enum):
     SMALL = "small"
     BIG = "big"
@@ -184,25 +236,12 @@ class FSHandler:
         return match.group(1) if match else ""
 
     def exclude_single_files(self, files: list[str]) -> list[str]:
-        excluded_extensions = cm.get_config().EXCLUDED_SINGLE_EXT
-        excluded_names = cm.get_config().EXCLUDED_SINGLE_FILES
-        excluded_files: list[str] = []
-
-        for file_name in files:
-            # Split the file name to get the extension.
-            ext = self.parse_file_extension(file_name)
-
-            # Exclude the file if it has no extension or the extension is in the excluded list.
-            if ext and ext.lower() in excluded_extensions:
-                excluded_files.append(file_name)
-
-            # Additionally, check if the file name mathes a pattern in the excluded list.
-            for name in excluded_names:
-                if file_name == name or fnmatch.fnmatch(file_name, name):
-                    excluded_files.append(file_name)
-
-        # Return files that are not in the filtered list.
-        return [f for f in files if f not in excluded_files]
+        cnfg = cm.get_config()
+        matcher = get_exclusion_matcher(
+            names=tuple(cnfg.EXCLUDED_SINGLE_FILES),
+            extensions=tuple(cnfg.EXCLUDED_SINGLE_EXT),
+        )
+        return matcher.filter(files)
 
     async def make_directory(self, path: str) -> None:
         """
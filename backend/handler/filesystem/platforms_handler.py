@@ -7,7 +7,7 @@ from exceptions.fs_exceptions import (
     PlatformAlreadyExistsException,
 )
 
-from .base_handler import FSHandler
+from .base_handler import FSHandler, get_exclusion_matcher
 
 
 class FSPlatformsHandler(FSHandler):
@@ -15,12 +15,10 @@ class FSPlatformsHandler(FSHandler):
         super().__init__(base_path=LIBRARY_BASE_PATH)
 
     def _exclude_platforms(self, platforms: list):
-        cnfg = cm.get_config()
-        return [
-            platform
-            for platform in platforms
-            if platform not in cnfg.EXCLUDED_PLATFORMS
-        ]
+        matcher = get_exclusion_matcher(
+            names=tuple(cm.get_config().EXCLUDED_PLATFORMS), patterns=False
+        )
+        return matcher.filter(platforms)
 
     def get_platforms_directory(self) -> str:
         cnfg = cm.get_config()
@@ -1,25 +1,34 @@
+import asyncio
 import binascii
 import bz2
-import fnmatch
+import functools
 import hashlib
+import importlib
+import io
+import mmap
+import multiprocessing
 import os
 import re
 import tarfile
 import zipfile
 import zlib
-from collections.abc import Callable, Iterator
+from collections.abc import Buffer, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import IO, Any, Final, Literal, TypedDict
+from typing import IO, TYPE_CHECKING, Any, Final, Literal, TypedDict
 
 import magic
 import zipfile_inflate64  # trunk-ignore(ruff/F401): Patches zipfile to support Enhanced Deflate
-from config import LIBRARY_BASE_PATH
+from config import LIBRARY_BASE_PATH, SCAN_HASHING_BLOCK_SIZE, SCAN_HASHING_PROCESSES
 from config.config_manager import config_manager as cm
 from exceptions.fs_exceptions import (
+    ArchiveExtractionException,
     RomAlreadyExistsException,
     RomsNotFoundException,
 )
 from handler.metadata.base_hander import UniversalPlatformSlug as UPS
+from logger.logger import log
 from models.platform import Platform
 from models.rom import Rom, RomFile, RomFileCategory
 from utils.archive_7zip import process_file_7z
@@ -27,14 +36,19 @@ from utils.filesystem import iter_files
 from utils.hashing import crc32_to_hex
 
 from .base_handler import (
+    EXTENSION_REGEX,
     LANGUAGES_BY_SHORTCODE,
     LANGUAGES_NAME_KEYS,
     REGIONS_BY_SHORTCODE,
     REGIONS_NAME_KEYS,
     TAG_REGEX,
     FSHandler,
+    get_exclusion_matcher,
 )
 
+if TYPE_CHECKING:
+    from adapters.services.rahasher import RAFileHasher
+
 # Known compressed file MIME types
 COMPRESSED_MIME_TYPES: Final = frozenset(
     (
@@ -88,7 +102,10 @@ NON_HASHABLE_PLATFORMS = frozenset(
     )
 )
 
-FILE_READ_CHUNK_SIZE = 1024 * 8
+FILE_READ_CHUNK_SIZE = SCAN_HASHING_BLOCK_SIZE
+
+REGION_TAG_REGEX = re.compile(r"^reg[\s|-](.*)$", re.IGNORECASE)
+REVISION_TAG_REGEX = re.compile(r"^rev[\s|-](.*)$", re.IGNORECASE)
 
 
 class FSRom(TypedDict):
@@ -101,12 +118,87 @@ class FSRom(TypedDict):
     ra_hash: str
 
 
+class FSRomName(TypedDict):
+    fs_name_no_tags: str
+    fs_name_no_ext: str
+    fs_extension: str
+    regions: list[str]
+    revision: str
+    languages: list[str]
+    tags: list[str]
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_fs_name(
+    fs_name: str,
+) -> tuple[str, str, str, tuple[str, ...], str, tuple[str, ...], tuple[str, ...]]:
+    """Derive all the fields of a rom file name in a single pass, memoized by name"""
+    extension_match = EXTENSION_REGEX.search(fs_name)
+    fs_extension = extension_match.group(1) if extension_match else ""
+    fs_name_no_ext = (
+        fs_name[: extension_match.start()] if extension_match else fs_name
+    ).strip()
+    tag_match = TAG_REGEX.search(fs_name_no_ext)
+    fs_name_no_tags = (
+        fs_name_no_ext[: tag_match.start()] if tag_match else fs_name_no_ext
+    ).strip()
+
+    revision = ""
+    regions: list[str] = []
+    languages: list[str] = []
+    other_tags: list[str] = []
+    for tag_match in TAG_REGEX.finditer(fs_name):
+        for tag in (tag_match.group(1) or tag_match.group(2)).split(","):
+            tag = tag.strip()
+            tag_lower = tag.lower()
+
+            if tag_lower in REGIONS_BY_SHORTCODE:
+                regions.append(REGIONS_BY_SHORTCODE[tag_lower])
+                continue
+
+            if tag_lower in REGIONS_NAME_KEYS:
+                regions.append(tag)
+                continue
+
+            if tag_lower in LANGUAGES_BY_SHORTCODE:
+                languages.append(LANGUAGES_BY_SHORTCODE[tag_lower])
+                continue
+
+            if tag_lower in LANGUAGES_NAME_KEYS:
+                languages.append(tag)
+                continue
+
+            if "reg" in tag_lower and (match := REGION_TAG_REGEX.match(tag)):
+                region = match.group(1)
+                regions.append(REGIONS_BY_SHORTCODE.get(region.lower(), region))
+                continue
+
+            if "rev" in tag_lower and (match := REVISION_TAG_REGEX.match(tag)):
+                revision = match.group(1)
+                continue
+
+            other_tags.append(tag)
+
+    return (
+        fs_name_no_tags,
+        fs_name_no_ext,
+        fs_extension,
+        tuple(regions),
+        revision,
+        tuple(languages),
+        tuple(other_tags),
+    )
+
+
 class FileHash(TypedDict):
     crc_hash: str
     md5_hash: str
     sha1_hash: str
 
 
+EMPTY_FILE_HASH: Final = FileHash(crc_hash="", md5_hash="", sha1_hash="")
+
+
 def is_compressed_file(file_path: str) -> bool:
     mime = magic.Magic(mime=True)
     file_type = mime.from_file(file_path)
@@ -116,20 +208,55 @@ def is_compressed_file(file_path: str) -> bool:
     )
 
 
-def read_basic_file(file_path: os.PathLike[str]) -> Iterator[bytes]:
-    with open(file_path, "rb") as f:
-        while chunk := f.read(FILE_READ_CHUNK_SIZE):
+def read_into_buffer(f: io.BufferedIOBase) -> Iterator[memoryview]:
+    """Read the file into a single reusable buffer, yielding views of the data read
+
+    The buffer is overwritten on each iteration, so chunks are only valid until the next one.
+    """
+    buffer = memoryview(bytearray(FILE_READ_CHUNK_SIZE))
+    while size := f.readinto(buffer):
+        with buffer[:size] as chunk:
             yield chunk
 
 
-def read_zip_file(file: str | os.PathLike[str] | IO[bytes]) -> Iterator[bytes]:
+def read_basic_file(
+    file_path: os.PathLike[str], use_mmap: bool = False
+) -> Iterator[Buffer]:
+    """Read the file in chunks, see read_into_buffer
+
+    Memory mapping the file saves copying the chunks, but reading a file truncated
+    while mapped raises SIGBUS. It's only used in the hashing processes, where that
+    kills the process and surfaces as a BrokenProcessPool instead of killing the worker.
+    """
+    with open(file_path, "rb") as f:
+        if not use_mmap:
+            yield from read_into_buffer(f)
+            return
+
+        try:
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty and special files can't be memory mapped
+            yield from read_into_buffer(f)
+            return
+
+        with mapped_file, memoryview(mapped_file) as view:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped_file.madvise(mmap.MADV_SEQUENTIAL)
+
+            for offset in range(0, len(view), FILE_READ_CHUNK_SIZE):
+                # Release each view before moving on, the map can't be closed otherwise
+                with view[offset : offset + FILE_READ_CHUNK_SIZE] as chunk:
+                    yield chunk
+
+
+def read_zip_file(file: str | os.PathLike[str] | IO[bytes]) -> Iterator[Buffer]:
     try:
         with zipfile.ZipFile(file, "r") as z:
             # Find the biggest file in the archive
             largest_file = max(z.infolist(), key=lambda x: x.file_size)
             with z.open(largest_file, "r") as f:
-                while chunk := f.read(FILE_READ_CHUNK_SIZE):
-                    yield chunk
+                yield from read_into_buffer(f)
     except zipfile.BadZipFile:
         if isinstance(file, Path):
             for chunk in read_basic_file(file):
@@ -138,7 +265,7 @@ def read_zip_file(file: str | os.PathLike[str] | IO[bytes]) -> Iterator[bytes]:
 
 def read_tar_file(
     file_path: Path, mode: Literal["r", "r:*", "r:", "r:gz", "r:bz2", "r:xz"] = "r"
-) -> Iterator[bytes]:
+) -> Iterator[Buffer]:
     try:
         with tarfile.open(file_path, mode) as f:
             regular_files = [member for member in f.getmembers() if member.isfile()]
@@ -146,20 +273,19 @@ def read_tar_file(
             # Find the largest file among regular files only
             largest_file = max(regular_files, key=lambda x: x.size)
             with f.extractfile(largest_file) as ef:  # type: ignore
-                while chunk := ef.read(FILE_READ_CHUNK_SIZE):
-                    yield chunk
+                yield from read_into_buffer(ef)
     except tarfile.ReadError:
         for chunk in read_basic_file(file_path):
             yield chunk
 
 
-def read_gz_file(file_path: Path) -> Iterator[bytes]:
+def read_gz_file(file_path: Path) -> Iterator[Buffer]:
     return read_tar_file(file_path, "r:gz")
 
 
 def process_7z_file(
     file_path: Path,
-    fn_hash_update: Callable[[bytes | bytearray], None],
+    fn_hash_update: Callable[[Buffer], None],
 ) -> None:
     processed = process_file_7z(
         file_path=file_path,
@@ -170,11 +296,10 @@ def process_7z_file(
             fn_hash_update(chunk)
 
 
-def read_bz2_file(file_path: Path) -> Iterator[bytes]:
+def read_bz2_file(file_path: Path) -> Iterator[Buffer]:
     try:
         with bz2.BZ2File(file_path, "rb") as f:
-            while chunk := f.read(FILE_READ_CHUNK_SIZE):
-                yield chunk
+            yield from read_into_buffer(f)
     except EOFError:
         for chunk in read_basic_file(file_path):
             yield chunk
@@ -189,9 +314,91 @@ DEFAULT_MD5_H_DIGEST = hashlib.md5(usedforsecurity=False).digest()
 DEFAULT_SHA1_H_DIGEST = hashlib.sha1(usedforsecurity=False).digest()
 
 
+def hash_rom_files(
+    file_paths: Sequence[Path],
+    ra_platform_id: int | None = None,
+    use_mmap: bool = False,
+) -> tuple[list[FileHash], str, str, str, str]:
+    """Calculate the hashes of each file, and of the whole rom made of all of them
+
+    Runs in the hashing process pool, so it only receives and returns picklable values.
+
+    Args:
+        file_paths: paths of the rom files
+        ra_platform_id: RetroAchievements platform ID, to calculate the RetroAchievements
+            hash of a single file rom in the same pass, when it doesn't need RAHasher
+        use_mmap: memory map the files to read them, only safe in the hashing processes
+    Returns:
+        tuple with the hashes of each file, and the crc, md5, sha1 and RetroAchievements
+        rom hashes; the RetroAchievements hash is empty when it wasn't calculated
+    """
+    from adapters.services.rahasher import RA_NATIVE_PLATFORM_IDS, RAFileHasher
+
+    file_hashes: list[FileHash] = []
+    rom_crc_c = 0
+    rom_md5_h = hashlib.md5(usedforsecurity=False)
+    rom_sha1_h = hashlib.sha1(usedforsecurity=False)
+    rom_ra_h = ""
+    rom_hashes_incomplete = False
+
+    for file_path in file_paths:
+        ra_h = None
+        if (
+            ra_platform_id in RA_NATIVE_PLATFORM_IDS
+            and len(file_paths) == 1
+            and file_path.is_file()
+        ):
+            ra_h = RAFileHasher(ra_platform_id, file_path.stat().st_size)
+
+        try:
+            crc_c, rom_crc_c, md5_h, rom_md5_h, sha1_h, rom_sha1_h = (
+                FSRomsHandler._calculate_rom_hashes(
+                    file_path, rom_crc_c, rom_md5_h, rom_sha1_h, ra_h, use_mmap
+                )
+            )
+            rom_ra_h = ra_h.hexdigest() if ra_h else ""
+        except zlib.error:
+            crc_c = 0
+            md5_h = hashlib.md5(usedforsecurity=False)
+            sha1_h = hashlib.sha1(usedforsecurity=False)
+        except ArchiveExtractionException as e:
+            log.error(e)
+            # The rom hashes were also fed part of the file, so none of them are kept
+            crc_c = 0
+            md5_h = hashlib.md5(usedforsecurity=False)
+            sha1_h = hashlib.sha1(usedforsecurity=False)
+            rom_hashes_incomplete = True
+
+        file_hashes.append(
+            FileHash(
+                crc_hash=crc32_to_hex(crc_c) if crc_c != DEFAULT_CRC_C else "",
+                md5_hash=(
+                    md5_h.hexdigest() if md5_h.digest() != DEFAULT_MD5_H_DIGEST else ""
+                ),
+                sha1_hash=(
+                    sha1_h.hexdigest()
+                    if sha1_h.digest() != DEFAULT_SHA1_H_DIGEST
+                    else ""
+                ),
+            )
+        )
+
+    if rom_hashes_incomplete:
+        return file_hashes, "", "", "", ""
+
+    return (
+        file_hashes,
+        crc32_to_hex(rom_crc_c) if rom_crc_c != DEFAULT_CRC_C else "",
+        rom_md5_h.hexdigest() if rom_md5_h.digest() != DEFAULT_MD5_H_DIGEST else "",
+        rom_sha1_h.hexdigest() if rom_sha1_h.digest() != DEFAULT_SHA1_H_DIGEST else "",
+        rom_ra_h,
+    )
+
+
 class FSRomsHandler(FSHandler):
     def __init__(self) -> None:
         super().__init__(base_path=LIBRARY_BASE_PATH)
+        self._hashing_pool: ProcessPoolExecutor | None = None
 
     def get_roms_fs_structure(self, fs_slug: str) -> str:
         cnfg = cm.get_config()
@@ -202,59 +409,52 @@ class FSRomsHandler(FSHandler):
         )
 
     def parse_tags(self, fs_name: str) -> tuple:
-        rev = ""
-        regs = []
-        langs = []
-        other_tags = []
-        tags = [tag[0] or tag[1] for tag in TAG_REGEX.findall(fs_name)]
-        tags = [tag for subtags in tags for tag in subtags.split(",")]
-        tags = [tag.strip() for tag in tags]
-
-        for tag in tags:
-            if tag.lower() in REGIONS_BY_SHORTCODE.keys():
-                regs.append(REGIONS_BY_SHORTCODE[tag.lower()])
-                continue
-
-            if tag.lower() in REGIONS_NAME_KEYS:
-                regs.append(tag)
-                continue
-
-            if tag.lower() in LANGUAGES_BY_SHORTCODE.keys():
-                langs.append(LANGUAGES_BY_SHORTCODE[tag.lower()])
-                continue
+        _, _, _, regions, revision, languages, other_tags = _parse_fs_name(fs_name)
+        return list(regions), revision, list(languages), list(other_tags)
 
-            if tag.lower() in LANGUAGES_NAME_KEYS:
-                langs.append(tag)
-                continue
+    def parse_fs_name(self, fs_name: str) -> FSRomName:
+        """Parse all the fields derived from a rom file name at once
 
-            if "reg" in tag.lower():
-                match = re.match(r"^reg[\s|-](.*)$", tag, re.IGNORECASE)
-                if match:
-                    regs.append(
-                        REGIONS_BY_SHORTCODE[match.group(1).lower()]
-                        if match.group(1).lower() in REGIONS_BY_SHORTCODE.keys()
-                        else match.group(1)
-                    )
-                    continue
+        Args:
+            fs_name: file name of the rom
+        Returns:
+            name without tags and extension, extension, regions, revision, languages and other tags
+        """
+        (
+            fs_name_no_tags,
+            fs_name_no_ext,
+            fs_extension,
+            regions,
+            revision,
+            languages,
+            other_tags,
+        ) = _parse_fs_name(fs_name)
+
+        return FSRomName(
+            fs_name_no_tags=fs_name_no_tags,
+            fs_name_no_ext=fs_name_no_ext,
+            fs_extension=fs_extension,
+            regions=list(regions),
+            revision=revision,
+            languages=list(languages),
+            tags=list(other_tags),
+        )
 
-            if "rev" in tag.lower():
-                match = re.match(r"^rev[\s|-](.*)$", tag, re.IGNORECASE)
-                if match:
-                    rev = match.group(1)
-                    continue
+    def parse_fs_names(self, fs_names: Iterable[str]) -> dict[str, FSRomName]:
+        """Parse the file names of a whole listing, like the one returned by get_roms
 
-            other_tags.append(tag)
-        return regs, rev, langs, other_tags
+        Args:
+            fs_names: file names of the roms
+        Returns:
+            dict with the parsed fields of each file name
+        """
+        return {fs_name: self.parse_fs_name(fs_name) for fs_name in fs_names}
 
     def _exclude_multi_roms(self, roms: list[str]) -> list[str]:
-        excluded_names = cm.get_config().EXCLUDED_MULTI_FILES
-        filtered_files: list = []
-
-        for rom in roms:
-            if rom in excluded_names:
-                filtered_files.append(rom)
-
-        return [f for f in roms if f not in filtered_files]
+        matcher = get_exclusion_matcher(
+            names=tuple(cm.get_config().EXCLUDED_MULTI_FILES), patterns=False
+        )
+        return matcher.filter(roms)
 
     def _build_rom_file(
         self, rom_path: Path, file_name: str, file_hash: FileHash
@@ -283,7 +483,55 @@ class FSRomsHandler(FSHandler):
             sha1_hash=file_hash["sha1_hash"],
         )
 
-    async def get_rom_files(self, rom: Rom) -> tuple[list[RomFile], str, str, str, str]:
+    def _get_unchanged_rom_file(
+        self, known_file: RomFile | None, abs_file_path: Path, hashable_platform: bool
+    ) -> RomFile | None:
+        """Return the stored file if its size and modification time still match the filesystem"""
+        if not known_file:
+            return None
+
+        if hashable_platform and not (
+            known_file.crc_hash or known_file.md5_hash or known_file.sha1_hash
+        ):
+            return None
+
+        try:
+            file_stat = os.stat(abs_file_path)
+        except OSError:
+            return None
+
+        if (
+            known_file.file_size_bytes == file_stat.st_size
+            and known_file.last_modified == file_stat.st_mtime
+        ):
+            return known_file
+
+        return None
+
+    def _build_unchanged_rom_file(self, rom_path: Path, known_file: RomFile) -> RomFile:
+        return self._build_rom_file(
+            rom_path,
+            known_file.file_name,
+            FileHash(
+                crc_hash=known_file.crc_hash or "",
+                md5_hash=known_file.md5_hash or "",
+                sha1_hash=known_file.sha1_hash or "",
+            ),
+        )
+
+    async def get_rom_files(
+        self, rom: Rom, known_files: Sequence[RomFile] = ()
+    ) -> tuple[list[RomFile], str, str, str, str]:
+        """Build the rom files and calculate the rom hashes
+
+        Args:
+            rom: rom to build the files for
+            known_files: files stored for the rom in a previous scan; when a file still has
+                the same path, size and modification time, its stored hashes are reused
+                instead of reading the file again
+        Returns:
+            tuple with the rom files, and the crc, md5, sha1 and RetroAchievements rom hashes
+        """
         from adapters.services.rahasher import RAHasherService
         from handler.metadata import meta_ra_handler
 
@@ -296,16 +544,65 @@ class FSRomsHandler(FSHandler):
         # Skip hashing games for platforms that don't have a hash database
         hashable_platform = rom.platform_slug not in NON_HASHABLE_PLATFORMS
 
-        excluded_file_names = cm.get_config().EXCLUDED_MULTI_PARTS_FILES
-        excluded_file_exts = cm.get_config().EXCLUDED_MULTI_PARTS_EXT
+        cnfg = cm.get_config()
+        parts_matcher = get_exclusion_matcher(
+            names=tuple(cnfg.EXCLUDED_MULTI_PARTS_FILES),
+            extensions=tuple(cnfg.EXCLUDED_MULTI_PARTS_EXT),
+        )
+
+        known_files_by_path = {
+            (known_file.file_path, known_file.file_name): known_file
+            for known_file in known_files
+        }
 
-        rom_crc_c = 0
-        rom_md5_h = hashlib.md5(usedforsecurity=False)
-        rom_sha1_h = hashlib.sha1(usedforsecurity=False)
+        rom_crc_h = ""
+        rom_md5_h = ""
+        rom_sha1_h = ""
         rom_ra_h = ""
 
         # Check if rom is a multi-part rom
         if os.path.isdir(f"{abs_fs_path}/{rom.fs_name}"):
+            rom_parts: list[tuple[Path, str]] = [
+                (f_path, file_name)
+                for f_path, file_name in iter_files(
+                    f"{abs_fs_path}/{rom.fs_name}", recursive=True
+                )
+                if not parts_matcher.is_excluded(file_name)
+            ]
+
+            # The whole rom hashes are calculated over every part, so they can only
+            # be reused when none of the parts changed since the last scan
+            unchanged_files = [
+                self._get_unchanged_rom_file(
+                    known_files_by_path.get(
+                        (str(f_path.relative_to(self.base_path)), file_name)
+                    ),
+                    Path(f_path, file_name),
+                    hashable_platform,
+                )
+                for f_path, file_name in rom_parts
+            ]
+            if (
+                rom_parts
+                and len(rom_parts) == len(known_files_by_path)
+                and all(unchanged_files)
+            ):
+                return (
+                    [
+                        self._build_unchanged_rom_file(
+                            f_path.relative_to(self.base_path), known_file
+                        )
+                        for (f_path, _), known_file in zip(
+                            rom_parts, unchanged_files, strict=True
+                        )
+                        if known_file
+                    ],
+                    rom.crc_hash or "",
+                    rom.md5_hash or "",
+                    rom.sha1_hash or "",
+                    rom.ra_hash or "",
+                )
+
             # Calculate the RA hash if the platform has a slug that matches a known RA slug
             ra_platform = meta_ra_handler.get_platform(rom.platform_slug)
             if ra_platform and ra_platform["ra_id"]:
@@ -314,55 +611,18 @@ class FSRomsHandler(FSHandler):
                     f"{abs_fs_path}/{rom.fs_name}/*",
                 )
 
-            for f_path, file_name in iter_files(
-                f"{abs_fs_path}/{rom.fs_name}", recursive=True
-            ):
-                # Check if file is excluded
-                ext = self.parse_file_extension(file_name)
-                if ext in excluded_file_exts:
-                    continue
-
-                if any(
-                    file_name == exc_name or fnmatch.fnmatch(file_name, exc_name)
-                    for exc_name in excluded_file_names
-                ):
-                    continue
-
-                if hashable_platform:
-                    try:
-                        crc_c, rom_crc_c, md5_h, rom_md5_h, sha1_h, rom_sha1_h = (
-                            self._calculate_rom_hashes(
-                                Path(f_path, file_name),
-                                rom_crc_c,
-                                rom_md5_h,
-                                rom_sha1_h,
-                            )
-                        )
-                    except zlib.error:
-                        crc_c = 0
-                        md5_h = hashlib.md5(usedforsecurity=False)
-                        sha1_h = hashlib.sha1(usedforsecurity=False)
-
-                    file_hash = FileHash(
-                        crc_hash=crc32_to_hex(crc_c) if crc_c != DEFAULT_CRC_C else "",
-                        md5_hash=(
-                            md5_h.hexdigest()
-                            if md5_h.digest() != DEFAULT_MD5_H_DIGEST
-                            else ""
-                        ),
-                        sha1_hash=(
-                            sha1_h.hexdigest()
-                            if sha1_h.digest() != DEFAULT_SHA1_H_DIGEST
-                            else ""
-                        ),
-                    )
-                else:
-                    file_hash = FileHash(
-                        crc_hash="",
-                        md5_hash="",
-                        sha1_hash="",
+            if hashable_platform:
+                file_hashes, rom_crc_h, rom_md5_h, rom_sha1_h, _ = (
+                    await self._hash_rom_files(
+                        [Path(f_path, file_name) for f_path, file_name in rom_parts]
                     )
+                )
+            else:
+                file_hashes = [EMPTY_FILE_HASH] * len(rom_parts)
 
+            for (f_path, file_name), file_hash in zip(
+                rom_parts, file_hashes, strict=True
+            ):
                 rom_files.append(
                     self._build_rom_file(
                         f_path.relative_to(self.base_path),
@@ -370,68 +630,108 @@ class FSRomsHandler(FSHandler):
                         file_hash,
                     )
                 )
-        elif hashable_platform:
-            try:
-                crc_c, rom_crc_c, md5_h, rom_md5_h, sha1_h, rom_sha1_h = (
-                    self._calculate_rom_hashes(
-                        Path(abs_fs_path, rom.fs_name), rom_crc_c, rom_md5_h, rom_sha1_h
+        elif unchanged_file := self._get_unchanged_rom_file(
+            known_files_by_path.get((rel_roms_path, rom.fs_name)),
+            Path(abs_fs_path, rom.fs_name),
+            hashable_platform,
+        ):
+            rom_ra_h = rom.ra_hash or ""
+            if hashable_platform and not rom_ra_h:
+                ra_platform = meta_ra_handler.get_platform(rom.platform_slug)
+                if ra_platform and ra_platform["ra_id"]:
+                    rom_ra_h = await RAHasherService().calculate_hash(
+                        ra_platform["ra_id"],
+                        f"{abs_fs_path}/{rom.fs_name}",
                     )
-                )
-            except zlib.error:
-                crc_c = 0
-                md5_h = hashlib.md5(usedforsecurity=False)
-                sha1_h = hashlib.sha1(usedforsecurity=False)
 
+            # A single file rom shares its hashes with the file itself
+            rom_files.append(
+                self._build_unchanged_rom_file(Path(rel_roms_path), unchanged_file)
+            )
+            return (
+                rom_files,
+                unchanged_file.crc_hash or "",
+                unchanged_file.md5_hash or "",
+                unchanged_file.sha1_hash or "",
+                rom_ra_h,
+            )
+        elif hashable_platform:
             # Calculate the RA hash if the platform has a slug that matches a known RA slug
             ra_platform = meta_ra_handler.get_platform(rom.platform_slug)
-            if ra_platform and ra_platform["ra_id"]:
+            ra_platform_id = ra_platform["ra_id"] if ra_platform else None
+
+            (file_hash,), rom_crc_h, rom_md5_h, rom_sha1_h, rom_ra_h = (
+                await self._hash_rom_files(
+                    [Path(abs_fs_path, rom.fs_name)], ra_platform_id
+                )
+            )
+
+            # Fall back to RAHasher when the RA hash couldn't be calculated in the same pass
+            if ra_platform_id and not rom_ra_h:
                 rom_ra_h = await RAHasherService().calculate_hash(
-                    ra_platform["ra_id"],
+                    ra_platform_id,
                     f"{abs_fs_path}/{rom.fs_name}",
                 )
 
-            file_hash = FileHash(
-                crc_hash=crc32_to_hex(crc_c) if crc_c != DEFAULT_CRC_C else "",
-                md5_hash=(
-                    md5_h.hexdigest() if md5_h.digest() != DEFAULT_MD5_H_DIGEST else ""
-                ),
-                sha1_hash=(
-                    sha1_h.hexdigest()
-                    if sha1_h.digest() != DEFAULT_SHA1_H_DIGEST
-                    else ""
-                ),
-            )
             rom_files.append(
                 self._build_rom_file(Path(rel_roms_path), rom.fs_name, file_hash)
             )
         else:
-            file_hash = FileHash(
-                crc_hash="",
-                md5_hash="",
-                sha1_hash="",
-            )
             rom_files.append(
-                self._build_rom_file(Path(rel_roms_path), rom.fs_name, file_hash)
+                self._build_rom_file(Path(rel_roms_path), rom.fs_name, EMPTY_FILE_HASH)
             )
 
-        return (
-            rom_files,
-            crc32_to_hex(rom_crc_c) if rom_crc_c != DEFAULT_CRC_C else "",
-            rom_md5_h.hexdigest() if rom_md5_h.digest() != DEFAULT_MD5_H_DIGEST else "",
-            (
-                rom_sha1_h.hexdigest()
-                if rom_sha1_h.digest() != DEFAULT_SHA1_H_DIGEST
-                else ""
-            ),
-            rom_ra_h,
-        )
+        return rom_files, rom_crc_h, rom_md5_h, rom_sha1_h, rom_ra_h
+
+    def _get_hashing_pool(self) -> ProcessPoolExecutor:
+        if self._hashing_pool is None:
+            self._hashing_pool = ProcessPoolExecutor(
+                max_workers=SCAN_HASHING_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+                # Spawned processes start with a clean interpreter, load the metadata
+                # handlers first to avoid a circular import with this module
+                initializer=importlib.import_module,
+                initargs=("handler.metadata",),
+            )
+
+        return self._hashing_pool
+
+    async def _hash_rom_files(
+        self, file_paths: list[Path], ra_platform_id: int | None = None
+    ) -> tuple[list[FileHash], str, str, str, str]:
+        """Hash the rom files outside of the event loop
 
+        Files are hashed in the hashing process pool when SCAN_HASHING_PROCESSES is set,
+        and in a worker thread otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        if SCAN_HASHING_PROCESSES <= 0:
+            return await loop.run_in_executor(
+                None, hash_rom_files, file_paths, ra_platform_id
+            )
+
+        # A file truncated while mapped only kills the hashing process
+        hash_in_process = functools.partial(hash_rom_files, use_mmap=True)
+        try:
+            return await loop.run_in_executor(
+                self._get_hashing_pool(), hash_in_process, file_paths, ra_platform_id
+            )
+        except BrokenProcessPool:
+            # A hashing process died (e.g. killed by the OOM killer), start a new pool
+            log.warning("Hashing process pool is broken, restarting it")
+            self._hashing_pool = None
+            return await loop.run_in_executor(
+                self._get_hashing_pool(), hash_in_process, file_paths, ra_platform_id
+            )
+
+    @staticmethod
     def _calculate_rom_hashes(
-        self,
         file_path: Path,
         rom_crc_c: int,
         rom_md5_h: Any,
         rom_sha1_h: Any,
+        ra_h: "RAFileHasher | None" = None,
+        use_mmap: bool = False,
     ) -> tuple[int, int, Any, Any, Any, Any]:
         extension = Path(file_path).suffix.lower()
         mime = magic.Magic(mime=True)
@@ -442,7 +742,7 @@ class FSRomsHandler(FSHandler):
             md5_h = hashlib.md5(usedforsecurity=False)
             sha1_h = hashlib.sha1(usedforsecurity=False)
 
-            def update_hashes(chunk: bytes | bytearray):
+            def update_hashes(chunk: Buffer):
                 md5_h.update(chunk)
                 rom_md5_h.update(chunk)
 
@@ -477,8 +777,12 @@ class FSRomsHandler(FSHandler):
                     update_hashes(chunk)
 
             else:
-                for chunk in read_basic_file(file_path):
+                for chunk in read_basic_file(file_path, use_mmap):
                     update_hashes(chunk)
+                    # RetroAchievements hashes compressed files as they are, so only
+                    # plain files can share this pass
+                    if ra_h:
+                        ra_h.update(chunk)
 
             return crc_c, rom_crc_c, md5_h, rom_md5_h, sha1_h, rom_sha1_h
         except (FileNotFoundError, PermissionError):
@@ -509,6 +813,40 @@ class FSRomsHandler(FSHandler):
         except FileNotFoundError as e:
             raise RomsNotFoundException(platform=platform.fs_slug) from e
 
+        return self._build_fs_roms(fs_single_roms, fs_multi_roms)
+
+    async def get_roms_by_fs_name(
+        self, platform: Platform, fs_names: Iterable[str]
+    ) -> list[FSRom]:
+        """Gets the filesystem roms of a platform with the given names, without listing
+        the whole platform folder
+
+        Args:
+            platform: platform where roms belong
+            fs_names: names of the roms in the platform folder
+        Returns:
+            list with the filesystem roms found, missing roms are left out
+        """
+        rel_roms_path = self.get_roms_fs_structure(platform.fs_slug)
+
+        fs_single_roms: list[str] = []
+        fs_multi_roms: list[str] = []
+        for fs_name in fs_names:
+            try:
+                rom_path = self.validate_path(f"{rel_roms_path}/{fs_name}")
+            except ValueError:
+                continue
+
+            if rom_path.is_dir():
+                fs_multi_roms.append(fs_name)
+            elif rom_path.is_file():
+                fs_single_roms.append(fs_name)
+
+        return self._build_fs_roms(fs_single_roms, fs_multi_roms)
+
+    def _build_fs_roms(
+        self, fs_single_roms: list[str], fs_multi_roms: list[str]
+    ) -> list[FSRom]:
         fs_roms: list[dict] = [
             {"multi": False, "fs_name": rom}
             for rom in self.exclude_single_files(fs_single_roms)
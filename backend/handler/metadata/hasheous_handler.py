@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import Any, NotRequired, TypedDict
+from typing import Any, Final, NotRequired, TypedDict
 
 import httpx
 import pydash
@@ -9,7 +9,9 @@ from fastapi import HTTPException, status
 from logger.logger import log
 from models.rom import RomFile
 from utils import get_version
+from utils.cache import cached_api_response, scan_memoized
 from utils.context import ctx_httpx_client
+from utils.rate_limiter import ProviderRateLimiter, parse_retry_after
 
 from .base_hander import BaseRom, MetadataHandler
 from .base_hander import UniversalPlatformSlug as UPS
@@ -20,6 +22,10 @@ from .igdb_handler import (
 )
 from .ra_handler import RAMetadata
 
+RATE_LIMITER: Final = ProviderRateLimiter(
+    "hasheous", requests_per_second=5, max_concurrency=4
+)
+
 
 class HasheousMetadata(TypedDict):
     tosec_match: bool
@@ -123,6 +129,7 @@ class HasheousHandler(MetadataHandler):
             else "JNoFBA-jEh4HbxuxEHM6MVzydKoAXs9eCcp2dvcg5LRCnpp312voiWmjuaIssSzS"
         )
 
+    @cached_api_response("hasheous", ttl=7 * 24 * 60 * 60)
     async def _request(
         self,
         url: str,
@@ -163,7 +170,8 @@ class HasheousHandler(MetadataHandler):
                 request_kwargs["json"] = data
 
             # Make the request
-            res = await httpx_client.request(method, **request_kwargs)
+            async with RATE_LIMITER.acquire():
+                res = await httpx_client.request(method, **request_kwargs)
 
             res.raise_for_status()
             return res.json()
@@ -172,6 +180,10 @@ class HasheousHandler(MetadataHandler):
             if exc.response.status_code == status.HTTP_404_NOT_FOUND:
                 log.debug("Game not found in Hasheous API")
                 return {}
+            if exc.response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+                # Pause the following requests until the provider accepts them again
+                await RATE_LIMITER.throttle(parse_retry_after(exc.response.headers))
+                return {}
 
             log.error(
                 "Hasheous API returned an error: %s %s",
@@ -208,6 +220,23 @@ class HasheousHandler(MetadataHandler):
             ra_id=platform["ra_id"],
         )
 
+    @scan_memoized(
+        "hasheous",
+        key=lambda self, platform_slug, files: [
+            platform_slug,
+            [
+                (
+                    file.file_name,
+                    file.file_size_bytes,
+                    file.md5_hash,
+                    file.sha1_hash,
+                    file.crc_hash,
+                )
+                for file in files
+            ],
+        ],
+        found=lambda rom: bool(rom.get("hasheous_id")),
+    )
     async def lookup_rom(self, platform_slug: str, files: list[RomFile]) -> HasheousRom:
         fallback_rom = HasheousRom(
             hasheous_id=None, igdb_id=None, tgdb_id=None, ra_id=None
@@ -1,17 +1,26 @@
+import asyncio
 import functools
 import json
 import re
+import weakref
 from typing import Final, NotRequired, TypedDict
 
 import httpx
 import pydash
 from adapters.services.igdb_types import GameType
-from config import IGDB_CLIENT_ID, IGDB_CLIENT_SECRET, IS_PYTEST_RUN
+from config import (
+    ENABLE_IGDB_SPECULATIVE_SEARCH,
+    IGDB_CLIENT_ID,
+    IGDB_CLIENT_SECRET,
+    IS_PYTEST_RUN,
+)
 from fastapi import HTTPException, status
 from handler.redis_handler import async_cache
 from logger.logger import log
 from unidecode import unidecode as uc
+from utils.cache import cached_api_response, scan_memoized
 from utils.context import ctx_httpx_client
+from utils.rate_limiter import ProviderRateLimiter, parse_retry_after
 
 from .base_hander import (
     PS2_OPL_REGEX,
@@ -26,6 +35,14 @@ from .base_hander import UniversalPlatformSlug as UPS
 # Used to display the IGDB API status in the frontend
 IGDB_API_ENABLED: Final = bool(IGDB_CLIENT_ID) and bool(IGDB_CLIENT_SECRET)
 
+# Time to wait for concurrent lookups by id, before requesting them all at once
+GAMES_BY_ID_BATCH_WINDOW: Final = 0.05
+
+# Reference: https://api-docs.igdb.com/#rate-limits
+RATE_LIMITER: Final = ProviderRateLimiter(
+    "igdb", requests_per_second=4, max_concurrency=8
+)
+
 PS1_IGDB_ID: Final = 7
 PS2_IGDB_ID: Final = 8
 PSP_IGDB_ID: Final = 38
@@ -223,6 +240,11 @@ class IGDBHandler(MetadataHandler):
             "Client-ID": IGDB_CLIENT_ID,
             "Accept": "application/json",
         }
+        # Pending lookups by id, per event loop since futures are bound to one
+        self._games_by_id_batches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[int, asyncio.Future[dict | None]]
+        ] = weakref.WeakKeyDictionary()
+        self._batch_tasks: set[asyncio.Task] = set()
 
     @staticmethod
     def check_twitch_token(func):
@@ -234,6 +256,7 @@ class IGDBHandler(MetadataHandler):
 
         return wrapper
 
+    @cached_api_response("igdb", ttl=7 * 24 * 60 * 60)
     async def _request(self, url: str, data: str) -> list:
         httpx_client = ctx_httpx_client.get()
         masked_headers = {}
@@ -247,12 +270,13 @@ class IGDBHandler(MetadataHandler):
                 f"{data} limit {self.pagination_limit};",
                 120,
             )
-            res = await httpx_client.post(
-                url,
-                content=f"{data} limit {self.pagination_limit};",
-                headers=self.headers,
-                timeout=120,
-            )
+            async with RATE_LIMITER.acquire():
+                res = await httpx_client.post(
+                    url,
+                    content=f"{data} limit {self.pagination_limit};",
+                    headers=self.headers,
+                    timeout=120,
+                )
 
             res.raise_for_status()
             return res.json()
@@ -276,15 +300,17 @@ class IGDBHandler(MetadataHandler):
                 detail="Can't connect to IGDB, check your internet connection",
             ) from exc
         except httpx.HTTPStatusError as exc:
-            # Retry once if the auth token is invalid
-            if exc.response.status_code != 401:
+            # Retry once if the rate limit is hit or the auth token is invalid
+            if exc.response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+                await RATE_LIMITER.throttle(parse_retry_after(exc.response.headers))
+            elif exc.response.status_code != 401:
                 log.error(exc)
                 return []  # All requests to the IGDB API return a list
-
-            # Attempt to force a token refresh if the token is invalid
-            log.info("Twitch token invalid: fetching a new one...")
-            token = await self.twitch_auth._update_twitch_token()
-            self.headers["Authorization"] = f"Bearer {token}"
+            else:
+                # Attempt to force a token refresh if the token is invalid
+                log.info("Twitch token invalid: fetching a new one...")
+                token = await self.twitch_auth._update_twitch_token()
+                self.headers["Authorization"] = f"Bearer {token}"
         except json.decoder.JSONDecodeError as exc:
             # Log the error and return an empty list if the response is not valid JSON
             log.error(exc)
@@ -301,12 +327,13 @@ class IGDBHandler(MetadataHandler):
                 f"{data} limit {self.pagination_limit};",
                 120,
             )
-            res = await httpx_client.post(
-                url,
-                content=f"{data} limit {self.pagination_limit};",
-                headers=self.headers,
-                timeout=120,
-            )
+            async with RATE_LIMITER.acquire():
+                res = await httpx_client.post(
+                    url,
+                    content=f"{data} limit {self.pagination_limit};",
+                    headers=self.headers,
+                    timeout=120,
+                )
             res.raise_for_status()
             return res.json()
         except (httpx.HTTPError, json.decoder.JSONDecodeError) as exc:
@@ -314,12 +341,9 @@ class IGDBHandler(MetadataHandler):
             log.error(exc)
             return []
 
-    async def _search_rom(
+    async def _search_games(
         self, search_term: str, platform_igdb_id: int, with_game_type: bool = False
     ) -> dict | None:
-        if not platform_igdb_id:
-            return None
-
         if with_game_type:
             categories = (
                 GameType.EXPANDED_GAME,
@@ -356,6 +380,11 @@ class IGDBHandler(MetadataHandler):
             )
             return games_by_name[best_match]
 
+        return None
+
+    async def _search_expanded(
+        self, search_term: str, platform_igdb_id: int
+    ) -> dict | None:
         log.debug("Searching expanded in search endpoint")
         roms_expanded = await self._request(
             self.search_endpoint,
@@ -387,10 +416,45 @@ class IGDBHandler(MetadataHandler):
                 )
                 return extra_games_by_name[best_match]
 
-            roms.extend(extra_roms)
-
         return None
 
+    async def _search_rom(
+        self, search_term: str, platform_igdb_id: int, with_game_type: bool = False
+    ) -> dict | None:
+        if not platform_igdb_id:
+            return None
+
+        return await self._search_games(
+            search_term, platform_igdb_id, with_game_type
+        ) or await self._search_expanded(search_term, platform_igdb_id)
+
+    async def _search_rom_speculatively(
+        self, search_term: str, platform_igdb_id: int
+    ) -> dict | None:
+        """Run the search strategies of get_rom concurrently
+
+        The matches are taken in the same order as the sequential search, so the
+        result is the same: once a strategy matches, the following ones are cancelled.
+        """
+        if not platform_igdb_id:
+            return None
+
+        strategies = [
+            asyncio.create_task(
+                self._search_games(search_term, platform_igdb_id, with_game_type=True)
+            ),
+            asyncio.create_task(self._search_expanded(search_term, platform_igdb_id)),
+            asyncio.create_task(self._search_games(search_term, platform_igdb_id)),
+        ]
+        try:
+            for strategy in strategies:
+                if rom := await strategy:
+                    return rom
+            return None
+        finally:
+            for strategy in strategies:
+                strategy.cancel()
+
     # @check_twitch_token
     # async def get_platforms(self) -> None:
     #     platforms = await self._request(
@@ -506,11 +570,17 @@ class IGDBHandler(MetadataHandler):
 
         search_term = self.normalize_search_term(search_term)
 
-        log.debug("Searching for %s on IGDB with game_type", search_term)
-        rom = await self._search_rom(search_term, platform_igdb_id, with_game_type=True)
-        if not rom:
-            log.debug("Searching for %s on IGDB without game_type", search_term)
-            rom = await self._search_rom(search_term, platform_igdb_id)
+        if ENABLE_IGDB_SPECULATIVE_SEARCH:
+            log.debug("Searching for %s on IGDB concurrently", search_term)
+            rom = await self._search_rom_speculatively(search_term, platform_igdb_id)
+        else:
+            log.debug("Searching for %s on IGDB with game_type", search_term)
+            rom = await self._search_rom(
+                search_term, platform_igdb_id, with_game_type=True
+            )
+            if not rom:
+                log.debug("Searching for %s on IGDB without game_type", search_term)
+                rom = await self._search_rom(search_term, platform_igdb_id)
 
         # IGDB search is fuzzy so no need to split the search term by special characters
         if not rom:
@@ -531,16 +601,59 @@ class IGDBHandler(MetadataHandler):
             igdb_metadata=extract_metadata_from_igdb_rom(self, rom),
         )
 
+    async def _fetch_games_by_id(
+        self, batch: dict[int, asyncio.Future[dict | None]]
+    ) -> None:
+        await asyncio.sleep(GAMES_BY_ID_BATCH_WINDOW)
+
+        # Close the batch, later lookups start a new one
+        loop = asyncio.get_running_loop()
+        if self._games_by_id_batches.get(loop) is batch:
+            del self._games_by_id_batches[loop]
+
+        igdb_ids = ",".join(str(igdb_id) for igdb_id in sorted(batch))
+        try:
+            games = await self._request(
+                self.games_endpoint,
+                f'fields {",".join(self.games_fields)}; where id=({igdb_ids});',
+            )
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        games_by_id = {game["id"]: game for game in games}
+        for igdb_id, future in batch.items():
+            if not future.done():
+                future.set_result(games_by_id.get(igdb_id))
+
+    def _get_game_by_id(self, igdb_id: int) -> asyncio.Future[dict | None]:
+        """Queue the lookup of a game by id
+
+        Lookups made within a short window, e.g. by the roms identified concurrently
+        during a scan, are resolved together in a single request.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._games_by_id_batches.get(loop)
+        if batch is None or len(batch) >= self.pagination_limit:
+            batch = self._games_by_id_batches[loop] = {}
+            task = loop.create_task(self._fetch_games_by_id(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+        if igdb_id not in batch:
+            batch[igdb_id] = loop.create_future()
+        return batch[igdb_id]
+
     @check_twitch_token
+    @scan_memoized("igdb", found=lambda rom: bool(rom.get("igdb_id")))
     async def get_rom_by_id(self, igdb_id: int) -> IGDBRom:
         if not IGDB_API_ENABLED:
             return IGDBRom(igdb_id=None)
 
-        roms = await self._request(
-            self.games_endpoint,
-            f'fields {",".join(self.games_fields)}; where id={igdb_id};',
-        )
-        rom = pydash.get(roms, "[0]", None)
+        # The lookup is shared with other callers, so it must not be cancelled
+        rom = await asyncio.shield(self._get_game_by_id(igdb_id))
 
         if not rom:
             return IGDBRom(igdb_id=None)
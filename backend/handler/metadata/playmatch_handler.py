@@ -9,6 +9,7 @@ from fastapi import HTTPException, status
 from logger.logger import log
 from models.rom import RomFile
 from utils import get_version
+from utils.cache import cached_api_response, scan_memoized
 from utils.context import ctx_httpx_client
 
 
@@ -47,6 +48,7 @@ class PlaymatchHandler:
         self.base_url = "https://playmatch.retrorealm.dev/api"
         self.identify_url = f"{self.base_url}/identify/ids"
 
+    @cached_api_response("playmatch", ttl=7 * 24 * 60 * 60)
     async def _request(self, url: str, query: dict) -> dict:
         """
         Sends a Request to Playmatch API.
@@ -92,6 +94,14 @@ class PlaymatchHandler:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
             return {}
 
+    @scan_memoized(
+        "playmatch",
+        key=lambda self, files: [
+            (file.file_name, file.file_size_bytes, file.md5_hash, file.sha1_hash)
+            for file in files
+        ],
+        found=lambda match: bool(match.get("igdb_id")),
+    )
     async def lookup_rom(self, files: list[RomFile]) -> PlaymatchRomMatch:
         """
         Identify a ROM file using Playmatch API.
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import time
@@ -15,6 +16,7 @@ from config import (
     RETROACHIEVEMENTS_API_KEY,
 )
 from handler.filesystem import fs_resource_handler
+from handler.redis_handler import async_cache
 from models.rom import Rom
 
 from .base_hander import BaseRom, MetadataHandler
@@ -23,6 +25,10 @@ from .base_hander import UniversalPlatformSlug as UPS
 # Used to display the Retroachievements API status in the frontend
 RA_API_ENABLED: Final = bool(RETROACHIEVEMENTS_API_KEY)
 
+RA_HASHES_INDEX_KEY: Final = "romm:ra_hashes_index"
+# Always set in the index, so platforms without any hash still have one
+RA_HASHES_INDEX_UPDATED_AT_FIELD: Final = "updated_at"
+
 
 class RAGamesPlatform(TypedDict):
     slug: str
@@ -123,6 +129,7 @@ class RAHandler(MetadataHandler):
     def __init__(self) -> None:
         self.ra_service = RetroAchievementsService()
         self.HASHES_FILE_NAME = "ra_hashes.json"
+        self._hashes_index_locks: dict[int, asyncio.Lock] = {}
 
     def _get_hashes_file_path(self, platform_id: int) -> str:
         platform_resources_path = fs_resource_handler.get_platform_resources_path(
@@ -143,26 +150,27 @@ class RAHandler(MetadataHandler):
         full_path = fs_resource_handler.validate_path(file_path)
         return int((time.time() - os.path.getmtime(full_path)) / (24 * 3600))
 
-    async def _search_rom(self, rom: Rom, ra_hash: str) -> RAGameListItem | None:
-        if not rom.platform.ra_id:
-            return None
+    def _get_hashes_index_key(self, platform_id: int) -> str:
+        return f"{RA_HASHES_INDEX_KEY}:{platform_id}"
 
+    async def _update_hashes_index(self, platform_id: int, ra_id: int) -> None:
         # Fetch all hashes for specific platform
         roms: list[RAGameListItem]
+        days_since_update = await self._days_since_last_cache_file_update(platform_id)
         if (
-            REFRESH_RETROACHIEVEMENTS_CACHE_DAYS
-            <= await self._days_since_last_cache_file_update(rom.platform.id)
-            or not await self._exists_cache_file(rom.platform.id)
+            REFRESH_RETROACHIEVEMENTS_CACHE_DAYS <= days_since_update
+            or not await self._exists_cache_file(platform_id)
         ):
             # Write the roms result to a JSON file if older than REFRESH_RETROACHIEVEMENTS_CACHE_DAYS days
             roms = await self.ra_service.get_game_list(
-                system_id=rom.platform.ra_id,
+                system_id=ra_id,
                 only_games_with_achievements=True,
                 include_hashes=True,
             )
+            days_since_update = 0
 
             platform_resources_path = fs_resource_handler.get_platform_resources_path(
-                rom.platform.id
+                platform_id
             )
 
             json_file = json.dumps(roms, indent=4)
@@ -174,16 +182,44 @@ class RAHandler(MetadataHandler):
         else:
             # Read the roms result from the JSON file
             json_file_bytes = await fs_resource_handler.read_file(
-                self._get_hashes_file_path(rom.platform.id)
+                self._get_hashes_file_path(platform_id)
             )
             roms = json.loads(json_file_bytes.decode("utf-8"))
 
-        ra_hash_lower = ra_hash.lower()
+        # Index the games by hash, so each rom is a single lookup
+        index: dict[str, str] = {RA_HASHES_INDEX_UPDATED_AT_FIELD: str(time.time())}
         for r in roms:
-            if any(ra_hash_lower == h.lower() for h in r.get("Hashes", ())):
-                return r
+            game = json.dumps(r)
+            for h in r.get("Hashes", ()):
+                index[h.lower()] = game
+
+        index_key = self._get_hashes_index_key(platform_id)
+        days_until_refresh = REFRESH_RETROACHIEVEMENTS_CACHE_DAYS - days_since_update
+        async with async_cache.pipeline() as pipe:
+            await pipe.delete(index_key)
+            await pipe.hset(index_key, mapping=index)
+            # Expire the index along with the JSON file, so it's rebuilt on refresh
+            await pipe.expire(index_key, max(days_until_refresh * 24 * 3600, 1))
+            await pipe.execute()
+
+    async def _search_rom(self, rom: Rom, ra_hash: str) -> RAGameListItem | None:
+        if not rom.platform.ra_id:
+            return None
+
+        index_key = self._get_hashes_index_key(rom.platform.id)
+        if not await async_cache.exists(index_key):
+            # Concurrent lookups for the same platform wait for a single index update
+            async with self._hashes_index_locks.setdefault(
+                rom.platform.id, asyncio.Lock()
+            ):
+                if not await async_cache.exists(index_key):
+                    await self._update_hashes_index(rom.platform.id, rom.platform.ra_id)
+
+        index_entry = await async_cache.hget(index_key, ra_hash.lower())
+        if not index_entry:
+            return None
 
-        return None
+        return json.loads(index_entry)
 
     def get_platform(self, slug: str) -> RAGamesPlatform:
         if slug not in RA_PLATFORM_LIST:
@@ -50,51 +50,85 @@ class SGDBBaseHandler(MetadataHandler):
 
         return list(filter(None, results))
 
+    async def get_details_by_name(self, game_name: str) -> SGDBRom:
+        if not STEAMGRIDDB_API_ENABLED:
+            return SGDBRom(sgdb_id=None)
+
+        search_term = self.normalize_search_term(game_name, remove_articles=False)
+        games = await self.sgdb_service.search_games(term=search_term)
+        if not games:
+            log.debug(f"Could not find '{search_term}' on SteamGridDB")
+            return SGDBRom(sgdb_id=None)
+
+        games_by_name: dict[str, SGDBGame] = {}
+        for game in games:
+            if (
+                game["name"] not in games_by_name
+                or game["id"] < games_by_name[game["name"]]["id"]
+            ):
+                games_by_name[game["name"]] = game
+
+        best_match, best_score = self.find_best_match(
+            search_term,
+            list(games_by_name.keys()),
+            min_similarity_score=self.min_similarity_score,
+        )
+        if not best_match:
+            return SGDBRom(sgdb_id=None)
+
+        game_details = await self._get_game_covers(
+            game_id=games_by_name[best_match]["id"],
+            game_name=games_by_name[best_match]["name"],
+            types=(SGDBType.STATIC,),
+            is_nsfw=False,
+            is_humor=False,
+            is_epilepsy=False,
+        )
+
+        first_resource = next(
+            (res for res in game_details["resources"] if res["url"]), None
+        )
+        if not first_resource:
+            return SGDBRom(sgdb_id=None)
+
+        log.debug(
+            f"Found match for '{search_term}' -> '{best_match}' (score: {best_score:.3f})"
+        )
+        return SGDBRom(
+            sgdb_id=games_by_name[best_match]["id"],
+            url_cover=first_resource["url"],
+        )
+
     async def get_details_by_names(self, game_names: list[str]) -> SGDBRom:
+        """Get the details of the first name, in order, matched on SteamGridDB
+
+        The names are looked up concurrently, and the lookups of the names after the
+        first match are cancelled.
+        """
         if not STEAMGRIDDB_API_ENABLED:
             return SGDBRom(sgdb_id=None)
 
-        for game_name in game_names:
-            search_term = self.normalize_search_term(game_name, remove_articles=False)
-            games = await self.sgdb_service.search_games(term=search_term)
-            if not games:
-                log.debug(f"Could not find '{search_term}' on SteamGridDB")
-                continue
-
-            games_by_name: dict[str, SGDBGame] = {}
-            for game in games:
-                if (
-                    game["name"] not in games_by_name
-                    or game["id"] < games_by_name[game["name"]]["id"]
-                ):
-                    games_by_name[game["name"]] = game
-
-            best_match, best_score = self.find_best_match(
-                search_term,
-                list(games_by_name.keys()),
-                min_similarity_score=self.min_similarity_score,
+        # Providers often agree on the name, which only needs to be looked up once
+        unique_names: dict[str, str] = {}
+        for name in game_names:
+            unique_names.setdefault(
+                self.normalize_search_term(name, remove_articles=False), name
             )
-            if best_match:
-                game_details = await self._get_game_covers(
-                    game_id=games_by_name[best_match]["id"],
-                    game_name=games_by_name[best_match]["name"],
-                    types=(SGDBType.STATIC,),
-                    is_nsfw=False,
-                    is_humor=False,
-                    is_epilepsy=False,
-                )
 
-                first_resource = next(
-                    (res for res in game_details["resources"] if res["url"]), None
-                )
-                if first_resource:
-                    log.debug(
-                        f"Found match for '{search_term}' -> '{best_match}' (score: {best_score:.3f})"
-                    )
-                    return SGDBRom(
-                        sgdb_id=games_by_name[best_match]["id"],
-                        url_cover=first_resource["url"],
-                    )
+        lookups = [
+            asyncio.create_task(self.get_details_by_name(name))
+            for name in unique_names.values()
+        ]
+        try:
+            for lookup in lookups:
+                sgdb_rom = await lookup
+                if sgdb_rom["sgdb_id"]:
+                    return sgdb_rom
+        finally:
+            for lookup in lookups:
+                lookup.cancel()
+            # Wait for the cancelled lookups, so they don't outlive the scan
+            await asyncio.gather(*lookups, return_exceptions=True)
 
         log.debug(f"No good match found for '{', '.join(game_names)}' on SteamGridDB")
         return SGDBRom(sgdb_id=None)
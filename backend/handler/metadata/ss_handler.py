@@ -9,6 +9,7 @@ from adapters.services.screenscraper import ScreenScraperService
 from adapters.services.screenscraper_types import SSGame, SSGameDate
 from config import SCREENSCRAPER_PASSWORD, SCREENSCRAPER_USER
 from logger.logger import log
+from models.rom import RomFile
 from unidecode import unidecode as uc
 
 from .base_hander import (
@@ -320,7 +321,40 @@ class SSHandler(MetadataHandler):
             name=platform["name"],
         )
 
-    async def get_rom(self, file_name: str, platform_ss_id: int) -> SSRom:
+    async def _lookup_rom_by_hash(
+        self, files: list[RomFile], platform_ss_id: int
+    ) -> SSGame | None:
+        # The main file of the rom identifies it, as in multi-disc or multi-track roms
+        main_file = max(
+            (
+                file
+                for file in files
+                if file.file_size_bytes
+                and (file.crc_hash or file.md5_hash or file.sha1_hash)
+            ),
+            key=lambda file: file.file_size_bytes,
+            default=None,
+        )
+        if main_file is None:
+            return None
+
+        log.debug("Looking up %s by hash on ScreenScraper", main_file.file_name)
+        return await self.ss_service.get_game_info(
+            crc=main_file.crc_hash,
+            md5=main_file.md5_hash,
+            sha1=main_file.sha1_hash,
+            system_id=platform_ss_id,
+            rom_type="rom",
+            rom_name=main_file.file_name,
+            rom_size_bytes=main_file.file_size_bytes,
+        )
+
+    async def get_rom(
+        self,
+        file_name: str,
+        platform_ss_id: int,
+        files: list[RomFile] | None = None,
+    ) -> SSRom:
         from handler.filesystem import fs_rom_handler
 
         if not SS_API_ENABLED:
@@ -329,6 +363,12 @@ class SSHandler(MetadataHandler):
         if not platform_ss_id:
             return SSRom(ss_id=None)
 
+        # A single hash lookup identifies well dumped roms, without searching by name
+        if files:
+            res = await self._lookup_rom_by_hash(files, platform_ss_id)
+            if res and res.get("id"):
+                return build_ss_rom(res)
+
         search_term = fs_rom_handler.get_file_name_with_no_tags(file_name)
         fallback_rom = SSRom(ss_id=None)
 
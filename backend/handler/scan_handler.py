@@ -334,15 +334,6 @@ async def scan_rom(
 
         return HasheousRom(hasheous_id=None, igdb_id=None, tgdb_id=None, ra_id=None)
 
-    # Run hash fetches concurrently
-    (
-        playmatch_hash_match,
-        hasheous_hash_match,
-    ) = await asyncio.gather(
-        fetch_playmatch_hash_match(),
-        fetch_hasheous_hash_match(),
-    )
-
     async def fetch_igdb_rom(
         playmatch_rom: PlaymatchRomMatch, hasheous_rom: HasheousRom
     ) -> IGDBRom:
@@ -425,7 +416,9 @@ async def scan_rom(
             )
         ):
             return await meta_ss_handler.get_rom(
-                rom_attrs["fs_name"], platform_ss_id=platform.ss_id
+                rom_attrs["fs_name"],
+                platform_ss_id=platform.ss_id,
+                files=fs_rom["files"],
             )
 
         return SSRom(ss_id=None)
@@ -510,132 +503,162 @@ async def scan_rom(
 
         return HasheousRom(hasheous_id=None, igdb_id=None, tgdb_id=None, ra_id=None)
 
-    # Run metadata fetches concurrently
-    (
-        igdb_handler_rom,
-        moby_handler_rom,
-        ss_handler_rom,
-        ra_handler_rom,
-        launchbox_handler_rom,
-        hasheous_handler_rom,
-    ) = await asyncio.gather(
-        fetch_igdb_rom(playmatch_hash_match, hasheous_hash_match),
-        fetch_moby_rom(),
-        fetch_ss_rom(),
-        fetch_ra_rom(hasheous_hash_match),
-        fetch_launchbox_rom(platform.slug),
-        fetch_hasheous_rom(hasheous_hash_match),
+    # The file name doesn't depend on the other providers, so its SteamGridDB lookup
+    # runs alongside them, and is used if none of their names match
+    sgdb_fs_name_lookup = (
+        asyncio.create_task(
+            meta_sgdb_handler.get_details_by_name(rom_attrs["fs_name_no_tags"])
+        )
+        if MetadataSource.SGDB in metadata_sources
+        and (
+            newly_added
+            or scan_type == ScanType.COMPLETE
+            or (scan_type == ScanType.PARTIAL and not rom.sgdb_id)
+            or (scan_type == ScanType.UNIDENTIFIED and rom.is_unidentified)
+        )
+        else None
     )
 
-    # Only update fields if match is found
-    if launchbox_handler_rom.get("launchbox_id"):
-        rom_attrs.update({**launchbox_handler_rom})
-    if hasheous_handler_rom.get("hasheous_id"):
-        rom_attrs.update({**hasheous_handler_rom})
-    if ra_handler_rom.get("ra_id"):
-        rom_attrs.update({**ra_handler_rom})
-    if moby_handler_rom.get("moby_id"):
-        rom_attrs.update({**moby_handler_rom})
-    if ss_handler_rom.get("ss_id"):
-        rom_attrs.update({**ss_handler_rom})
-    if igdb_handler_rom.get("igdb_id"):
-        rom_attrs.update({**igdb_handler_rom})
-
-    # Stop IDs from getting overridden by empty values
-    rom_attrs.update(
-        {
-            "igdb_id": igdb_handler_rom.get("igdb_id")
-            or hasheous_handler_rom.get("igdb_id")
-            or rom_attrs.get("igdb_id")
-            or None,
-            "ss_id": ss_handler_rom.get("ss_id") or rom_attrs.get("ss_id") or None,
-            "moby_id": moby_handler_rom.get("moby_id")
-            or rom_attrs.get("moby_id")
-            or None,
-            "ra_id": ra_handler_rom.get("ra_id")
-            or hasheous_handler_rom.get("ra_id")
-            or rom_attrs.get("ra_id")
-            or None,
-            "launchbox_id": launchbox_handler_rom.get("launchbox_id")
-            or rom_attrs.get("launchbox_id")
-            or None,
-            "hasheous_id": hasheous_handler_rom.get("hasheous_id")
-            or rom_attrs.get("hasheous_id")
-            or None,
-            "tgdb_id": hasheous_handler_rom.get("tgdb_id")
-            or rom_attrs.get("tgdb_id")
-            or None,
-        }
-    )
+    try:
+        # Run hash fetches concurrently
+        (
+            playmatch_hash_match,
+            hasheous_hash_match,
+        ) = await asyncio.gather(
+            fetch_playmatch_hash_match(),
+            fetch_hasheous_hash_match(),
+        )
+
+        # Run metadata fetches concurrently
+        (
+            igdb_handler_rom,
+            moby_handler_rom,
+            ss_handler_rom,
+            ra_handler_rom,
+            launchbox_handler_rom,
+            hasheous_handler_rom,
+        ) = await asyncio.gather(
+            fetch_igdb_rom(playmatch_hash_match, hasheous_hash_match),
+            fetch_moby_rom(),
+            fetch_ss_rom(),
+            fetch_ra_rom(hasheous_hash_match),
+            fetch_launchbox_rom(platform.slug),
+            fetch_hasheous_rom(hasheous_hash_match),
+        )
 
-    # Don't overwrite existing fields on partial scans
-    if not newly_added and scan_type == ScanType.PARTIAL:
+        # Only update fields if match is found
+        if launchbox_handler_rom.get("launchbox_id"):
+            rom_attrs.update({**launchbox_handler_rom})
+        if hasheous_handler_rom.get("hasheous_id"):
+            rom_attrs.update({**hasheous_handler_rom})
+        if ra_handler_rom.get("ra_id"):
+            rom_attrs.update({**ra_handler_rom})
+        if moby_handler_rom.get("moby_id"):
+            rom_attrs.update({**moby_handler_rom})
+        if ss_handler_rom.get("ss_id"):
+            rom_attrs.update({**ss_handler_rom})
+        if igdb_handler_rom.get("igdb_id"):
+            rom_attrs.update({**igdb_handler_rom})
+
+        # Stop IDs from getting overridden by empty values
         rom_attrs.update(
             {
-                "name": rom.name or rom_attrs.get("name") or None,
-                "summary": rom.summary or rom_attrs.get("summary") or None,
-                "url_cover": rom.url_cover or rom_attrs.get("url_cover") or None,
-                "url_manual": rom.url_manual or rom_attrs.get("url_manual") or None,
-                "url_screenshots": rom.url_screenshots
-                or rom_attrs.get("url_screenshots")
-                or [],
+                "igdb_id": igdb_handler_rom.get("igdb_id")
+                or hasheous_handler_rom.get("igdb_id")
+                or rom_attrs.get("igdb_id")
+                or None,
+                "ss_id": ss_handler_rom.get("ss_id") or rom_attrs.get("ss_id") or None,
+                "moby_id": moby_handler_rom.get("moby_id")
+                or rom_attrs.get("moby_id")
+                or None,
+                "ra_id": ra_handler_rom.get("ra_id")
+                or hasheous_handler_rom.get("ra_id")
+                or rom_attrs.get("ra_id")
+                or None,
+                "launchbox_id": launchbox_handler_rom.get("launchbox_id")
+                or rom_attrs.get("launchbox_id")
+                or None,
+                "hasheous_id": hasheous_handler_rom.get("hasheous_id")
+                or rom_attrs.get("hasheous_id")
+                or None,
+                "tgdb_id": hasheous_handler_rom.get("tgdb_id")
+                or rom_attrs.get("tgdb_id")
+                or None,
             }
         )
 
-    # If not found in any metadata source, we return the rom with the default values
-    if (
-        not igdb_handler_rom.get("igdb_id")
-        and not moby_handler_rom.get("moby_id")
-        and not ss_handler_rom.get("ss_id")
-        and not ra_handler_rom.get("ra_id")
-        and not launchbox_handler_rom.get("launchbox_id")
-        and not hasheous_handler_rom.get("hasheous_id")
-    ):
-        log.warning(
-            f"{hl(rom_attrs['fs_name'])} not identified {emoji.EMOJI_CROSS_MARK}",
-            extra=LOGGER_MODULE_NAME,
-        )
-        return Rom(**rom_attrs)
+        # Don't overwrite existing fields on partial scans
+        if not newly_added and scan_type == ScanType.PARTIAL:
+            rom_attrs.update(
+                {
+                    "name": rom.name or rom_attrs.get("name") or None,
+                    "summary": rom.summary or rom_attrs.get("summary") or None,
+                    "url_cover": rom.url_cover or rom_attrs.get("url_cover") or None,
+                    "url_manual": rom.url_manual or rom_attrs.get("url_manual") or None,
+                    "url_screenshots": rom.url_screenshots
+                    or rom_attrs.get("url_screenshots")
+                    or [],
+                }
+            )
 
-    async def fetch_sgdb_details() -> SGDBRom:
-        """Fetch SteamGridDB details for the ROM."""
+        # If not found in any metadata source, we return the rom with the default values
         if (
-            MetadataSource.SGDB in metadata_sources
-            and newly_added
-            or scan_type == ScanType.COMPLETE
-            or (scan_type == ScanType.PARTIAL and not rom.sgdb_id)
-            or (scan_type == ScanType.UNIDENTIFIED and rom.is_unidentified)
+            not igdb_handler_rom.get("igdb_id")
+            and not moby_handler_rom.get("moby_id")
+            and not ss_handler_rom.get("ss_id")
+            and not ra_handler_rom.get("ra_id")
+            and not launchbox_handler_rom.get("launchbox_id")
+            and not hasheous_handler_rom.get("hasheous_id")
         ):
+            log.warning(
+                f"{hl(rom_attrs['fs_name'])} not identified {emoji.EMOJI_CROSS_MARK}",
+                extra=LOGGER_MODULE_NAME,
+            )
+            return Rom(**rom_attrs)
+
+        async def fetch_sgdb_details() -> SGDBRom:
+            """Fetch SteamGridDB details for the ROM."""
+            if sgdb_fs_name_lookup is None:
+                return SGDBRom(sgdb_id=None)
+
             game_names = [
                 igdb_handler_rom.get("name", None),
                 hasheous_handler_rom.get("name", None),
                 ss_handler_rom.get("name", None),
                 moby_handler_rom.get("name", None),
                 launchbox_handler_rom.get("name", None),
-                rom_attrs["fs_name_no_tags"],
             ]
             game_names = [name for name in game_names if name]
-            return await meta_sgdb_handler.get_details_by_names(game_names)
+            if game_names:
+                sgdb_rom = await meta_sgdb_handler.get_details_by_names(game_names)
+                if sgdb_rom.get("sgdb_id"):
+                    return sgdb_rom
 
-        return SGDBRom(sgdb_id=None)
+            # The file name is the last candidate, its lookup is already running
+            return await sgdb_fs_name_lookup
 
-    sgdb_hander_rom = await fetch_sgdb_details()
-    if sgdb_hander_rom.get("sgdb_id"):
-        rom_attrs.update({**sgdb_hander_rom})
+        sgdb_hander_rom = await fetch_sgdb_details()
+        if sgdb_hander_rom.get("sgdb_id"):
+            rom_attrs.update({**sgdb_hander_rom})
 
-    log.info(
-        f"{hl(rom_attrs['fs_name'])} identified as {hl(rom_attrs['name'], color=BLUE)} {emoji.EMOJI_ALIEN_MONSTER}",
-        extra=LOGGER_MODULE_NAME,
-    )
-    if rom.multi:
-        for file in fs_rom["files"]:
-            log.info(
-                f"\t · {hl(file.file_name, color=LIGHTYELLOW)}",
-                extra=LOGGER_MODULE_NAME,
-            )
+        log.info(
+            f"{hl(rom_attrs['fs_name'])} identified as {hl(rom_attrs['name'], color=BLUE)} {emoji.EMOJI_ALIEN_MONSTER}",
+            extra=LOGGER_MODULE_NAME,
+        )
+        if rom.multi:
+            for file in fs_rom["files"]:
+                log.info(
+                    f"\t · {hl(file.file_name, color=LIGHTYELLOW)}",
+                    extra=LOGGER_MODULE_NAME,
+                )
 
-    rom_attrs["missing_from_fs"] = False
-    return Rom(**rom_attrs)
+        rom_attrs["missing_from_fs"] = False
+        return Rom(**rom_attrs)
+    finally:
+        # Stop the file name lookup when it isn't needed, like for unidentified roms,
+        # or the scan was stopped
+        if sgdb_fs_name_lookup:
+            sgdb_fs_name_lookup.cancel()
 
 
 async def _scan_asset(file_name: str, asset_path: str):
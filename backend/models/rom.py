@@ -15,6 +15,7 @@ from models.base import (
 from sqlalchemy import (
     TIMESTAMP,
     BigInteger,
+    Double,
     Enum,
     ForeignKey,
     Index,
@@ -64,7 +65,7 @@ class RomFile(BaseModel):
     file_name: Mapped[str] = mapped_column(String(length=FILE_NAME_MAX_LENGTH))
     file_path: Mapped[str] = mapped_column(String(length=FILE_PATH_MAX_LENGTH))
     file_size_bytes: Mapped[int] = mapped_column(BigInteger(), default=0)
-    last_modified: Mapped[float | None] = mapped_column(default=None)
+    last_modified: Mapped[float | None] = mapped_column(Double(), default=None)
     crc_hash: Mapped[str | None] = mapped_column(String(100))
     md5_hash: Mapped[str | None] = mapped_column(String(100))
     sha1_hash: Mapped[str | None] = mapped_column(String(100))
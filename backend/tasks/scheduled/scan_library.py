@@ -1,5 +1,6 @@
 from config import (
     ENABLE_SCHEDULED_RESCAN,
+    ENABLE_SCHEDULED_RESCAN_RESUME,
     HASHEOUS_API_ENABLED,
     LAUNCHBOX_API_ENABLED,
     SCHEDULED_RESCAN_CRON,
@@ -50,7 +51,10 @@ class ScanLibraryTask(PeriodicTask):
 
         log.info("Scheduled library scan started...")
         await scan_platforms(
-            [], scan_type=ScanType.UNIDENTIFIED, metadata_sources=metadata_sources
+            [],
+            scan_type=ScanType.UNIDENTIFIED,
+            metadata_sources=metadata_sources,
+            resume=ENABLE_SCHEDULED_RESCAN_RESUME,
         )
         log.info("Scheduled library scan done")
 
@@ -1,7 +1,10 @@
 from contextvars import ContextVar
+from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest_asyncio
+from handler.redis_handler import async_cache
+from utils.rate_limiter import RATE_LIMIT_KEY_PREFIX, ProviderRateLimiter
 
 
 @pytest_asyncio.fixture
@@ -16,3 +19,13 @@ async def mock_ctx_aiohttp_session():
         yield ctx_aiohttp_session
     finally:
         await session.close()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def skip_rate_limits():
+    """Don't wait for the provider rate limits, which are tested on their own."""
+    with patch.object(ProviderRateLimiter, "_wait_for_rate_limit", AsyncMock()):
+        yield
+    keys = await async_cache.keys(f"{RATE_LIMIT_KEY_PREFIX}:*")
+    if keys:
+        await async_cache.delete(*keys)
@@ -7,6 +7,7 @@ import aiohttp
 import pytest
 import yarl
 from adapters.services.mobygames import (
+    RATE_LIMITER,
     MobyGamesService,
     auth_middleware,
 )
@@ -182,13 +183,13 @@ class TestMobyGamesServiceUnit:
         mock_context.get.return_value = mock_session
 
         with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
-            with patch("asyncio.sleep") as mock_sleep:
+            with patch.object(RATE_LIMITER, "throttle", AsyncMock()) as mock_throttle:
                 result = await service._request("https://api.mobygames.com/v1/games")
 
         assert result == {
             "games": []
         }  # First call returns empty dict, retry happens on second call
-        mock_sleep.assert_called_once_with(2)
+        mock_throttle.assert_awaited_once_with(None)
 
     @pytest.mark.asyncio
     async def test_request_json_decode_error(self, service):
@@ -1,11 +1,15 @@
 import asyncio
+import hashlib
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from adapters.services.rahasher import (
+    RA_MAX_FILE_HASH_SIZE,
     RAHASHER_VALID_HASH_REGEX,
+    RAFileHasher,
     RAHasherError,
     RAHasherService,
+    calculate_ra_file_hash,
 )
 
 
@@ -230,6 +234,69 @@ class TestRAHasherService:
         assert result == ""
 
 
+class TestRAFileHasher:
+    """Test the in process RetroAchievements hashing."""
+
+    def test_plain_file(self, tmp_path):
+        """Test platforms hashing the whole file."""
+        rom_content = b"GB ROM" * 1000
+        rom_file = tmp_path / "game.gb"
+        rom_file.write_bytes(rom_content)
+
+        assert (
+            calculate_ra_file_hash(4, str(rom_file))
+            == hashlib.md5(rom_content).hexdigest()
+        )
+
+    def test_nes_header_skipped(self, tmp_path):
+        """Test the iNES header is left out of the hash."""
+        rom_content = b"PRG" * 1000
+        rom_file = tmp_path / "game.nes"
+        rom_file.write_bytes(b"NES\x1a" + bytes(12) + rom_content)
+
+        assert (
+            calculate_ra_file_hash(7, str(rom_file))
+            == hashlib.md5(rom_content).hexdigest()
+        )
+
+    def test_snes_copier_header_skipped(self, tmp_path):
+        """Test the copier header is left out of the hash."""
+        rom_content = bytes(range(256)) * 32  # 0x2000 bytes
+        rom_file = tmp_path / "game.smc"
+        rom_file.write_bytes(bytes(512) + rom_content)
+
+        assert (
+            calculate_ra_file_hash(3, str(rom_file))
+            == hashlib.md5(rom_content).hexdigest()
+        )
+
+    def test_chunks_across_header_and_size_limit(self):
+        """Test the header and the size limit are applied across chunks."""
+        ra_h = RAFileHasher(13, RA_MAX_FILE_HASH_SIZE + 10)
+        ra_h.update(b"LYNX\x00" + bytes(27))
+        ra_h.update(bytes(32) + b"a" * (RA_MAX_FILE_HASH_SIZE - 64))
+        ra_h.update(b"b" * 10)
+
+        expected = hashlib.md5(b"a" * (RA_MAX_FILE_HASH_SIZE - 64)).hexdigest()
+        assert ra_h.hexdigest() == expected
+
+    def test_empty_file(self):
+        """Test empty files have no hash."""
+        assert RAFileHasher(4, 0).hexdigest() == ""
+
+    @pytest.mark.asyncio
+    async def test_calculate_hash_skips_rahasher(self, tmp_path):
+        """Test simple platforms don't spawn RAHasher."""
+        rom_file = tmp_path / "game.gba"
+        rom_file.write_bytes(b"GBA ROM")
+
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            result = await RAHasherService().calculate_hash(5, str(rom_file))
+
+        assert result == hashlib.md5(b"GBA ROM").hexdigest()
+        mock_subprocess.assert_not_called()
+
+
 class TestRAHasherError:
     """Test the RAHasherError exception."""
 
@@ -9,6 +9,7 @@ import pytest
 import yarl
 from adapters.services.screenscraper import (
     LOGIN_ERROR_CHECK,
+    RATE_LIMITER,
     SS_DEV_ID,
     SS_DEV_PASSWORD,
     ScreenScraperService,
@@ -220,13 +221,13 @@ class TestScreenScraperServiceUnit:
         mock_context.get.return_value = mock_session
 
         with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
-            with patch("asyncio.sleep") as mock_sleep:
+            with patch.object(RATE_LIMITER, "throttle", AsyncMock()) as mock_throttle:
                 result = await service._request(
                     "https://api.screenscraper.fr/api2/jeuInfos.php"
                 )
 
         assert result == {}
-        mock_sleep.assert_called_once_with(2)
+        mock_throttle.assert_awaited_once_with(None)
 
     @pytest.mark.asyncio
     async def test_request_unauthorized_returns_empty_dict(self, service):
@@ -1,7 +1,10 @@
 import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
-from config.config_manager import ConfigManager
+import yaml
+from config.config_manager import ConfigManager, config_manager
 
 
 def test_config_loader():
@@ -38,3 +41,30 @@ def test_empty_config_loader():
     assert loader.config.PLATFORMS_VERSIONS == {}
     assert loader.config.ROMS_FOLDER_NAME == "roms"
     assert loader.config.FIRMWARE_FOLDER_NAME == "bios"
+
+
+def test_config_loader_reloads_on_change(tmp_path: Path):
+    config_file = tmp_path / "config.yml"
+    shutil.copy(
+        os.path.join(Path(__file__).resolve().parent, "fixtures", "config/config.yml"),
+        config_file,
+    )
+    previous_config_file = config_manager.config_file
+    loader = ConfigManager(str(config_file))
+
+    with patch("config.config_manager.yaml.load", wraps=yaml.load) as mock_load:
+        assert loader.get_config().ROMS_FOLDER_NAME == "ROMS"
+        mock_load.assert_not_called()
+
+        config_file.write_text("filesystem:\n  roms_folder: games\n")
+        os.utime(config_file, ns=(0, 0))
+        assert loader.get_config().ROMS_FOLDER_NAME == "games"
+        assert loader.get_config().ROMS_FOLDER_NAME == "games"
+        mock_load.assert_called_once()
+
+        loader.add_exclusion("EXCLUDED_PLATFORMS", "psx")
+        assert loader.get_config().EXCLUDED_PLATFORMS == ["psx"]
+        mock_load.assert_called_once()
+
+    # The config manager is a singleton, leave it as it was for other tests
+    ConfigManager(previous_config_file)
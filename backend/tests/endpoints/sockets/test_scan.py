@@ -1,7 +1,24 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
-from endpoints.sockets.scan import ScanStats, _should_scan_rom
+from endpoints.sockets.scan import (
+    STOP_SCAN_CHANNEL,
+    STOP_SCAN_FLAG,
+    ScanCancellation,
+    ScanCheckpoint,
+    ScanProgress,
+    ScanStats,
+    _complete_platform_shard,
+    _get_shard_keys,
+    _identify_roms,
+    _on_platform_shard_failure,
+    _pop_fs_changes,
+    _should_scan_rom,
+    add_fs_changes,
+    scan_platforms,
+)
+from fakeredis import FakeAsyncRedis, FakeRedis
 from handler.scan_handler import ScanType
 from models.rom import Rom
 
@@ -75,6 +92,269 @@ def test_merging_scan_stats():
         stats += stats3
 
 
+async def test_identify_roms_concurrently(mocker):
+    running = 0
+    max_running = 0
+
+    async def fake_identify_rom(**kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return ScanStats(scanned_roms=1, metadata_roms=1)
+
+    mocker.patch("endpoints.sockets.scan._identify_rom", side_effect=fake_identify_rom)
+
+    fs_roms = tuple({"fs_name": f"rom_{i}.bin", "multi": False} for i in range(10))
+    stats = await _identify_roms(
+        platform=Mock(),
+        fs_roms=fs_roms,  # type: ignore
+        rom_by_filename_map={},
+        scan_type=ScanType.QUICK,
+        roms_ids=[],
+        metadata_sources=["igdb"],
+        scan_progress=Mock(),
+        cancellation=Mock(is_cancelled=False),
+        scan_workers=3,
+    )
+
+    assert stats.scanned_roms == 10
+    assert stats.metadata_roms == 10
+    assert max_running == 3
+
+
+async def test_scan_cancellation(mocker):
+    async_cache = FakeAsyncRedis(version=7, decode_responses=True)
+    mocker.patch("endpoints.sockets.scan.async_cache", async_cache)
+
+    async with ScanCancellation() as cancellation:
+        assert not cancellation.is_cancelled
+
+        await async_cache.publish(STOP_SCAN_CHANNEL, 1)
+        for _ in range(100):
+            if cancellation.is_cancelled:
+                break
+            await asyncio.sleep(0.01)
+        assert cancellation.is_cancelled
+
+    await async_cache.set(STOP_SCAN_FLAG, 1)
+    async with ScanCancellation() as cancellation:
+        assert cancellation.is_cancelled
+
+
+def test_scan_checkpoint(mocker):
+    mocker.patch("endpoints.sockets.scan.redis_client", FakeRedis(version=7))
+    key = ScanCheckpoint.get_key([], ScanType.COMPLETE, [], ["igdb"])
+    assert ScanCheckpoint.load(key) is None
+
+    checkpoint = ScanCheckpoint(
+        key=key,
+        platform_list=["n64", "psx"],
+        scan_type=ScanType.COMPLETE,
+        roms_ids=[],
+        metadata_sources=["igdb"],
+    )
+    checkpoint.save_roms_batch("n64", "rom_1.z64", ScanStats(scanned_roms=2))
+    checkpoint.save_platform("n64", ScanStats(scanned_platforms=1, scanned_roms=3))
+    checkpoint.save_roms_batch("psx", "rom_2.chd", ScanStats(scanned_roms=1))
+
+    loaded_checkpoint = ScanCheckpoint.load(key)
+    assert loaded_checkpoint == checkpoint
+    assert loaded_checkpoint.completed_platforms == ["n64"]
+    assert loaded_checkpoint.scan_stats == ScanStats(
+        scanned_platforms=1, scanned_roms=3
+    )
+    assert loaded_checkpoint.platform_slug == "psx"
+    assert loaded_checkpoint.last_fs_name == "rom_2.chd"
+    assert loaded_checkpoint.platform_roms_stats == ScanStats(scanned_roms=1)
+
+    # Scans of other platforms or with other options don't share the checkpoint
+    assert key == ScanCheckpoint.get_key([], ScanType.COMPLETE, [], ["igdb"])
+    for other_key in (
+        ScanCheckpoint.get_key([1], ScanType.COMPLETE, [], ["igdb"]),
+        ScanCheckpoint.get_key([], ScanType.UNIDENTIFIED, [], ["igdb"]),
+        ScanCheckpoint.get_key([], ScanType.COMPLETE, [], ["igdb", "ss"]),
+    ):
+        assert ScanCheckpoint.load(other_key) is None
+
+    ScanCheckpoint.clear(key)
+    assert ScanCheckpoint.load(key) is None
+
+
+async def test_stopped_scan_keeps_checkpoint(mocker):
+    mocker.patch("endpoints.sockets.scan.redis_client", FakeRedis(version=7))
+    mocker.patch(
+        "endpoints.sockets.scan.async_cache",
+        FakeAsyncRedis(version=7, decode_responses=True),
+    )
+    mocker.patch(
+        "endpoints.sockets.scan.fs_platform_handler.get_platforms",
+        AsyncMock(return_value=["n64", "psx"]),
+    )
+    mocker.patch(
+        "endpoints.sockets.scan._get_socket_manager",
+        return_value=Mock(emit=AsyncMock()),
+    )
+    mock_finish_scan = mocker.patch("endpoints.sockets.scan._finish_scan")
+    scanned_platforms: list[str] = []
+
+    async def identify_platform(platform_slug, cancellation, **_kwargs):
+        scanned_platforms.append(platform_slug)
+        # Stop the scan while the last platform is being scanned
+        if platform_slug == "psx" and len(scanned_platforms) == 2:
+            cancellation._cancelled = True
+        return ScanStats(scanned_platforms=1)
+
+    mocker.patch(
+        "endpoints.sockets.scan._identify_platform", side_effect=identify_platform
+    )
+    key = ScanCheckpoint.get_key([], ScanType.QUICK, [], ["igdb"])
+
+    await scan_platforms([], metadata_sources=["igdb"], sharded=False, resume=True)
+
+    mock_finish_scan.assert_not_called()
+    checkpoint = ScanCheckpoint.load(key)
+    assert checkpoint is not None
+    assert checkpoint.completed_platforms == ["n64"]
+
+    # The resumed scan only scans the platform left, and finishes the scan
+    await scan_platforms([], metadata_sources=["igdb"], sharded=False, resume=True)
+
+    assert scanned_platforms == ["n64", "psx", "psx"]
+    mock_finish_scan.assert_called_once()
+    assert ScanCheckpoint.load(key) is None
+
+
+async def test_scan_progress_batches_roms(mocker):
+    mocker.patch(
+        "endpoints.sockets.scan.SimpleRomSchema.from_orm_with_factory",
+        side_effect=lambda rom: Mock(model_dump=Mock(return_value={"id": rom.id})),
+    )
+    socket_manager = Mock(emit=AsyncMock())
+    platform = Mock(id=1, slug="n64", fs_slug="n64")
+    platform.name = "Nintendo 64"
+    scan_progress = ScanProgress(platform, socket_manager, batch_size=3, interval=60)
+
+    for rom_id in range(7):
+        await scan_progress.add_rom(
+            Mock(id=rom_id), ScanStats(scanned_roms=1, added_roms=rom_id % 2)
+        )
+    await scan_progress.flush()
+    await scan_progress.flush()
+
+    progress_events = [
+        call.args[1]
+        for call in socket_manager.emit.call_args_list
+        if call.args[0] == "scan:scanning_roms"
+    ]
+    assert [[rom["id"] for rom in event["roms"]] for event in progress_events] == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6],
+    ]
+    assert progress_events[-1]["platform_slug"] == "n64"
+    assert progress_events[-1]["scanned_roms"] == 7
+    assert progress_events[-1]["added_roms"] == 3
+
+
+async def test_complete_platform_shards(mocker):
+    redis_client = FakeRedis(version=7)
+    mocker.patch("endpoints.sockets.scan.redis_client", redis_client)
+    mock_mark_missing = mocker.patch(
+        "endpoints.sockets.scan.db_platform_handler.mark_missing_platforms",
+        return_value=[],
+    )
+    socket_manager = Mock(emit=AsyncMock())
+
+    pending_key, stats_key, _ = _get_shard_keys("test_scan")
+    redis_client.set(pending_key, 2)
+
+    await _complete_platform_shard(
+        "test_scan", "n64", ["n64", "psx"], ScanStats(scanned_roms=3), socket_manager
+    )
+    socket_manager.emit.assert_not_called()
+    mock_mark_missing.assert_not_called()
+
+    await _complete_platform_shard(
+        "test_scan",
+        "psx",
+        ["n64", "psx"],
+        ScanStats(scanned_platforms=1, scanned_roms=4),
+        socket_manager,
+    )
+    mock_mark_missing.assert_called_once_with(["n64", "psx"])
+    socket_manager.emit.assert_called_once_with(
+        "scan:done", ScanStats(scanned_platforms=1, scanned_roms=7).__dict__
+    )
+    assert not redis_client.exists(pending_key, stats_key)
+
+
+async def test_complete_platform_shards_with_failures(mocker):
+    redis_client = FakeRedis(version=7)
+    mocker.patch("endpoints.sockets.scan.redis_client", redis_client)
+    mock_mark_missing = mocker.patch(
+        "endpoints.sockets.scan.db_platform_handler.mark_missing_platforms",
+        return_value=[],
+    )
+    socket_manager = Mock(emit=AsyncMock())
+    mocker.patch(
+        "endpoints.sockets.scan._get_socket_manager", return_value=socket_manager
+    )
+
+    pending_key, stats_key, _ = _get_shard_keys("test_scan")
+    redis_client.set(pending_key, 3)
+
+    await _complete_platform_shard(
+        "test_scan", "n64", ["n64", "psx", "snes"], ScanStats(), socket_manager, True
+    )
+    # RQ reports the failed job again, which isn't counted twice
+    await asyncio.to_thread(
+        _on_platform_shard_failure, Mock(args=("test_scan", "n64", [])), None
+    )
+    await _complete_platform_shard(
+        "test_scan", "psx", ["n64", "psx", "snes"], ScanStats(), socket_manager
+    )
+    socket_manager.emit.assert_not_called()
+
+    # The job of the last shard timed out, so only RQ reports it
+    await asyncio.to_thread(
+        _on_platform_shard_failure,
+        Mock(args=("test_scan", "snes", ["n64", "psx", "snes"])),
+        None,
+    )
+    mock_mark_missing.assert_not_called()
+    socket_manager.emit.assert_called_once_with(
+        "scan:done_ko", "Scan failed for 2 platform(s)"
+    )
+    assert not redis_client.exists(pending_key, stats_key)
+
+    # The pending shards counter expired, so the scan can't be completed
+    socket_manager.emit.reset_mock()
+    await _complete_platform_shard(
+        "lost_scan", "n64", ["n64", "psx"], ScanStats(scanned_roms=4), socket_manager
+    )
+    await _complete_platform_shard(
+        "lost_scan", "psx", ["n64", "psx"], ScanStats(scanned_roms=2), socket_manager
+    )
+    mock_mark_missing.assert_not_called()
+    socket_manager.emit.assert_called_once_with(
+        "scan:done_ko", "Scan timed out before all platforms were scanned"
+    )
+
+
+def test_fs_changes_are_merged(mocker):
+    mocker.patch("endpoints.sockets.scan.redis_client", FakeRedis(version=7))
+
+    add_fs_changes(1, ["b.z64", "a.z64"])
+    add_fs_changes(1, ["a.z64", "Multi"])
+    add_fs_changes(2, ["c.iso"])
+
+    assert _pop_fs_changes(1) == ["Multi", "a.z64", "b.z64"]
+    assert _pop_fs_changes(1) == []
+    assert _pop_fs_changes(2) == ["c.iso"]
+
+
 class TestShouldScanRom:
     def test_new_platforms_scan_with_no_rom(self):
         """NEW_PLATFORMS should scan when rom is None"""
@@ -7,7 +7,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from fastapi import UploadFile
-from handler.filesystem.base_handler import FSHandler
+from handler.filesystem.base_handler import ExclusionMatcher, FSHandler
 from models.base import FILE_NAME_MAX_LENGTH
 
 
@@ -158,6 +158,27 @@ class TestFSHandler:
             assert "game.rom" in result
             assert "data.json" in result
 
+    def test_exclusion_matcher(self):
+        """Test names, patterns and extensions are matched in a single pass"""
+        matcher = ExclusionMatcher(
+            names=["info.txt", "._*", "*.nfo", "disc[12].bin"], extensions=["TMP"]
+        )
+        files = [
+            "info.txt",
+            "._game.z64",
+            "game.nfo",
+            "disc1.bin",
+            "disc3.bin",
+            "game.TMP",
+            "game.z64",
+            "other.txt",
+        ]
+
+        assert matcher.filter(files) == ["disc3.bin", "game.z64", "other.txt"]
+
+        exact_matcher = ExclusionMatcher(names=["*.nfo"], patterns=False)
+        assert exact_matcher.filter(["*.nfo", "game.nfo"]) == ["game.nfo"]
+
     async def test_make_directory(self, handler: FSHandler):
         """Test directory creation"""
         await handler.make_directory("test_dir")
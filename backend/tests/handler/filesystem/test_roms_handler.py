@@ -4,7 +4,8 @@ from unittest.mock import Mock
 
 import pytest
 from config.config_manager import LIBRARY_BASE_PATH, Config
-from handler.filesystem.roms_handler import FileHash, FSRomsHandler
+from exceptions.fs_exceptions import ArchiveExtractionException
+from handler.filesystem.roms_handler import FileHash, FSRomsHandler, hash_rom_files
 from models.platform import Platform
 from models.rom import Rom, RomFile, RomFileCategory
 
@@ -153,6 +154,37 @@ class TestFSRomsHandler:
         assert languages == []
         assert other_tags == []
 
+    def test_parse_fs_names(self, handler: FSRomsHandler):
+        """Test parse_fs_names derives all the file name fields at once"""
+        parsed_fs_names = handler.parse_fs_names(
+            ["Zelda (USA) (Rev 1) [En,Fr] [Test].n64", "Super Mario 64 (J) (Rev A)"]
+        )
+
+        assert parsed_fs_names["Zelda (USA) (Rev 1) [En,Fr] [Test].n64"] == {
+            "fs_name_no_tags": "Zelda",
+            "fs_name_no_ext": "Zelda (USA) (Rev 1) [En,Fr] [Test]",
+            "fs_extension": "n64",
+            "regions": ["USA"],
+            "revision": "1",
+            "languages": ["English", "French"],
+            "tags": ["Test"],
+        }
+        assert parsed_fs_names["Super Mario 64 (J) (Rev A)"] == {
+            "fs_name_no_tags": "Super Mario 64",
+            "fs_name_no_ext": "Super Mario 64 (J) (Rev A)",
+            "fs_extension": "",
+            "regions": ["Japan"],
+            "revision": "A",
+            "languages": [],
+            "tags": [],
+        }
+
+        # Memoized results aren't shared between roms
+        parsed_fs_names["Super Mario 64 (J) (Rev A)"]["regions"].append("USA")
+        assert handler.parse_fs_name("Super Mario 64 (J) (Rev A)")["regions"] == [
+            "Japan"
+        ]
+
     def test_exclude_multi_roms_filters_excluded(self, handler: FSRomsHandler, config):
         """Test _exclude_multi_roms filters out excluded multi-file ROMs"""
         roms = ["Game1", "excluded_multi", "Game2", "Game3"]
@@ -268,6 +300,28 @@ class TestFSRomsHandler:
             # Check excluded files are not present
             assert "excluded_test.tmp" not in rom_names
 
+    @pytest.mark.asyncio
+    async def test_get_roms_by_fs_name(self, handler: FSRomsHandler, platform, config):
+        """Test get_roms_by_fs_name only returns the requested roms found on disk"""
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr("handler.filesystem.roms_handler.cm.get_config", lambda: config)
+            m.setattr("os.path.exists", lambda x: False)  # Normal structure
+
+            result = await handler.get_roms_by_fs_name(
+                platform,
+                [
+                    "Super Mario 64 (J) (Rev A)",
+                    "Paper Mario (USA).z64",
+                    "Missing Game (USA).z64",
+                    "../Paper Mario (USA).z64",
+                ],
+            )
+
+            assert [(r["fs_name"], r["multi"]) for r in result] == [
+                ("Paper Mario (USA).z64", False),
+                ("Super Mario 64 (J) (Rev A)", True),
+            ]
+
     @pytest.mark.asyncio
     async def test_get_rom_files_single_rom(
         self, handler: FSRomsHandler, rom_single, config
@@ -315,6 +369,70 @@ class TestFSRomsHandler:
                 assert rom_file.file_size_bytes > 0
                 assert rom_file.last_modified is not None
 
+    @pytest.mark.asyncio
+    async def test_get_rom_files_reuses_unchanged_file_hashes(
+        self, handler: FSRomsHandler, rom_single, config
+    ):
+        """Test get_rom_files skips hashing files that didn't change"""
+        abs_file_path = Path(handler.base_path, "n64/roms", rom_single.fs_name)
+        file_stat = os.stat(abs_file_path)
+        known_file = RomFile(
+            file_name=rom_single.fs_name,
+            file_path="n64/roms",
+            file_size_bytes=file_stat.st_size,
+            last_modified=file_stat.st_mtime,
+            crc_hash="00000001",
+            md5_hash="stored_md5",
+            sha1_hash="stored_sha1",
+        )
+
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr("handler.filesystem.roms_handler.cm.get_config", lambda: config)
+            m.setattr("os.path.exists", lambda x: False)  # Normal structure
+            m.setattr(
+                handler,
+                "_hash_rom_files",
+                Mock(side_effect=AssertionError("File should not be hashed")),
+            )
+
+            rom_files, crc_hash, md5_hash, sha1_hash, _ = await handler.get_rom_files(
+                rom_single, known_files=[known_file]
+            )
+
+        assert len(rom_files) == 1
+        assert rom_files[0].md5_hash == "stored_md5"
+        assert crc_hash == "00000001"
+        assert md5_hash == "stored_md5"
+        assert sha1_hash == "stored_sha1"
+
+    @pytest.mark.asyncio
+    async def test_get_rom_files_rehashes_modified_file(
+        self, handler: FSRomsHandler, rom_single, config
+    ):
+        """Test get_rom_files hashes files again when their mtime changed"""
+        abs_file_path = Path(handler.base_path, "n64/roms", rom_single.fs_name)
+        file_stat = os.stat(abs_file_path)
+        known_file = RomFile(
+            file_name=rom_single.fs_name,
+            file_path="n64/roms",
+            file_size_bytes=file_stat.st_size,
+            last_modified=file_stat.st_mtime - 10,
+            crc_hash="00000001",
+            md5_hash="stored_md5",
+            sha1_hash="stored_sha1",
+        )
+
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr("handler.filesystem.roms_handler.cm.get_config", lambda: config)
+            m.setattr("os.path.exists", lambda x: False)  # Normal structure
+
+            _, crc_hash, md5_hash, _, _ = await handler.get_rom_files(
+                rom_single, known_files=[known_file]
+            )
+
+        assert crc_hash == "efb5af2e"
+        assert md5_hash == "0f343b0931126a20f133d67c2b018a3b"
+
     async def test_rename_fs_rom_same_name(self, handler: FSRomsHandler):
         """Test rename_fs_rom when old and new names are the same"""
         old_name = "test_rom.n64"
@@ -534,6 +652,96 @@ class TestFSRomsHandler:
             if test_file.exists():
                 test_file.unlink()
 
+    def test_hash_rom_files_across_blocks(self, tmp_path: Path, monkeypatch):
+        """Test hashing files bigger than the read block, and empty files"""
+        import binascii
+        import hashlib
+
+        monkeypatch.setattr(
+            "handler.filesystem.roms_handler.FILE_READ_CHUNK_SIZE", 1024
+        )
+        test_content = os.urandom(1024 * 5 + 123)
+        test_file = tmp_path / "blocks.bin"
+        test_file.write_bytes(test_content)
+        empty_file = tmp_path / "empty.bin"
+        empty_file.touch()
+
+        file_hashes, rom_crc, rom_md5, rom_sha1, _ = hash_rom_files(
+            [test_file, empty_file]
+        )
+
+        expected_crc = f"{binascii.crc32(test_content):08x}"
+        expected_md5 = hashlib.md5(test_content, usedforsecurity=False).hexdigest()
+        expected_sha1 = hashlib.sha1(test_content, usedforsecurity=False).hexdigest()
+        assert file_hashes == [
+            FileHash(
+                crc_hash=expected_crc, md5_hash=expected_md5, sha1_hash=expected_sha1
+            ),
+            FileHash(crc_hash="", md5_hash="", sha1_hash=""),
+        ]
+        assert rom_crc == expected_crc
+        assert rom_md5 == expected_md5
+        assert rom_sha1 == expected_sha1
+
+    def test_hash_rom_files_mmap_only_when_requested(self, tmp_path: Path, monkeypatch):
+        """Test files are only memory mapped when hashed in the hashing processes"""
+        import mmap
+
+        test_file = tmp_path / "game.bin"
+        test_file.write_bytes(os.urandom(1024 * 3))
+        mmap_calls: list[int] = []
+        original_mmap = mmap.mmap
+
+        def mapped_file(fileno, *args, **kwargs):
+            mmap_calls.append(fileno)
+            return original_mmap(fileno, *args, **kwargs)
+
+        monkeypatch.setattr("handler.filesystem.roms_handler.mmap.mmap", mapped_file)
+
+        thread_hashes = hash_rom_files([test_file])
+        assert not mmap_calls
+
+        assert hash_rom_files([test_file], use_mmap=True) == thread_hashes
+        assert len(mmap_calls) == 1
+
+    def test_hash_rom_files_ra_hash_same_pass(self, tmp_path: Path):
+        """Test the RA hash of simple platforms is calculated while hashing"""
+        import hashlib
+
+        rom_content = b"PRG" * 1000
+        test_file = tmp_path / "game.nes"
+        test_file.write_bytes(b"NES\x1a" + bytes(12) + rom_content)
+
+        *_, ra_hash = hash_rom_files([test_file], ra_platform_id=7)
+        assert ra_hash == hashlib.md5(rom_content).hexdigest()
+
+        # Disc based platforms still need RAHasher
+        *_, ra_hash = hash_rom_files([test_file], ra_platform_id=12)
+        assert ra_hash == ""
+
+    def test_hash_rom_files_extraction_error(self, tmp_path: Path, monkeypatch):
+        """Test archives failing to extract midway don't keep their partial hashes"""
+
+        def process_file_7z(file_path, fn_hash_update):
+            fn_hash_update(b"partial data")
+            raise ArchiveExtractionException("game.iso", str(file_path))
+
+        monkeypatch.setattr(
+            "handler.filesystem.roms_handler.process_file_7z", process_file_7z
+        )
+        archive_file = tmp_path / "game.7z"
+        archive_file.write_bytes(b"7z archive")
+        test_file = tmp_path / "game.bin"
+        test_file.write_bytes(b"game data")
+
+        file_hashes, rom_crc, rom_md5, rom_sha1, _ = hash_rom_files(
+            [test_file, archive_file]
+        )
+
+        assert file_hashes[0]["md5_hash"]
+        assert file_hashes[1] == FileHash(crc_hash="", md5_hash="", sha1_hash="")
+        assert (rom_crc, rom_md5, rom_sha1) == ("", "", "")
+
     async def test_compressed_file_handling(self, handler: FSRomsHandler):
         """Test handling of compressed ROM files"""
         # Test with the ZIP file
@@ -0,0 +1,99 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from handler.metadata.igdb_handler import IGDBHandler
+
+
+class TestGetRomById:
+    """Test the IGDB lookups by id."""
+
+    @pytest.fixture
+    def handler(self):
+        handler = IGDBHandler()
+        with (
+            patch("handler.metadata.igdb_handler.IGDB_API_ENABLED", True),
+            patch.object(
+                handler.twitch_auth, "get_oauth_token", AsyncMock(return_value="token")
+            ),
+        ):
+            yield handler
+
+    async def test_concurrent_lookups_are_batched(self, handler: IGDBHandler):
+        games = [
+            {"id": 1, "slug": "game-1", "name": "Game 1"},
+            {"id": 2, "slug": "game-2", "name": "Game 2"},
+        ]
+
+        with patch.object(
+            handler, "_request", AsyncMock(return_value=games)
+        ) as mock_request:
+            roms = await asyncio.gather(
+                handler.get_rom_by_id(2),
+                handler.get_rom_by_id(1),
+                handler.get_rom_by_id(2),
+                handler.get_rom_by_id(3),
+            )
+
+        mock_request.assert_awaited_once()
+        assert mock_request.await_args.args[1].endswith("where id=(1,2,3);")
+        assert [rom["igdb_id"] for rom in roms] == [2, 1, 2, None]
+        assert roms[1]["name"] == "Game 1"
+
+    async def test_failed_lookups_raise(self, handler: IGDBHandler):
+        with patch.object(
+            handler, "_request", AsyncMock(side_effect=[RuntimeError, []])
+        ) as mock_request:
+            results = await asyncio.gather(
+                handler.get_rom_by_id(1),
+                handler.get_rom_by_id(2),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, RuntimeError) for result in results)
+
+            # Later lookups start a new batch
+            assert (await handler.get_rom_by_id(1))["igdb_id"] is None
+
+        assert mock_request.await_count == 2
+
+
+class TestSearchRomSpeculatively:
+    """Test the concurrent IGDB search strategies."""
+
+    @pytest.fixture
+    def handler(self):
+        return IGDBHandler()
+
+    async def test_matches_follow_sequential_order(self, handler: IGDBHandler):
+        expanded_started = asyncio.Event()
+
+        async def search_expanded(*_args):
+            expanded_started.set()
+            await asyncio.sleep(1)
+            return {"id": 2}
+
+        async def search_games(*_args, with_game_type=False):
+            await expanded_started.wait()
+            return {"id": 1} if with_game_type else {"id": 3}
+
+        with (
+            patch.object(handler, "_search_games", side_effect=search_games),
+            patch.object(handler, "_search_expanded", side_effect=search_expanded),
+        ):
+            # The first strategy matches, the slower ones are cancelled
+            rom = await asyncio.wait_for(
+                handler._search_rom_speculatively("game", 7), timeout=0.5
+            )
+            assert rom == {"id": 1}
+
+    async def test_later_strategies_match(self, handler: IGDBHandler):
+        with (
+            patch.object(handler, "_search_games", AsyncMock(return_value=None)),
+            patch.object(
+                handler, "_search_expanded", AsyncMock(return_value={"id": 2})
+            ) as mock_search_expanded,
+        ):
+            assert await handler._search_rom_speculatively("game", 7) == {"id": 2}
+            assert await handler._search_rom_speculatively("game", 0) is None
+
+        mock_search_expanded.assert_awaited_once_with("game", 7)
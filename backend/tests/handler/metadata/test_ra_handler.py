@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from handler.metadata.ra_handler import RAHandler
+from handler.redis_handler import async_cache
+from models.platform import Platform
+from models.rom import Rom
+
+
+class TestSearchRom:
+    """Test the RetroAchievements hash lookup."""
+
+    @pytest.fixture
+    def handler(self):
+        return RAHandler()
+
+    @pytest.fixture
+    def rom(self):
+        platform = Platform(id=9999, name="NES", slug="nes", fs_slug="nes", ra_id=7)
+        return Rom(id=1, fs_name="game.nes", platform=platform)
+
+    @pytest.fixture(autouse=True)
+    async def clear_index(self, handler: RAHandler, rom: Rom):
+        yield
+        await async_cache.delete(handler._get_hashes_index_key(rom.platform.id))
+
+    async def test_lookups_reuse_index(self, handler: RAHandler, rom: Rom):
+        """Test the game list is fetched once and indexed by hash."""
+        games = [
+            {"ID": 1, "Title": "Game 1", "Hashes": ["AAAA", "bbbb"]},
+            {"ID": 2, "Title": "Game 2", "Hashes": ["cccc"]},
+        ]
+
+        with (
+            patch.object(
+                handler, "_days_since_last_cache_file_update", return_value=31
+            ),
+            patch.object(
+                handler.ra_service, "get_game_list", AsyncMock(return_value=games)
+            ) as mock_get_game_list,
+            patch(
+                "handler.metadata.ra_handler.fs_resource_handler.write_file",
+                AsyncMock(),
+            ),
+        ):
+            assert await handler._search_rom(rom, "aaaa") == games[0]
+            assert await handler._search_rom(rom, "BBBB") == games[0]
+            assert await handler._search_rom(rom, "cccc") == games[1]
+            assert await handler._search_rom(rom, "dddd") is None
+
+        mock_get_game_list.assert_called_once()
+
+    async def test_index_built_from_hashes_file(self, handler: RAHandler, rom: Rom):
+        """Test a fresh hashes file is indexed without calling the API."""
+        with (
+            patch.object(handler, "_days_since_last_cache_file_update", return_value=1),
+            patch.object(handler, "_exists_cache_file", return_value=True),
+            patch(
+                "handler.metadata.ra_handler.fs_resource_handler.read_file",
+                AsyncMock(return_value=b'[{"ID": 3, "Hashes": ["eeee"]}]'),
+            ),
+            patch.object(
+                handler.ra_service, "get_game_list", AsyncMock()
+            ) as mock_get_game_list,
+        ):
+            assert await handler._search_rom(rom, "eeee") == {
+                "ID": 3,
+                "Hashes": ["eeee"],
+            }
+
+        mock_get_game_list.assert_not_called()
+        assert (
+            0
+            < await async_cache.ttl(handler._get_hashes_index_key(rom.platform.id))
+            <= 29 * 24 * 3600
+        )
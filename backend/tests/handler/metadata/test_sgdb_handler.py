@@ -0,0 +1,47 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from handler.metadata.sgdb_handler import SGDBBaseHandler, SGDBRom
+
+
+class TestGetDetailsByNames:
+    """Test the SteamGridDB lookup of the candidate names."""
+
+    @pytest.fixture
+    def handler(self):
+        with patch("handler.metadata.sgdb_handler.STEAMGRIDDB_API_ENABLED", True):
+            yield SGDBBaseHandler()
+
+    async def test_first_matching_name_wins(self, handler: SGDBBaseHandler):
+        looked_up: list[str] = []
+        cancelled: list[str] = []
+
+        async def get_details_by_name(name: str) -> SGDBRom:
+            looked_up.append(name)
+            try:
+                await asyncio.sleep({"Game": 0.02, "Game II": 0.01}.get(name, 1))
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return SGDBRom(sgdb_id=2) if name == "Game II" else SGDBRom(sgdb_id=None)
+
+        with patch.object(
+            handler, "get_details_by_name", side_effect=get_details_by_name
+        ):
+            sgdb_rom = await asyncio.wait_for(
+                handler.get_details_by_names(["Game", "game", "Game II", "Game III"]),
+                timeout=0.5,
+            )
+
+        assert sgdb_rom == SGDBRom(sgdb_id=2)
+        # Names are deduplicated and looked up at once
+        assert looked_up == ["Game", "Game II", "Game III"]
+        # The other lookups are cancelled and waited for before returning
+        assert cancelled == ["Game III"]
+
+    async def test_no_match(self, handler: SGDBBaseHandler):
+        with patch.object(
+            handler, "get_details_by_name", return_value=SGDBRom(sgdb_id=None)
+        ):
+            assert await handler.get_details_by_names(["Game"]) == SGDBRom(sgdb_id=None)
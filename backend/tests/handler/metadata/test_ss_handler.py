@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from handler.metadata.ss_handler import SSHandler
+from models.rom import RomFile
+
+
+class TestGetRom:
+    """Test the ScreenScraper rom identification."""
+
+    @pytest.fixture
+    def handler(self):
+        with patch("handler.metadata.ss_handler.SS_API_ENABLED", True):
+            yield SSHandler()
+
+    @pytest.fixture
+    def files(self):
+        return [
+            RomFile(file_name="game.cue", file_size_bytes=100, crc_hash="aaaa"),
+            RomFile(file_name="game.bin", file_size_bytes=5000, crc_hash="bbbb"),
+            RomFile(file_name="notes.txt", file_size_bytes=9000),
+        ]
+
+    async def test_hash_match_skips_name_search(self, handler: SSHandler, files):
+        game = {"id": 1, "noms": [{"region": "ss", "text": "Game"}]}
+
+        with (
+            patch.object(
+                handler.ss_service, "get_game_info", AsyncMock(return_value=game)
+            ) as mock_get_game_info,
+            patch.object(handler, "_search_rom", AsyncMock()) as mock_search_rom,
+        ):
+            rom = await handler.get_rom("game.cue", 57, files=files)
+
+        assert rom["ss_id"] == 1
+        mock_get_game_info.assert_awaited_once_with(
+            crc="bbbb",
+            md5=None,
+            sha1=None,
+            system_id=57,
+            rom_type="rom",
+            rom_name="game.bin",
+            rom_size_bytes=5000,
+        )
+        mock_search_rom.assert_not_called()
+
+    async def test_hash_miss_falls_back_to_name(self, handler: SSHandler, files):
+        with (
+            patch.object(
+                handler.ss_service, "get_game_info", AsyncMock(return_value=None)
+            ),
+            patch.object(
+                handler, "_search_rom", AsyncMock(return_value=None)
+            ) as mock_search_rom,
+        ):
+            rom = await handler.get_rom("game.cue", 57, files=files)
+
+        assert rom["ss_id"] is None
+        mock_search_rom.assert_awaited_once()
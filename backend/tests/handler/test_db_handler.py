@@ -9,7 +9,7 @@ from handler.database import (
 )
 from models.assets import Save, Screenshot, State
 from models.platform import Platform
-from models.rom import Rom
+from models.rom import Rom, RomFile
 from models.user import Role, User
 from sqlalchemy.exc import IntegrityError
 
@@ -53,6 +53,11 @@ def test_roms(rom: Rom, platform: Platform):
     assert rom_1 is not None
     assert rom_1.fs_name == "test_rom.zip"
 
+    assert db_rom_handler.get_roms_by_ids(platform.id, [rom_1.id]).keys() == {
+        "test_rom.zip"
+    }
+    assert db_rom_handler.get_roms_by_ids(platform.id + 1, [rom_1.id]) == {}
+
     db_rom_handler.update_rom(roms[1].id, {"fs_name": "test_rom_2_updated"})
     rom_2 = db_rom_handler.get_rom(roms[1].id)
     assert rom_2 is not None
@@ -69,6 +74,38 @@ def test_roms(rom: Rom, platform: Platform):
     assert len(roms) == 1
 
 
+def test_sync_rom_files(rom: Rom):
+    db_rom_handler.sync_rom_files(
+        rom.id,
+        [
+            RomFile(file_path="roms", file_name="disc1.bin", file_size_bytes=1),
+            RomFile(file_path="roms", file_name="disc2.bin", file_size_bytes=2),
+        ],
+    )
+    stored_files = {f.file_name: f for f in db_rom_handler.get_rom(rom.id).files}
+    assert set(stored_files) == {"disc1.bin", "disc2.bin"}
+
+    db_rom_handler.sync_rom_files(
+        rom.id,
+        [
+            RomFile(file_path="roms", file_name="disc1.bin", file_size_bytes=1),
+            RomFile(file_path="roms", file_name="disc2.bin", file_size_bytes=20),
+            RomFile(file_path="roms", file_name="disc3.bin", file_size_bytes=3),
+        ],
+    )
+    synced_files = {f.file_name: f for f in db_rom_handler.get_rom(rom.id).files}
+    assert set(synced_files) == {"disc1.bin", "disc2.bin", "disc3.bin"}
+    assert synced_files["disc1.bin"].id == stored_files["disc1.bin"].id
+    assert synced_files["disc2.bin"].id == stored_files["disc2.bin"].id
+    assert synced_files["disc2.bin"].file_size_bytes == 20
+
+    db_rom_handler.sync_rom_files(
+        rom.id, [RomFile(file_path="roms", file_name="disc3.bin", file_size_bytes=3)]
+    )
+    synced_files = {f.file_name: f for f in db_rom_handler.get_rom(rom.id).files}
+    assert list(synced_files) == ["disc3.bin"]
+
+
 def test_users(admin_user):
     db_user_handler.add_user(
         User(
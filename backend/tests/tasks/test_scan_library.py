@@ -16,6 +16,7 @@ class TestScanLibraryTask:
         assert task.description == "Rescans the entire library"
 
     @patch("tasks.scheduled.scan_library.ENABLE_SCHEDULED_RESCAN", True)
+    @patch("tasks.scheduled.scan_library.ENABLE_SCHEDULED_RESCAN_RESUME", True)
     @patch("tasks.scheduled.scan_library.IGDB_API_ENABLED", False)
     @patch("tasks.scheduled.scan_library.SS_API_ENABLED", False)
     @patch("tasks.scheduled.scan_library.MOBY_API_ENABLED", False)
@@ -36,6 +37,7 @@ class TestScanLibraryTask:
             [],
             scan_type=ScanType.UNIDENTIFIED,
             metadata_sources=[MetadataSource.RA, MetadataSource.LB],
+            resume=True,
         )
         mock_log.info.assert_any_call("Scheduled library scan done")
 
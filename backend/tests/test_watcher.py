@@ -0,0 +1,118 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from config import LIBRARY_BASE_PATH
+from endpoints.sockets.scan import (
+    SCAN_FS_CHANGES_FUNC_NAME,
+    SCAN_PLATFORMS_FUNC_NAME,
+    scan_fs_changes,
+    scan_platforms,
+)
+from handler.scan_handler import MetadataSource, ScanType
+from models.platform import Platform
+from rq.job import Job
+from watcher import EventType, process_changes
+
+
+def make_job(func_name: str, *args, **kwargs) -> Mock:
+    return Mock(spec=Job, func_name=func_name, args=args, kwargs=kwargs)
+
+
+class TestProcessChanges:
+    """Test the scans scheduled for file system changes."""
+
+    @pytest.fixture(autouse=True)
+    def watcher_config(self):
+        with (
+            patch("watcher.ENABLE_RESCAN_ON_FILESYSTEM_CHANGE", True),
+            patch("watcher.IGDB_API_ENABLED", True),
+            patch("watcher.SS_API_ENABLED", False),
+            patch("watcher.MOBY_API_ENABLED", False),
+            patch("watcher.RA_API_ENABLED", False),
+            patch("watcher.LAUNCHBOX_API_ENABLED", False),
+            patch("watcher.HASHEOUS_API_ENABLED", False),
+            patch("watcher.STEAMGRIDDB_API_ENABLED", False),
+            patch("watcher.structure_level", 1),
+            patch(
+                "watcher.fs_rom_handler.get_roms_fs_structure",
+                side_effect=lambda fs_slug: f"{fs_slug}/roms",
+            ),
+        ):
+            yield
+
+    @pytest.fixture
+    def tasks_scheduler(self):
+        with patch("watcher.tasks_scheduler") as tasks_scheduler:
+            tasks_scheduler.get_jobs.return_value = []
+            yield tasks_scheduler
+
+    @pytest.fixture
+    def add_fs_changes(self):
+        with patch("watcher.add_fs_changes") as add_fs_changes:
+            yield add_fs_changes
+
+    @pytest.fixture(autouse=True)
+    def platforms(self):
+        platform = Platform(id=1, fs_slug="n64", slug="n64", name="Nintendo 64")
+        with patch(
+            "watcher.db_platform_handler.get_platforms_by_fs_slugs",
+            return_value=[platform],
+        ):
+            yield
+
+    def test_rom_changes_are_scanned_once(self, tasks_scheduler, add_fs_changes):
+        process_changes(
+            [
+                (EventType.ADDED, f"{LIBRARY_BASE_PATH}/n64/roms/a.z64"),
+                (EventType.DELETED, f"{LIBRARY_BASE_PATH}/n64/roms/Multi/disc1.z64"),
+                (EventType.MODIFIED, f"{LIBRARY_BASE_PATH}/n64/roms/b.z64"),
+            ]
+        )
+
+        add_fs_changes.assert_called_once_with(1, {"a.z64", "Multi"})
+        tasks_scheduler.enqueue_in.assert_called_once()
+        _, func, *args = tasks_scheduler.enqueue_in.call_args.args
+        assert func is scan_fs_changes
+        assert args == [1, [MetadataSource.IGDB]]
+
+        # Changes reported before the scan runs are merged into the scheduled one
+        tasks_scheduler.enqueue_in.reset_mock()
+        tasks_scheduler.get_jobs.return_value = [
+            make_job(SCAN_FS_CHANGES_FUNC_NAME, 1, [MetadataSource.IGDB])
+        ]
+        process_changes([(EventType.ADDED, f"{LIBRARY_BASE_PATH}/n64/roms/c.z64")])
+
+        add_fs_changes.assert_called_with(1, {"c.z64"})
+        tasks_scheduler.enqueue_in.assert_not_called()
+
+    def test_platform_directory_changes(self, tasks_scheduler, add_fs_changes):
+        process_changes([(EventType.ADDED, f"{LIBRARY_BASE_PATH}/psx")])
+
+        tasks_scheduler.enqueue_in.assert_called_once()
+        _, func, *args = tasks_scheduler.enqueue_in.call_args.args
+        assert func is scan_platforms
+        assert args == [[]]
+        assert tasks_scheduler.enqueue_in.call_args.kwargs == {
+            "scan_type": ScanType.NEW_PLATFORMS,
+            "metadata_sources": [MetadataSource.IGDB],
+        }
+        add_fs_changes.assert_not_called()
+
+        # The platforms scan already scheduled covers new platform directories
+        tasks_scheduler.enqueue_in.reset_mock()
+        tasks_scheduler.get_jobs.return_value = [
+            make_job(SCAN_PLATFORMS_FUNC_NAME, [], scan_type=ScanType.NEW_PLATFORMS)
+        ]
+        process_changes([(EventType.ADDED, f"{LIBRARY_BASE_PATH}/snes")])
+
+        tasks_scheduler.enqueue_in.assert_not_called()
+
+    def test_full_rescan_already_scheduled(self, tasks_scheduler, add_fs_changes):
+        tasks_scheduler.get_jobs.return_value = [
+            make_job(SCAN_PLATFORMS_FUNC_NAME, [], scan_type=ScanType.QUICK)
+        ]
+
+        process_changes([(EventType.ADDED, f"{LIBRARY_BASE_PATH}/n64/roms/a.z64")])
+
+        add_fs_changes.assert_not_called()
+        tasks_scheduler.enqueue_in.assert_not_called()
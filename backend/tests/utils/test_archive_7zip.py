@@ -0,0 +1,59 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+from exceptions.fs_exceptions import ArchiveExtractionException
+from utils.archive_7zip import process_file_7z
+
+FAKE_7ZIP_SCRIPT = """#!/bin/sh
+if [ "$1" = "l" ]; then
+    printf 'Path = small.bin\\nSize = 4\\nAttributes = A\\n\\n'
+    printf 'Path = game.iso\\nSize = 9\\nAttributes = A\\n'
+elif [ "$1" = "e" ] && [ "$3" = "game.iso" ] && [ "$4" = "-so" ]; then
+    printf 'game data'
+else
+    exit 2
+fi
+"""
+
+
+class TestProcessFile7z:
+    """Test the process_file_7z function."""
+
+    @pytest.fixture
+    def fake_7zip(self, tmp_path: Path, monkeypatch):
+        fake_7zip = tmp_path / "7zz"
+        fake_7zip.write_text(FAKE_7ZIP_SCRIPT)
+        fake_7zip.chmod(0o755)
+        monkeypatch.setattr("utils.archive_7zip.SEVEN_ZIP_PATH", str(fake_7zip))
+        return fake_7zip
+
+    def test_streams_largest_file_into_hasher(self, fake_7zip, tmp_path: Path):
+        """Test the largest file is hashed straight from 7zip's output."""
+        md5_h = hashlib.md5(usedforsecurity=False)
+
+        processed = process_file_7z(tmp_path / "game.7z", md5_h.update)
+
+        assert processed
+        assert md5_h.hexdigest() == hashlib.md5(b"game data").hexdigest()
+        assert [path.name for path in tmp_path.iterdir()] == ["7zz"]
+
+    def test_extraction_error_without_data(self, fake_7zip, tmp_path: Path):
+        """Test failed extractions are reported so the archive can be hashed instead."""
+        fake_7zip.write_text(FAKE_7ZIP_SCRIPT.replace('game.iso" ]', 'other.iso" ]'))
+        md5_h = hashlib.md5(usedforsecurity=False)
+
+        processed = process_file_7z(tmp_path / "game.7z", md5_h.update)
+
+        assert not processed
+        assert md5_h.digest() == hashlib.md5(b"").digest()
+
+    def test_extraction_error_after_data(self, fake_7zip, tmp_path: Path):
+        """Test extractions failing midway are raised instead of reported as hashed."""
+        fake_7zip.write_text(
+            FAKE_7ZIP_SCRIPT.replace("printf 'game data'", "printf 'game'; exit 2")
+        )
+        md5_h = hashlib.md5(usedforsecurity=False)
+
+        with pytest.raises(ArchiveExtractionException):
+            process_file_7z(tmp_path / "game.7z", md5_h.update)
@@ -1,9 +1,17 @@
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import pytest
 from handler.metadata.base_hander import MAME_XML_KEY, METADATA_FIXTURES_DIR
 from handler.redis_handler import async_cache
 from redis.asyncio import Redis as AsyncRedis
-from utils.cache import conditionally_set_cache
+from utils.cache import (
+    API_CACHE_KEY_PREFIX,
+    cached_api_response,
+    conditionally_set_cache,
+    scan_memoized,
+)
+from utils.context import ctx_refresh_api_cache, ctx_scan_lookups, set_context_var
 
 
 class TestConditionallySetCache:
@@ -53,3 +61,151 @@ class TestConditionallySetCache:
         )
 
         mock_cache_pipeline.assert_not_called()
+
+
+@patch("utils.cache.ENABLE_METADATA_API_CACHE", True)
+@patch("utils.cache.METADATA_API_CACHE_MAX_ENTRIES", 2)
+class TestCachedApiResponse:
+    """Test the cached_api_response decorator."""
+
+    @staticmethod
+    def make_service(request: AsyncMock):
+        class Service:
+            @cached_api_response("test", ttl=60)
+            async def _request(self, url: str) -> dict:
+                return await request(url)
+
+        return Service()
+
+    @pytest.fixture(autouse=True)
+    async def clear_cache(self):
+        yield
+        keys = await async_cache.keys(f"{API_CACHE_KEY_PREFIX}:test:*")
+        if keys:
+            await async_cache.delete(*keys)
+
+    async def test_responses_are_cached(self):
+        request = AsyncMock(side_effect=lambda url: {"url": url})
+        service = self.make_service(request)
+
+        assert await service._request("https://a") == {"url": "https://a"}
+        assert await service._request("https://a") == {"url": "https://a"}
+        assert await service._request("https://b") == {"url": "https://b"}
+        assert request.await_count == 2
+
+    async def test_empty_responses_are_not_cached(self):
+        request = AsyncMock(return_value={})
+        service = self.make_service(request)
+
+        await service._request("https://a")
+        await service._request("https://a")
+        assert request.await_count == 2
+
+    async def test_refresh_bypasses_cache(self):
+        request = AsyncMock(side_effect=[{"v": 1}, {"v": 2}])
+        service = self.make_service(request)
+
+        assert await service._request("https://a") == {"v": 1}
+        async with set_context_var(ctx_refresh_api_cache, True):
+            assert await service._request("https://a") == {"v": 2}
+        # The refreshed response replaces the cached one
+        assert await service._request("https://a") == {"v": 2}
+        assert request.await_count == 2
+
+    async def test_oldest_responses_are_evicted(self):
+        request = AsyncMock(side_effect=lambda url: {"url": url})
+        service = self.make_service(request)
+
+        for url in ("https://a", "https://b", "https://c"):
+            await service._request(url)
+        assert request.await_count == 3
+
+        await service._request("https://c")
+        assert request.await_count == 3
+        await service._request("https://a")
+        assert request.await_count == 4
+
+
+class TestScanMemoized:
+    """Test the scan_memoized decorator."""
+
+    @staticmethod
+    def make_service(lookup: AsyncMock):
+        class Service:
+            @scan_memoized("test")
+            async def get_game(self, game_id: int) -> dict:
+                await asyncio.sleep(0)
+                return await lookup(game_id)
+
+        return Service()
+
+    async def test_lookups_are_shared_during_scan(self):
+        lookup = AsyncMock(side_effect=lambda game_id: {"id": game_id})
+        service = self.make_service(lookup)
+
+        async with set_context_var(ctx_scan_lookups, {}):
+            games = await asyncio.gather(
+                service.get_game(1), service.get_game(1), service.get_game(2)
+            )
+            assert await service.get_game(1) == {"id": 1}
+
+        assert games == [{"id": 1}, {"id": 1}, {"id": 2}]
+        assert lookup.await_count == 2
+
+        # Results are copied, so callers can't modify the shared ones
+        games[0]["id"] = 3
+        assert games[1] == {"id": 1}
+
+    async def test_lookups_outside_scan_are_not_shared(self):
+        lookup = AsyncMock(return_value={"id": 1})
+        service = self.make_service(lookup)
+
+        await service.get_game(1)
+        await service.get_game(1)
+        assert lookup.await_count == 2
+
+    async def test_failed_lookups_are_retried(self):
+        lookup = AsyncMock(side_effect=[RuntimeError, {}, {"id": 1}])
+        service = self.make_service(lookup)
+
+        async with set_context_var(ctx_scan_lookups, {}):
+            with pytest.raises(RuntimeError):
+                await service.get_game(1)
+            assert await service.get_game(1) == {}
+            assert await service.get_game(1) == {"id": 1}
+            assert await service.get_game(1) == {"id": 1}
+
+        assert lookup.await_count == 3
+
+    async def test_lookups_keyed_by_arguments_subset(self):
+        lookup = AsyncMock(side_effect=lambda game: {"id": game["id"]})
+
+        class Service:
+            @scan_memoized("test", key=lambda self, game: game["id"])
+            async def get_game(self, game: dict) -> dict:
+                return await lookup(game)
+
+        service = Service()
+        async with set_context_var(ctx_scan_lookups, {}):
+            assert await service.get_game({"id": 1, "name": "a"}) == {"id": 1}
+            assert await service.get_game({"id": 1, "name": "b"}) == {"id": 1}
+            assert await service.get_game({"id": 2, "name": "a"}) == {"id": 2}
+
+        assert lookup.await_count == 2
+
+    async def test_fallback_results_are_retried(self):
+        lookup = AsyncMock(side_effect=[{"id": None}, {"id": 1}])
+
+        class Service:
+            @scan_memoized("test", found=lambda game: bool(game["id"]))
+            async def get_game(self, game_id: int) -> dict:
+                return await lookup(game_id)
+
+        service = Service()
+        async with set_context_var(ctx_scan_lookups, {}):
+            # The provider failed and returned its fallback, which isn't kept
+            assert await service.get_game(1) == {"id": None}
+            assert await service.get_game(1) == {"id": 1}
+            assert await service.get_game(1) == {"id": 1}
+
+        assert lookup.await_count == 2
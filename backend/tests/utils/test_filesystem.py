@@ -0,0 +1,66 @@
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from utils.filesystem import iter_directories, iter_files, list_directory
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    (tmp_path / "game.z64").write_bytes(b"rom")
+    (tmp_path / "Multi Game" / "Disc 1").mkdir(parents=True)
+    (tmp_path / "Multi Game" / "game.cue").write_bytes(b"cue")
+    (tmp_path / "Multi Game" / "Disc 1" / "track.bin").write_bytes(b"bin")
+    (tmp_path / "link").symlink_to(tmp_path / "Multi Game")
+
+    # Make the directories old enough to be cached
+    old_mtime = time.time() - 60
+    for path in (tmp_path, tmp_path / "Multi Game", tmp_path / "Multi Game" / "Disc 1"):
+        os.utime(path, (old_mtime, old_mtime))
+
+    return tmp_path
+
+
+def test_iter_files(library: Path):
+    assert sorted(file for _, file in iter_files(str(library))) == ["game.z64"]
+    assert sorted(
+        (str(root.relative_to(library)), file)
+        for root, file in iter_files(str(library), recursive=True)
+    ) == [
+        (".", "game.z64"),
+        ("Multi Game", "game.cue"),
+        ("Multi Game/Disc 1", "track.bin"),
+    ]
+    assert list(iter_files(str(library / "missing"))) == []
+
+
+def test_iter_directories(library: Path):
+    assert sorted(directory for _, directory in iter_directories(str(library))) == [
+        "Multi Game",
+        "link",
+    ]
+
+
+@patch("utils.filesystem.ENABLE_SCAN_LISTING_CACHE", True)
+def test_list_directory_cache(library: Path):
+    with patch(
+        "utils.filesystem._scan_directory",
+        return_value=(["game.z64"], ["Multi Game", "link"]),
+    ) as mock_scan:
+        assert list_directory(str(library)) == (["game.z64"], ["Multi Game", "link"])
+        assert list_directory(str(library)) == (["game.z64"], ["Multi Game", "link"])
+        assert mock_scan.call_count == 1
+
+        # A changed directory is listed again
+        old_mtime = time.time() - 30
+        os.utime(library, (old_mtime, old_mtime))
+        list_directory(str(library))
+        assert mock_scan.call_count == 2
+
+        # Recently modified directories aren't cached
+        os.utime(library)
+        list_directory(str(library))
+        list_directory(str(library))
+        assert mock_scan.call_count == 4
@@ -0,0 +1,76 @@
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from handler.redis_handler import async_cache
+from utils.rate_limiter import (
+    RATE_LIMIT_KEY_PREFIX,
+    ProviderRateLimiter,
+    parse_retry_after,
+)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after({}) is None
+    assert parse_retry_after({"Retry-After": "invalid"}) is None
+    assert parse_retry_after({"Retry-After": "5"}) == 5.0
+
+    retry_at = formatdate(time.time() + 30, usegmt=True)
+    assert 25 <= parse_retry_after({"Retry-After": retry_at}) <= 30
+
+
+class TestProviderRateLimiter:
+    """Test the ProviderRateLimiter class."""
+
+    @pytest.fixture
+    async def limiter(self):
+        yield ProviderRateLimiter("test", requests_per_second=2, max_concurrency=4)
+        keys = await async_cache.keys(f"{RATE_LIMIT_KEY_PREFIX}:test:*")
+        if keys:
+            await async_cache.delete(*keys)
+
+    async def test_requests_over_the_rate_wait(self, limiter: ProviderRateLimiter):
+        with (
+            patch("utils.rate_limiter.time.time", return_value=1000.5),
+            patch("utils.rate_limiter.asyncio.sleep", AsyncMock()) as mock_sleep,
+        ):
+            for _ in range(2):
+                async with limiter.acquire():
+                    pass
+            mock_sleep.assert_not_called()
+
+            # The third request waits for the next window, which is also full
+            mock_sleep.side_effect = [None, TimeoutError]
+            with pytest.raises(TimeoutError):
+                async with limiter.acquire():
+                    pass
+            mock_sleep.assert_awaited_with(0.5)
+
+    async def test_throttle_pauses_requests(self, limiter: ProviderRateLimiter):
+        await limiter.throttle(retry_after=10)
+        assert limiter.concurrency == 2
+        assert 0 < await async_cache.pttl(limiter._throttled_key) <= 10_000
+
+        with patch(
+            "utils.rate_limiter.asyncio.sleep", AsyncMock(side_effect=TimeoutError)
+        ) as mock_sleep:
+            with pytest.raises(TimeoutError):
+                async with limiter.acquire():
+                    pass
+            assert 9 < mock_sleep.await_args.args[0] <= 10
+
+    def test_concurrency_adapts_to_latency(self, limiter: ProviderRateLimiter):
+        limiter.concurrency = 2
+        limiter._record_latency(1.0)
+        limiter._record_latency(1.0)
+        assert limiter.concurrency == 3
+
+        # A slow response reduces the concurrency
+        limiter._record_latency(5.0)
+        assert limiter.concurrency == 2
+
+        for _ in range(10):
+            limiter._record_latency(1.0)
+        assert limiter.concurrency == limiter.max_concurrency
@@ -1,19 +1,20 @@
 # trunk-ignore-all(bandit/B404)
 
 import subprocess
-import tempfile
-from collections.abc import Callable
+from collections.abc import Buffer, Callable
 from pathlib import Path
 
+from config import SCAN_HASHING_BLOCK_SIZE
+from exceptions.fs_exceptions import ArchiveExtractionException
 from logger.logger import log
 
 SEVEN_ZIP_PATH = "/usr/bin/7zz"
-FILE_READ_CHUNK_SIZE = 1024 * 8
+FILE_READ_CHUNK_SIZE = SCAN_HASHING_BLOCK_SIZE
 
 
 def process_file_7z(
     file_path: Path,
-    fn_hash_update: Callable[[bytes | bytearray], None],
+    fn_hash_update: Callable[[Buffer], None],
 ) -> bool:
     """
     Process a 7zip file using the system's 7zip binary and use the provided callables to update the calculated hashes.
@@ -21,6 +22,9 @@ def process_file_7z(
     Args:
         file_path: Path to the 7z file
         fn_hash_update: Callback to update hashes with data chunks
+    Raises:
+        ArchiveExtractionException: if the extraction failed after part of the file
+            was already passed to fn_hash_update
     """
 
     try:
@@ -60,34 +64,39 @@ def process_file_7z(
         if not largest_file:
             return False
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log.debug(f"Extracting {largest_file} from {file_path}...")
-
-            temp_path = Path(temp_dir)
-            subprocess.run(
-                [
-                    SEVEN_ZIP_PATH,
-                    "e",
-                    str(file_path),
-                    largest_file,
-                    f"-o{temp_path}",
-                    "-y",
-                ],
-                capture_output=True,
-                check=True,
-                timeout=60,
-                shell=False,  # trunk-ignore(bandit/B603): 7z path is hardcoded, args are validated
-            )
-
-            # Get the first file in temp_path
-            extracted_file = next(temp_path.iterdir(), None)
-            if extracted_file and extracted_file.exists():
-                with open(extracted_file, "rb") as f:
-                    while chunk := f.read(FILE_READ_CHUNK_SIZE):
-                        fn_hash_update(chunk)
-
-                return True
-            return False
+        log.debug(f"Streaming {largest_file} from {file_path}...")
+
+        # Extract the file to stdout and hash it as it's decompressed, so large
+        # archives don't need to be written to disk and read back
+        streamed = False
+        with subprocess.Popen(
+            [
+                SEVEN_ZIP_PATH,
+                "e",
+                str(file_path),
+                largest_file,
+                "-so",
+                "-y",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            shell=False,  # trunk-ignore(bandit/B603): 7z path is hardcoded, args are validated
+        ) as process:
+            buffer = memoryview(bytearray(FILE_READ_CHUNK_SIZE))
+            while size := process.stdout.readinto(buffer):  # type: ignore
+                with buffer[:size] as chunk:
+                    fn_hash_update(chunk)
+                streamed = True
+
+        if process.returncode != 0:
+            if not streamed:
+                raise subprocess.CalledProcessError(process.returncode, process.args)
+
+            # Part of the file was already hashed, so there's no falling back to
+            # hashing the archive itself, and the hashes can't be trusted
+            raise ArchiveExtractionException(largest_file, str(file_path))
+
+        return True
 
     except (
         subprocess.TimeoutExpired,
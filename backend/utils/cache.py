@@ -1,10 +1,25 @@
+import asyncio
+import copy
+import functools
+import hashlib
 import json
+import time
+from collections.abc import Awaitable, Callable
 from itertools import batched
 from pathlib import Path
+from typing import Any, Final, ParamSpec, TypeVar
 
 from anyio import open_file
+from config import ENABLE_METADATA_API_CACHE, METADATA_API_CACHE_MAX_ENTRIES
+from handler.redis_handler import async_cache
 from logger.logger import log
 from redis.asyncio import Redis as AsyncRedis
+from utils.context import ctx_refresh_api_cache, ctx_scan_lookups
+
+API_CACHE_KEY_PREFIX: Final = "romm:api_cache"
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
 
 
 async def conditionally_set_cache(cache: AsyncRedis, key: str, file_path: Path) -> None:
@@ -22,3 +37,140 @@ async def conditionally_set_cache(cache: AsyncRedis, key: str, file_path: Path)
     except Exception as e:
         # Log the error but don't fail - this allows migrations to run even if Redis is not available
         log.warning(f"Failed to initialize cache for {key}: {e}")
+
+
+def _get_api_cache_key(provider: str, func: Callable, args: tuple, kwargs: dict) -> str:
+    request = json.dumps(
+        [func.__qualname__, args, kwargs], sort_keys=True, default=str
+    ).encode()
+    return f"{API_CACHE_KEY_PREFIX}:{provider}:{hashlib.sha256(request).hexdigest()}"
+
+
+async def _store_api_response(provider: str, key: str, value: Any, ttl: int) -> None:
+    """Store a response, evicting the oldest ones when the provider is over its limit."""
+    index_key = f"{API_CACHE_KEY_PREFIX}:{provider}:index"
+    now = time.time()
+
+    async with async_cache.pipeline() as pipe:
+        await pipe.set(key, json.dumps(value), ex=ttl)
+        await pipe.zadd(index_key, {key: now})
+        # Expired responses are dropped from the index, not counted against the limit
+        await pipe.zremrangebyscore(index_key, 0, now - ttl)
+        await pipe.zcard(index_key)
+        *_, cached_count = await pipe.execute()
+
+    if cached_count > METADATA_API_CACHE_MAX_ENTRIES:
+        evicted = await async_cache.zpopmin(
+            index_key, cached_count - METADATA_API_CACHE_MAX_ENTRIES
+        )
+        await async_cache.delete(*(evicted_key for evicted_key, _ in evicted))
+
+
+def _forget_failed_lookup(
+    lookups: dict[str, asyncio.Future],
+    key: str,
+    found: Callable[[Any], bool],
+    lookup: asyncio.Future,
+) -> None:
+    if (
+        lookup.cancelled()
+        or lookup.exception() is not None
+        or not found(lookup.result())
+    ):
+        if lookups.get(key) is lookup:
+            del lookups[key]
+
+
+def scan_memoized(
+    provider: str,
+    key: Callable[..., Any] | None = None,
+    found: Callable[[Any], bool] = bool,
+) -> Callable[[Callable[_P, Awaitable[_R]]], Callable[_P, Awaitable[_R]]]:
+    """Share the results of a metadata provider lookup during a scan.
+
+    While `ctx_scan_lookups` is set, lookups with the same arguments are made once:
+    concurrent calls wait for the one in flight, and later calls reuse its result.
+    Errors and results that `found` rejects are not kept, so they are looked up again.
+    Results are kept until the scan ends, so only lookups by id or by hash should use it.
+
+    Args:
+        provider (str): Name of the provider, used to namespace its lookups
+        key (Callable, optional): Builds the part of the call arguments that
+            identifies the lookup, for arguments that can't be serialized as they are
+        found (Callable, optional): Tells whether a result was found, defaults to
+            non-empty results. Providers returning a fallback on errors check its id
+    """
+
+    def decorator(func: Callable[_P, Awaitable[_R]]) -> Callable[_P, Awaitable[_R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            lookups = ctx_scan_lookups.get()
+            if lookups is None:
+                return await func(*args, **kwargs)
+
+            # Skip the instance, its state is not part of the lookup
+            lookup_key = (
+                _get_api_cache_key(provider, func, (key(*args, **kwargs),), {})
+                if key
+                else _get_api_cache_key(provider, func, args[1:], kwargs)
+            )
+            lookup = lookups.get(lookup_key)
+            if lookup is None:
+                lookup = lookups[lookup_key] = asyncio.ensure_future(
+                    func(*args, **kwargs)
+                )
+                lookup.add_done_callback(
+                    functools.partial(_forget_failed_lookup, lookups, lookup_key, found)
+                )
+
+            # The lookup is shared, so it isn't cancelled with the caller, and its
+            # result is copied in case the caller modifies it
+            return copy.deepcopy(await asyncio.shield(lookup))
+
+        return wrapper
+
+    return decorator
+
+
+def cached_api_response(
+    provider: str, ttl: int
+) -> Callable[[Callable[_P, Awaitable[_R]]], Callable[_P, Awaitable[_R]]]:
+    """Cache the responses of a metadata provider API method in Redis.
+
+    Responses are keyed by the provider, the method and its arguments, so requests
+    must not carry credentials in their arguments. Empty responses, which the
+    providers also return on errors, are not cached. When `ctx_refresh_api_cache`
+    is set, cached responses are ignored and replaced with fresh ones.
+
+    Args:
+        provider (str): Name of the provider, used to namespace its responses
+        ttl (int): Time in seconds the responses are kept
+    """
+
+    def decorator(func: Callable[_P, Awaitable[_R]]) -> Callable[_P, Awaitable[_R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            if not ENABLE_METADATA_API_CACHE:
+                return await func(*args, **kwargs)
+
+            # Skip the instance, its state is not part of the request
+            key = _get_api_cache_key(provider, func, args[1:], kwargs)
+            try:
+                if not ctx_refresh_api_cache.get() and (
+                    cached := await async_cache.get(key)
+                ):
+                    return json.loads(cached)
+            except Exception as e:
+                log.warning(f"Failed to read cached {provider} response: {e}")
+
+            response = await func(*args, **kwargs)
+            if response:
+                try:
+                    await _store_api_response(provider, key, response, ttl)
+                except Exception as e:
+                    log.warning(f"Failed to cache {provider} response: {e}")
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from contextvars import ContextVar, Token
@@ -11,6 +12,12 @@ _T = TypeVar("_T")
 
 ctx_aiohttp_session: ContextVar[aiohttp.ClientSession] = ContextVar("aiohttp_session")
 ctx_httpx_client: ContextVar[httpx.AsyncClient] = ContextVar("httpx_client")
+# Set to bypass cached metadata provider responses, forcing them to be fetched again
+ctx_refresh_api_cache: ContextVar[bool] = ContextVar("refresh_api_cache", default=False)
+# Metadata provider lookups shared by the roms of a scan, see utils.cache.scan_memoized
+ctx_scan_lookups: ContextVar[dict[str, asyncio.Future] | None] = ContextVar(
+    "scan_lookups", default=None
+)
 
 
 @asynccontextmanager
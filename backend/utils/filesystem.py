@@ -1,7 +1,102 @@
+import json
 import os
 import re
+import stat
+import time
 from collections.abc import Iterator
 from pathlib import Path
+from typing import Final
+
+from config import ENABLE_SCAN_LISTING_CACHE
+from handler.redis_handler import sync_cache
+
+LISTING_CACHE_KEY_PREFIX: Final = "romm:fs_listing"
+LISTING_CACHE_TTL: Final = 60 * 60 * 24 * 7  # 7 days
+# Directories modified more recently aren't cached, as later changes within the
+# mtime resolution of the file system would go unnoticed
+LISTING_CACHE_MIN_AGE_NS: Final = 2 * 1_000_000_000  # 2 seconds
+
+
+def _scan_directory(path: str) -> tuple[list[str], list[str]]:
+    files: list[str] = []
+    directories: list[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            (directories if is_dir else files).append(entry.name)
+
+    return files, directories
+
+
+def list_directory(
+    path: str, path_stat: os.stat_result | None = None
+) -> tuple[list[str], list[str]]:
+    """List the files and directories in a directory.
+
+    With ENABLE_SCAN_LISTING_CACHE, the listing is cached by directory mtime, so unchanged
+    directories cost a single stat instead of reading all their entries.
+
+    Returns:
+        Tuple with the names of the files and the names of the directories
+    """
+    if not ENABLE_SCAN_LISTING_CACHE:
+        return _scan_directory(path)
+
+    # Stat before listing, so changes made while listing invalidate the cached listing
+    path_stat = path_stat or os.stat(path)
+    cache_key = f"{LISTING_CACHE_KEY_PREFIX}:{path}"
+
+    cached_listing = sync_cache.get(cache_key)
+    if cached_listing:
+        listing = json.loads(cached_listing)
+        if listing["mtime"] == path_stat.st_mtime_ns:
+            return listing["files"], listing["directories"]
+
+    files, directories = _scan_directory(path)
+    if time.time_ns() - path_stat.st_mtime_ns > LISTING_CACHE_MIN_AGE_NS:
+        sync_cache.set(
+            cache_key,
+            json.dumps(
+                {
+                    "mtime": path_stat.st_mtime_ns,
+                    "files": files,
+                    "directories": directories,
+                }
+            ),
+            ex=LISTING_CACHE_TTL,
+        )
+
+    return files, directories
+
+
+def walk(
+    path: str, recursive: bool = False, path_stat: os.stat_result | None = None
+) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk a directory top-down, like os.walk without following symlinks.
+
+    Yields tuples with the path of each directory, its directory names and its file names.
+    """
+    try:
+        files, directories = list_directory(path, path_stat)
+    except OSError:
+        return
+
+    yield path, directories, files
+    if not recursive:
+        return
+
+    for directory in directories:
+        directory_path = os.path.join(path, directory)
+        try:
+            directory_stat = os.lstat(directory_path)
+        except OSError:
+            continue
+
+        if stat.S_ISDIR(directory_stat.st_mode):
+            yield from walk(directory_path, recursive, directory_stat)
 
 
 def iter_files(path: str, recursive: bool = False) -> Iterator[tuple[Path, str]]:
@@ -10,11 +105,9 @@ def iter_files(path: str, recursive: bool = False) -> Iterator[tuple[Path, str]]
     Yields tuples where the first element is the path to the directory where the file is located,
     and the second element is the name of the file.
     """
-    for root, _, files in os.walk(path, topdown=True):
+    for root, _, files in walk(path, recursive):
         for file in files:
             yield Path(root), file
-        if not recursive:
-            break
 
 
 def iter_directories(path: str, recursive: bool = False) -> Iterator[tuple[Path, str]]:
@@ -23,11 +116,9 @@ def iter_directories(path: str, recursive: bool = False) -> Iterator[tuple[Path,
     Yields tuples where the first element is the path to the directory where the directory is located,
     and the second element is the name of the directory.
     """
-    for root, dirs, _ in os.walk(path, topdown=True):
+    for root, dirs, _ in walk(path, recursive):
         for directory in dirs:
             yield Path(root), directory
-        if not recursive:
-            break
 
 
 INVALID_CHARS_HYPHENS = re.compile(r"[\\/:|]")
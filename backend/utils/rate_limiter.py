@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Final
+
+from handler.redis_handler import async_cache
+from logger.logger import log
+
+RATE_LIMIT_KEY_PREFIX: Final = "romm:rate_limit"
+DEFAULT_RETRY_AFTER: Final = 2.0
+MAX_RETRY_AFTER: Final = 60.0
+# Requests slower than this factor of the average latency reduce the concurrency
+LATENCY_TOLERANCE: Final = 2.0
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Parse the Retry-After header of a response, in seconds"""
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderRateLimiter:
+    """Limit the requests made to a metadata provider API.
+
+    The request rate is shared by all the workers through Redis, so concurrent scans
+    and endpoints stay below the provider's limit together. The number of concurrent
+    requests adapts in each process: it grows while the provider answers quickly, and
+    shrinks when it slows down or throttles the requests.
+    """
+
+    def __init__(
+        self, provider: str, requests_per_second: int, max_concurrency: int
+    ) -> None:
+        self.provider = provider
+        self.requests_per_second = requests_per_second
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+
+        self._throttled_key = f"{RATE_LIMIT_KEY_PREFIX}:{provider}:throttled_until"
+        self._latency: float | None = None
+        self._successes = 0
+        self._active = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._condition: asyncio.Condition | None = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Jobs run in their own event loop, which asyncio primitives are bound to
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._active = 0
+        return self._condition
+
+    async def _wait_for_rate_limit(self) -> None:
+        while True:
+            now = time.time()
+            throttled_until = await async_cache.get(self._throttled_key)
+            if throttled_until and float(throttled_until) > now:
+                await asyncio.sleep(float(throttled_until) - now)
+                continue
+
+            window = int(now)
+            window_key = f"{RATE_LIMIT_KEY_PREFIX}:{self.provider}:{window}"
+            async with async_cache.pipeline() as pipe:
+                await pipe.incr(window_key)
+                await pipe.expire(window_key, 2)
+                requests, _ = await pipe.execute()
+
+            if requests <= self.requests_per_second:
+                return
+            await asyncio.sleep(window + 1 - now)
+
+    def _record_latency(self, latency: float) -> None:
+        if self._latency is None:
+            self._latency = latency
+
+        if latency > self._latency * LATENCY_TOLERANCE and self.concurrency > 1:
+            self.concurrency -= 1
+            self._successes = 0
+        else:
+            self._successes += 1
+            if (
+                self._successes >= self.concurrency
+                and self.concurrency < self.max_concurrency
+            ):
+                self.concurrency += 1
+                self._successes = 0
+
+        self._latency = 0.8 * self._latency + 0.2 * latency
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Wait until a request can be made to the provider"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._active < self.concurrency)
+            self._active += 1
+
+        try:
+            await self._wait_for_rate_limit()
+            start = time.monotonic()
+            yield
+            self._record_latency(time.monotonic() - start)
+        finally:
+            async with condition:
+                self._active -= 1
+                condition.notify_all()
+
+    async def throttle(self, retry_after: float | None = None) -> None:
+        """Pause the requests to the provider after it throttled one (HTTP 429)
+
+        Args:
+            retry_after (float, optional): Seconds to wait, as sent by the provider
+        """
+        delay = min(retry_after or DEFAULT_RETRY_AFTER, MAX_RETRY_AFTER)
+        log.warning(
+            f"Rate limit hit on {self.provider}, pausing requests for {delay:.1f}s"
+        )
+
+        await async_cache.set(
+            self._throttled_key, time.time() + delay, px=max(1, int(delay * 1000))
+        )
+        self.concurrency = max(1, self.concurrency // 2)
+        self._successes = 0
@@ -1,6 +1,7 @@
 import enum
 import json
 import os
+from collections import defaultdict
 from collections.abc import Sequence
 from datetime import timedelta
 from typing import cast
@@ -15,8 +16,15 @@ from config import (
     SENTRY_DSN,
 )
 from config.config_manager import config_manager as cm
-from endpoints.sockets.scan import scan_platforms
+from endpoints.sockets.scan import (
+    SCAN_FS_CHANGES_FUNC_NAME,
+    SCAN_PLATFORMS_FUNC_NAME,
+    add_fs_changes,
+    scan_fs_changes,
+    scan_platforms,
+)
 from handler.database import db_platform_handler
+from handler.filesystem import fs_rom_handler
 from handler.metadata.igdb_handler import IGDB_API_ENABLED
 from handler.metadata.moby_handler import MOBY_API_ENABLED
 from handler.metadata.ra_handler import RA_API_ENABLED
@@ -69,8 +77,9 @@ def process_changes(changes: Sequence[Change]) -> None:
         return
 
     with tracer.start_as_current_span("process_changes"):
-        # Find affected platform slugs.
+        # Find affected platform slugs, and the roms changed in their roms folder.
         fs_slugs: set[str] = set()
+        fs_rom_names: dict[str, set[str]] = defaultdict(set)
         changes_platform_directory = False
         for change in changes:
             event_type, change_path = change
@@ -83,13 +92,27 @@ def process_changes(changes: Sequence[Change]) -> None:
                 )
                 continue
 
+            log.info(f"Filesystem event: {event_type} {event_src}")
+
             if len(event_src_parts) == structure_level + 1:
                 changes_platform_directory = True
+                continue
 
-            log.info(f"Filesystem event: {event_type} {event_src}")
-            fs_slugs.add(event_src_parts[structure_level])
-
-        if not fs_slugs:
+            fs_slug = event_src_parts[structure_level]
+
+            # Roms are the files and folders right under the platform roms folder,
+            # other changes in the platform folder rescan the whole platform.
+            roms_folder_parts = fs_rom_handler.get_roms_fs_structure(fs_slug).split("/")
+            rom_name_index = len(roms_folder_parts) + 1
+            if (
+                len(event_src_parts) > rom_name_index
+                and event_src_parts[1:rom_name_index] == roms_folder_parts
+            ):
+                fs_rom_names[fs_slug].add(event_src_parts[rom_name_index])
+            else:
+                fs_slugs.add(fs_slug)
+
+        if not fs_slugs and not fs_rom_names and not changes_platform_directory:
             log.info("No valid filesystem slugs found in changes, exiting...")
             return
 
@@ -108,54 +131,85 @@ def process_changes(changes: Sequence[Change]) -> None:
             log.warning("No metadata sources enabled, skipping rescan")
             return
 
-        # Get currently scheduled jobs for the scan_platforms function.
+        # Get currently scheduled jobs for the scan functions.
+        scheduled_jobs = [
+            job for job in tasks_scheduler.get_jobs() if isinstance(job, Job)
+        ]
         already_scheduled_jobs = [
-            job
-            for job in tasks_scheduler.get_jobs()
-            if isinstance(job, Job)
-            and job.func_name == "endpoints.sockets.scan.scan_platforms"
+            job for job in scheduled_jobs if job.func_name == SCAN_PLATFORMS_FUNC_NAME
+        ]
+        already_scheduled_fs_changes_jobs = [
+            job for job in scheduled_jobs if job.func_name == SCAN_FS_CHANGES_FUNC_NAME
         ]
 
         # If a full rescan is already scheduled, skip further processing.
-        if any(job.args[0] == [] for job in already_scheduled_jobs):
+        if any(
+            job.args[0] == [] and job.kwargs.get("scan_type") != ScanType.NEW_PLATFORMS
+            for job in already_scheduled_jobs
+        ):
             log.info("Full rescan already scheduled")
             return
 
         time_delta = timedelta(minutes=RESCAN_ON_FILESYSTEM_CHANGE_DELAY)
         rescan_in_msg = f"rescanning in {hl(str(RESCAN_ON_FILESYSTEM_CHANGE_DELAY), color=CYAN)} minutes."
 
-        # Any change to a platform directory should trigger a full rescan.
-        if changes_platform_directory:
+        # Platform directories added or removed only need the platforms to be scanned,
+        # the roms of a new platform are then scanned with it.
+        if changes_platform_directory and any(
+            job.args[0] == [] for job in already_scheduled_jobs
+        ):
+            log.info("Platforms scan already scheduled")
+        elif changes_platform_directory:
             log.info(f"Platform directory changed, {rescan_in_msg}")
             tasks_scheduler.enqueue_in(
                 time_delta,
                 scan_platforms,
                 [],
-                scan_type=ScanType.UNIDENTIFIED,
+                scan_type=ScanType.NEW_PLATFORMS,
                 metadata_sources=metadata_sources,
             )
-            return
-
-        # Otherwise, process each platform slug.
-        for fs_slug in fs_slugs:
-            # TODO: Query platforms from the database in bulk.
-            db_platform = db_platform_handler.get_platform_by_fs_slug(fs_slug)
-            if not db_platform:
-                continue
-
-            # Skip if a scan is already scheduled for this platform.
-            if any(db_platform.id in job.args[0] for job in already_scheduled_jobs):
-                log.info(f"Scan already scheduled for {hl(fs_slug)}")
-                continue
 
-            log.info(f"Change detected in {hl(fs_slug)} folder, {rescan_in_msg}")
-            tasks_scheduler.enqueue_in(
-                time_delta,
-                scan_platforms,
-                [db_platform.id],
-                scan_type=ScanType.QUICK,
-                metadata_sources=metadata_sources,
-            )
+        db_platforms = db_platform_handler.get_platforms_by_fs_slugs(
+            fs_slugs | fs_rom_names.keys()
+        )
+        for db_platform in db_platforms:
+            fs_slug = db_platform.fs_slug
+
+            if fs_slug in fs_slugs:
+                # Skip if a scan is already scheduled for this platform.
+                if any(db_platform.id in job.args[0] for job in already_scheduled_jobs):
+                    log.info(f"Scan already scheduled for {hl(fs_slug)}")
+                else:
+                    log.info(
+                        f"Change detected in {hl(fs_slug)} folder, {rescan_in_msg}"
+                    )
+                    tasks_scheduler.enqueue_in(
+                        time_delta,
+                        scan_platforms,
+                        [db_platform.id],
+                        scan_type=ScanType.QUICK,
+                        metadata_sources=metadata_sources,
+                    )
+
+            if fs_slug in fs_rom_names:
+                # Changed roms are merged into the scan already scheduled for this platform.
+                add_fs_changes(db_platform.id, fs_rom_names[fs_slug])
+                if any(
+                    job.args[0] == db_platform.id
+                    for job in already_scheduled_fs_changes_jobs
+                ):
+                    log.info(f"Roms added to the scan scheduled for {hl(fs_slug)}")
+                    continue
+
+                log.info(
+                    f"{hl(str(len(fs_rom_names[fs_slug])))} roms changed in {hl(fs_slug)}, {rescan_in_msg}"
+                )
+                tasks_scheduler.enqueue_in(
+                    time_delta,
+                    scan_fs_changes,
+                    db_platform.id,
+                    metadata_sources,
+                )
 
 
 if __name__ == "__main__":